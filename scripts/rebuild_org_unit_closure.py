@@ -0,0 +1,11 @@
+from eo_lib import OrganizationalUnitController
+
+
+def main():
+    """Rebuilds the organizational unit closure table from parent links."""
+    pairs = OrganizationalUnitController().rebuild_closure()
+    print(f"Organizational unit closure rebuilt: {pairs} pairs")
+
+
+if __name__ == "__main__":
+    main()
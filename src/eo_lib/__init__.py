@@ -4,6 +4,11 @@ from .controllers import (
     InitiativeController,
     OrganizationController,
     OrganizationalUnitController,
+    AsyncPersonController,
+    AsyncTeamController,
+    AsyncInitiativeController,
+    AsyncOrganizationController,
+    AsyncOrganizationalUnitController,
 )
 from .domain import (
     Person,
@@ -14,6 +19,7 @@ from .domain import (
     Organization,
     OrganizationalUnit,
 )
+from .transactions import unit_of_work
 
 __all__ = [
     "PersonController",
@@ -21,6 +27,11 @@ __all__ = [
     "InitiativeController",
     "OrganizationController",
     "OrganizationalUnitController",
+    "AsyncPersonController",
+    "AsyncTeamController",
+    "AsyncInitiativeController",
+    "AsyncOrganizationController",
+    "AsyncOrganizationalUnitController",
     "Person",
     "Team",
     "TeamMember",
@@ -28,4 +39,5 @@ __all__ = [
     "InitiativeType",
     "Organization",
     "OrganizationalUnit",
+    "unit_of_work",
 ]
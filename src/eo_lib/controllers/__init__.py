@@ -3,6 +3,13 @@ from .team_controller import TeamController
 from .initiative_controller import InitiativeController
 from .organization_controller import OrganizationController
 from .organizational_unit_controller import OrganizationalUnitController
+from .async_controllers import (
+    AsyncPersonController,
+    AsyncTeamController,
+    AsyncInitiativeController,
+    AsyncOrganizationController,
+    AsyncOrganizationalUnitController,
+)
 
 __all__ = [
     "PersonController",
@@ -10,4 +17,9 @@ __all__ = [
     "InitiativeController",
     "OrganizationController",
     "OrganizationalUnitController",
+    "AsyncPersonController",
+    "AsyncTeamController",
+    "AsyncInitiativeController",
+    "AsyncOrganizationController",
+    "AsyncOrganizationalUnitController",
 ]
@@ -0,0 +1,392 @@
+from datetime import date, datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+from eo_lib.domain.entities import (
+    Initiative,
+    Organization,
+    OrganizationalUnit,
+    Person,
+    Team,
+    TeamMember,
+)
+from eo_lib.domain.hierarchy import HierarchyNode
+from eo_lib.domain.query import UNSET, OrderBy, Where
+from eo_lib.domain.upsert import UpsertResult
+from eo_lib.factories import ServiceFactory
+from eo_lib.controllers.initiative_controller import InitiativeDtoMixin
+
+T = TypeVar("T")
+
+
+class AsyncGenericController(Generic[T]):
+    """
+    Asyncio counterpart of GenericController plus the listing operations.
+    """
+
+    def __init__(self, service: Any):
+        self._service = service
+
+    async def create(self, entity: T) -> T:
+        """Persists a new entity."""
+        return await self._service.create(entity)
+
+    async def get_by_id(
+        self, id: int, load_profile: Optional[str] = None
+    ) -> Optional[T]:
+        """Gets an entity by ID, optionally with a named load profile."""
+        return await self._service.get_by_id(id, load_profile)
+
+    async def get_all(self, load_profile: Optional[str] = None) -> List[T]:
+        """Gets all entities, optionally with a named load profile."""
+        return await self._service.get_all(load_profile)
+
+    async def update(self, entity: T) -> T:
+        """Persists changes to an existing entity."""
+        return await self._service.update(entity)
+
+    async def delete(self, id: int) -> bool:
+        """Deletes an entity by ID."""
+        return await self._service.delete(id)
+
+    async def list_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        order_by: str = "id",
+        load_profile: Optional[str] = None,
+        after_value: Any = UNSET,
+    ) -> List[T]:
+        """Lists one page of entities, starting after ``after_id``."""
+        return await self._service.list_page(
+            after_id, limit, order_by, load_profile, after_value
+        )
+
+    async def find(
+        self,
+        where: Optional[Where] = None,
+        order_by: OrderBy = "id",
+        limit: Optional[int] = None,
+        offset: int = 0,
+        load_profile: Optional[str] = None,
+    ) -> List[T]:
+        """Lists the entities matching ``where``, sorted and sliced."""
+        return await self._service.find(where, order_by, limit, offset, load_profile)
+
+    def iter_all(
+        self, batch_size: int = 1000, load_profile: Optional[str] = None
+    ) -> AsyncIterator[T]:
+        """Streams every entity (``async for``) instead of building a list."""
+        return self._service.iter_all(batch_size, load_profile)
+
+    async def project(
+        self,
+        fields: Sequence[str],
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Lists only the given fields of each entity as plain dicts."""
+        return await self._service.project(fields, after_id, limit)
+
+
+class AsyncPersonController(AsyncGenericController[Person]):
+    """
+    Asyncio controller for Person-related operations.
+    """
+
+    def __init__(self):
+        super().__init__(ServiceFactory.create_async_person_service())
+
+    async def create_person(
+        self,
+        name: str,
+        emails: List[str] = None,
+        identification_id: str = None,
+        birthday: date = None,
+    ) -> Person:
+        """Creates a new person record."""
+        return await self._service.create_with_details(
+            name, emails, identification_id, birthday
+        )
+
+    async def create_persons(
+        self, persons: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> List[int]:
+        """Creates many person records in batches and returns the new IDs."""
+        return await self._service.create_many(persons, chunk_size)
+
+    async def upsert_persons(
+        self, persons: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """Creates or updates person records by identification_id in batches."""
+        return await self._service.upsert_many(persons, chunk_size)
+
+    async def update_person(
+        self,
+        id: int,
+        name: str = None,
+        emails: List[str] = None,
+        identification_id: str = None,
+        birthday: date = None,
+    ) -> Person:
+        """Updates an existing person's details."""
+        return await self._service.update_details(
+            id, name, emails, identification_id, birthday
+        )
+
+    async def get_by_email(self, email: str) -> Optional[Person]:
+        """Finds the person owning an email address, ignoring case."""
+        return await self._service.get_by_email(email)
+
+    async def get_by_emails(self, emails: Iterable[str]) -> Dict[str, Person]:
+        """Resolves many email addresses at once, keyed by lower-cased address."""
+        return await self._service.get_by_emails(emails)
+
+    async def update_person_emails(self, emails: Mapping[int, Iterable[str]]) -> int:
+        """Replaces the emails of many persons at once, keyed by person ID."""
+        return await self._service.update_emails_many(emails)
+
+
+class AsyncTeamController(AsyncGenericController[Team]):
+    """
+    Asyncio controller for Team-related operations.
+    """
+
+    def __init__(self):
+        super().__init__(ServiceFactory.create_async_team_service())
+
+    async def create_team(self, name: str, description: str) -> Team:
+        """Creates a new team."""
+        return await self._service.create_team(name, description)
+
+    async def update_team(
+        self, id: int, name: str = None, description: str = None
+    ) -> Team:
+        """Updates team metadata."""
+        return await self._service.update_team_details(id, name, description)
+
+    async def upsert_teams(
+        self, teams: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """Creates or updates teams by name in batches and returns the counts."""
+        return await self._service.upsert_many(teams, chunk_size)
+
+    async def add_member(
+        self,
+        team_id: int,
+        person_id: int,
+        role: str,
+        start_date: date = None,
+        end_date: date = None,
+    ) -> TeamMember:
+        """Enrolls a person into a team with a specific role."""
+        return await self._service.add_member(
+            team_id, person_id, role=role, start_date=start_date, end_date=end_date
+        )
+
+    async def remove_member(self, member_id: int) -> None:
+        """Removes a person's membership from a team."""
+        await self._service.remove_member(member_id)
+
+    async def get_members(self, team_id: int) -> List[TeamMember]:
+        """Lists all members enrolled in a specific team."""
+        return await self._service.get_members(team_id)
+
+    async def add_members(self, team_id: int, members: Iterable[Sequence]) -> List[int]:
+        """Enrolls many people at once from (person_id, role, start, end) tuples."""
+        return await self._service.add_members(team_id, members)
+
+    async def remove_members(self, member_ids: Iterable[int]) -> int:
+        """Removes many memberships at once; returns how many were removed."""
+        return await self._service.remove_members(member_ids)
+
+    async def move_members(
+        self, from_team_id: int, to_team_id: int, person_ids: Iterable[int]
+    ) -> int:
+        """Moves people between teams at once; returns how many were moved."""
+        return await self._service.move_members(from_team_id, to_team_id, person_ids)
+
+
+class AsyncInitiativeController(InitiativeDtoMixin, AsyncGenericController[Initiative]):
+    """
+    Asyncio controller for Initiative-related operations.
+
+    Returns the same DTOs as InitiativeController.
+    """
+
+    def __init__(self):
+        super().__init__(ServiceFactory.create_async_initiative_service())
+
+    async def create_initiative(
+        self,
+        name: str,
+        description: str = None,
+        start_date: datetime = None,
+        end_date: datetime = None,
+        initiative_type_name: str = None,
+    ) -> Dict[str, Any]:
+        """Creates a new initiative."""
+        initiative = await self._service.create_initiative_with_details(
+            name, description, start_date, end_date, initiative_type_name
+        )
+        return self._to_dto(initiative)
+
+    async def create_initiative_type(
+        self, name: str, description: str = None
+    ) -> Dict[str, Any]:
+        """Creates a new initiative type."""
+        itype = await self._service.create_initiative_type(name, description)
+        return {"id": itype.id, "name": itype.name, "description": itype.description}
+
+    async def list_initiatives(
+        self, after_id: int = None, limit: int = None
+    ) -> List[Dict[str, Any]]:
+        """Lists all initiatives, or one keyset page of them when limit is given."""
+        rows = await self._service.list_summaries(after_id, limit)
+        return [self._row_to_dto(row) for row in rows]
+
+    async def list_initiative_types(self) -> List[Dict[str, Any]]:
+        """Lists all initiative types."""
+        types = await self._service.list_initiative_types()
+        return [
+            {"id": t.id, "name": t.name, "description": t.description} for t in types
+        ]
+
+    async def update_initiative(
+        self,
+        initiative_id: int,
+        name: str = None,
+        description: str = None,
+        status: str = None,
+        start_date: datetime = None,
+        end_date: datetime = None,
+        initiative_type_name: str = None,
+    ) -> Dict[str, Any]:
+        """Updates an existing initiative."""
+        initiative = await self._service.update_initiative_details(
+            initiative_id,
+            name,
+            description,
+            status,
+            start_date,
+            end_date,
+            initiative_type_name,
+        )
+        return self._to_dto(initiative)
+
+    async def assign_team(self, initiative_id: int, team_id: int) -> None:
+        """Assigns a team to an initiative."""
+        await self._service.assign_team(initiative_id, team_id)
+
+    async def get_teams(self, initiative_id: int) -> List[Dict[str, Any]]:
+        """Lists teams assigned to an initiative."""
+        teams = await self._service.get_teams(initiative_id)
+        return [{"id": t.id, "name": t.name} for t in teams]
+
+    async def get_rollup(self, initiative_id: int) -> Dict[str, Any]:
+        """Totals an initiative's subtree: descendants per status, teams, persons."""
+        return self._rollup_to_dto(await self._service.get_rollup(initiative_id))
+
+    async def get_rollups(self, initiative_ids: Sequence[int]) -> List[Dict[str, Any]]:
+        """Totals several initiatives' subtrees at once, in the given order."""
+        rollups = await self._service.get_rollups(initiative_ids)
+        return [self._rollup_to_dto(rollups[i]) for i in initiative_ids if i in rollups]
+
+
+class AsyncOrganizationController(AsyncGenericController[Organization]):
+    """
+    Asyncio controller for Organization-related operations.
+    """
+
+    def __init__(self):
+        super().__init__(ServiceFactory.create_async_organization_service())
+
+    async def create_organization(
+        self, name: str, description: str = None, short_name: str = None
+    ) -> Organization:
+        """Creates a new organization."""
+        return await self._service.create_organization(name, description, short_name)
+
+    async def update_organization(
+        self, id: int, name: str = None, description: str = None, short_name: str = None
+    ) -> Organization:
+        """Updates organization metadata."""
+        return await self._service.update_organization_details(
+            id, name, description, short_name
+        )
+
+    async def upsert_organizations(
+        self, organizations: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """Creates or updates organizations by name in batches."""
+        return await self._service.upsert_many(organizations, chunk_size)
+
+
+class AsyncOrganizationalUnitController(AsyncGenericController[OrganizationalUnit]):
+    """
+    Asyncio controller for Organizational Unit-related operations.
+    """
+
+    def __init__(self):
+        super().__init__(ServiceFactory.create_async_organizational_unit_service())
+
+    async def create_unit(
+        self,
+        name: str,
+        organization_id: int,
+        description: str = None,
+        short_name: str = None,
+        parent_id: int = None,
+    ) -> OrganizationalUnit:
+        """Creates a new organizational unit."""
+        return await self._service.create_unit(
+            name, organization_id, description, short_name, parent_id
+        )
+
+    async def update_unit(
+        self,
+        id: int,
+        name: str = None,
+        description: str = None,
+        short_name: str = None,
+        parent_id: int = None,
+    ) -> OrganizationalUnit:
+        """Updates unit metadata."""
+        return await self._service.update_unit_details(
+            id, name, description, short_name, parent_id
+        )
+
+    async def get_subtree(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """Lists a unit and every unit below it, with depth and path."""
+        return await self._service.get_subtree(unit_id, max_depth)
+
+    async def get_descendants(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """Lists every unit below a unit, with depth and path."""
+        return await self._service.get_descendants(unit_id, max_depth)
+
+    async def get_ancestors(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """Lists a unit's parents, nearest first, with depth and path."""
+        return await self._service.get_ancestors(unit_id, max_depth)
+
+    async def is_within(self, unit_id: int, ancestor_id: int) -> bool:
+        """Checks whether a unit is ``ancestor_id`` itself or below it."""
+        return await self._service.is_within(unit_id, ancestor_id)
+
+    async def rebuild_closure(self) -> int:
+        """Rebuilds the closure table and returns the number of pairs."""
+        return await self._service.rebuild_closure()
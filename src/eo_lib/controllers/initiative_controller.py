@@ -1,11 +1,62 @@
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 from eo_lib.domain.entities.initiative import Initiative
+from eo_lib.domain.hierarchy import InitiativeRollup
 from eo_lib.factories import ServiceFactory
 from libbase.controllers.generic_controller import GenericController
+from eo_lib.controllers.listing import ListingControllerMixin
 
 
-class InitiativeController(GenericController[Initiative]):
+class InitiativeDtoMixin:
+    """
+    Builds the initiative DTOs shared by the sync and asyncio controllers.
+    """
+
+    def _to_dto(self, initiative: Initiative) -> Dict[str, Any]:
+        return self._row_to_dto(
+            {
+                "id": initiative.id,
+                "name": initiative.name,
+                "status": initiative.status,
+                "description": initiative.description,
+                "start_date": initiative.start_date,
+                "end_date": initiative.end_date,
+                "initiative_type.name": (
+                    initiative.initiative_type.name
+                    if initiative.initiative_type
+                    else None
+                ),
+            }
+        )
+
+    def _row_to_dto(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": row["id"],
+            "name": row["name"],
+            "status": row["status"],
+            "description": row["description"],
+            "start_date": (
+                row["start_date"].isoformat() if row["start_date"] else None
+            ),
+            "end_date": row["end_date"].isoformat() if row["end_date"] else None,
+            "initiative_type": row["initiative_type.name"],
+        }
+
+    def _rollup_to_dto(self, rollup: InitiativeRollup) -> Dict[str, Any]:
+        return {
+            "id": rollup.initiative_id,
+            "descendants": rollup.descendants,
+            "by_status": rollup.by_status,
+            "team_ids": rollup.team_ids,
+            "person_ids": rollup.person_ids,
+        }
+
+
+class InitiativeController(
+    InitiativeDtoMixin,
+    ListingControllerMixin[Initiative],
+    GenericController[Initiative],
+):
     """
     Controller for Initiative-related operations.
     Acts as a Facade to the InitiativeService.
@@ -41,13 +92,17 @@ class InitiativeController(GenericController[Initiative]):
         itype = self._service.create_initiative_type(name, description)
         return {"id": itype.id, "name": itype.name, "description": itype.description}
 
-    def list_initiatives(self) -> List[Dict[str, Any]]:
+    def list_initiatives(
+        self, after_id: int = None, limit: int = None
+    ) -> List[Dict[str, Any]]:
         """
-        Lists all initiatives.
+        Lists all initiatives, or one keyset page of them when limit is given.
+
+        Built from a single projection query instead of loading each
+        initiative and its type.
         """
-        # Using generic get_all() from parent
-        initiatives = self.get_all() 
-        return [self._to_dto(p) for p in initiatives]
+        rows = self._service.list_summaries(after_id, limit)
+        return [self._row_to_dto(row) for row in rows]
 
     def list_initiative_types(self) -> List[Dict[str, Any]]:
         """
@@ -95,19 +150,15 @@ class InitiativeController(GenericController[Initiative]):
         teams = self._service.get_teams(initiative_id)
         return [{"id": t.id, "name": t.name} for t in teams]
 
-    def _to_dto(self, initiative: Initiative) -> Dict[str, Any]:
-        return {
-            "id": initiative.id,
-            "name": initiative.name,
-            "status": initiative.status,
-            "description": initiative.description,
-            "start_date": (
-                initiative.start_date.isoformat() if initiative.start_date else None
-            ),
-            "end_date": (
-                initiative.end_date.isoformat() if initiative.end_date else None
-            ),
-            "initiative_type": (
-                initiative.initiative_type.name if initiative.initiative_type else None
-            ),
-        }
+    def get_rollup(self, initiative_id: int) -> Dict[str, Any]:
+        """
+        Totals an initiative's subtree: descendants per status, teams, persons.
+        """
+        return self._rollup_to_dto(self._service.get_rollup(initiative_id))
+
+    def get_rollups(self, initiative_ids: Sequence[int]) -> List[Dict[str, Any]]:
+        """
+        Totals several initiatives' subtrees at once, in the given order.
+        """
+        rollups = self._service.get_rollups(initiative_ids)
+        return [self._rollup_to_dto(rollups[i]) for i in initiative_ids if i in rollups]
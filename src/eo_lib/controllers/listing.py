@@ -0,0 +1,79 @@
+from typing import Any, Dict, Generic, Iterator, List, Optional, Sequence, TypeVar
+from eo_lib.domain.query import UNSET, OrderBy, Where
+
+T = TypeVar("T")
+
+
+class ListingControllerMixin(Generic[T]):
+    """
+    Exposes the scalable list operations of a service on a GenericController.
+    """
+
+    def get_by_id(self, id: int, load_profile: Optional[str] = None) -> Optional[T]:
+        """
+        Gets an entity by ID, optionally with a named load profile.
+        Wraps the service's get_by_id method.
+        """
+        if load_profile is None:
+            return super().get_by_id(id)
+        return self._service.get_by_id(id, load_profile=load_profile)
+
+    def get_all(self, load_profile: Optional[str] = None) -> List[T]:
+        """
+        Gets all entities, optionally with a named load profile.
+        Wraps the service's get_all method.
+        """
+        if load_profile is None:
+            return super().get_all()
+        return self._service.get_all(load_profile=load_profile)
+
+    def list_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        order_by: str = "id",
+        load_profile: Optional[str] = None,
+        after_value: Any = UNSET,
+    ) -> List[T]:
+        """
+        Lists one page of entities, starting after ``after_id``.
+        Wraps the service's list_page method.
+        """
+        return self._service.list_page(
+            after_id, limit, order_by, load_profile, after_value
+        )
+
+    def iter_all(
+        self, batch_size: int = 1000, load_profile: Optional[str] = None
+    ) -> Iterator[T]:
+        """
+        Streams every entity instead of building a full list.
+        Wraps the service's iter_all method.
+        """
+        return self._service.iter_all(batch_size, load_profile)
+
+    def project(
+        self,
+        fields: Sequence[str],
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Lists only the given fields of each entity as plain dicts.
+        Wraps the service's project method.
+        """
+        return self._service.project(fields, after_id, limit)
+
+    def find(
+        self,
+        where: Optional[Where] = None,
+        order_by: OrderBy = "id",
+        limit: Optional[int] = None,
+        offset: int = 0,
+        load_profile: Optional[str] = None,
+    ) -> List[T]:
+        """
+        Lists the entities matching ``where``, sorted and sliced.
+        Wraps the service's find method.
+        """
+        return self._service.find(where, order_by, limit, offset, load_profile)
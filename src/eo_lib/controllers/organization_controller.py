@@ -1,9 +1,14 @@
+from typing import Any, Dict, Iterable
 from eo_lib.factories import ServiceFactory
 from eo_lib.domain.entities import Organization
+from eo_lib.domain.upsert import UpsertResult
 from libbase.controllers.generic_controller import GenericController
+from eo_lib.controllers.listing import ListingControllerMixin
 
 
-class OrganizationController(GenericController[Organization]):
+class OrganizationController(
+    ListingControllerMixin[Organization], GenericController[Organization]
+):
     """
     Controller for Organization-related operations.
     Acts as a facade for the OrganizationService.
@@ -28,3 +33,11 @@ class OrganizationController(GenericController[Organization]):
         Updates organization metadata.
         """
         return self._service.update_organization_details(id, name, description, short_name)
+
+    def upsert_organizations(
+        self, organizations: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """
+        Creates or updates organizations by name in batches.
+        """
+        return self._service.upsert_many(organizations, chunk_size)
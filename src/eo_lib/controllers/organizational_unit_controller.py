@@ -1,9 +1,14 @@
+from typing import List, Optional
 from eo_lib.factories import ServiceFactory
 from eo_lib.domain.entities import OrganizationalUnit
+from eo_lib.domain.hierarchy import HierarchyNode
 from libbase.controllers.generic_controller import GenericController
+from eo_lib.controllers.listing import ListingControllerMixin
 
 
-class OrganizationalUnitController(GenericController[OrganizationalUnit]):
+class OrganizationalUnitController(
+    ListingControllerMixin[OrganizationalUnit], GenericController[OrganizationalUnit]
+):
     """
     Controller for Organizational Unit-related operations.
     Acts as a facade for the OrganizationalUnitService.
@@ -42,3 +47,39 @@ class OrganizationalUnitController(GenericController[OrganizationalUnit]):
         return self._service.update_unit_details(
             id, name, description, short_name, parent_id
         )
+
+    def get_subtree(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """
+        Lists a unit and every unit below it, with depth and path.
+        """
+        return self._service.get_subtree(unit_id, max_depth)
+
+    def get_descendants(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """
+        Lists every unit below a unit, with depth and path.
+        """
+        return self._service.get_descendants(unit_id, max_depth)
+
+    def get_ancestors(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """
+        Lists a unit's parents, nearest first, with depth and path.
+        """
+        return self._service.get_ancestors(unit_id, max_depth)
+
+    def is_within(self, unit_id: int, ancestor_id: int) -> bool:
+        """
+        Checks whether a unit is ``ancestor_id`` itself or below it.
+        """
+        return self._service.is_within(unit_id, ancestor_id)
+
+    def rebuild_closure(self) -> int:
+        """
+        Rebuilds the closure table and returns the number of pairs.
+        """
+        return self._service.rebuild_closure()
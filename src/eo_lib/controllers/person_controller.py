@@ -1,11 +1,13 @@
-from typing import List
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 from eo_lib.factories import ServiceFactory
 from eo_lib.domain.entities.person import Person
+from eo_lib.domain.upsert import UpsertResult
 from libbase.controllers.generic_controller import GenericController
+from eo_lib.controllers.listing import ListingControllerMixin
 from datetime import date
 
 
-class PersonController(GenericController[Person]):
+class PersonController(ListingControllerMixin[Person], GenericController[Person]):
     """
     Controller for Person-related operations.
     Inherits generic operations from GenericController.
@@ -31,6 +33,24 @@ class PersonController(GenericController[Person]):
         # We use the specific service method here which handles construction.
         return self._service.create_with_details(name, emails, identification_id, birthday)
 
+    def create_persons(
+        self, persons: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> List[int]:
+        """
+        Creates many person records in batches.
+        Wraps the service's create_many method and returns the new IDs.
+        """
+        return self._service.create_many(persons, chunk_size)
+
+    def upsert_persons(
+        self, persons: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """
+        Creates or updates person records by identification_id in batches.
+        Wraps the service's upsert_many method and returns the counts.
+        """
+        return self._service.upsert_many(persons, chunk_size)
+
     def update_person(
         self,
         id: int,
@@ -44,3 +64,23 @@ class PersonController(GenericController[Person]):
         Wraps the service's update_details method.
         """
         return self._service.update_details(id, name, emails, identification_id, birthday)
+
+    def get_by_email(self, email: str) -> Optional[Person]:
+        """
+        Finds the person owning an email address, ignoring case.
+        """
+        return self._service.get_by_email(email)
+
+    def get_by_emails(self, emails: Iterable[str]) -> Dict[str, Person]:
+        """
+        Resolves many email addresses at once, e.g. for SSO identity matching.
+        Returns the found persons keyed by lower-cased address.
+        """
+        return self._service.get_by_emails(emails)
+
+    def update_person_emails(self, emails: Mapping[int, Iterable[str]]) -> int:
+        """
+        Replaces the emails of many persons at once, keyed by person ID.
+        Returns how many persons had their emails changed.
+        """
+        return self._service.update_emails_many(emails)
@@ -1,11 +1,13 @@
-from typing import List
+from typing import Any, Dict, Iterable, List, Sequence
 from datetime import date as date_type
 from eo_lib.factories import ServiceFactory
 from eo_lib.domain.entities.team import Team, TeamMember
+from eo_lib.domain.upsert import UpsertResult
 from libbase.controllers.generic_controller import GenericController
+from eo_lib.controllers.listing import ListingControllerMixin
 
 
-class TeamController(GenericController[Team]):
+class TeamController(ListingControllerMixin[Team], GenericController[Team]):
     """
     Controller for Team-related operations.
     Acts as a facade for the TeamService.
@@ -25,6 +27,12 @@ class TeamController(GenericController[Team]):
     def update_team(self, id: int, name: str = None, description: str = None) -> Team:
         """Updates team metadata."""
         return self._service.update_team_details(id, name, description)
+
+    def upsert_teams(
+        self, teams: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """Creates or updates teams by name in batches and returns the counts."""
+        return self._service.upsert_many(teams, chunk_size)
     
     # GenericController provides get_by_id, get_all, delete via inheritance (mapped to _service)
     # But for backward compatibility with demo.py (until updated), we might keep aliases if needed.
@@ -54,3 +62,19 @@ class TeamController(GenericController[Team]):
     def get_members(self, team_id: int) -> List[TeamMember]:
         """Lists all members enrolled in a specific team."""
         return self._service.get_members(team_id)
+
+    def add_members(self, team_id: int, members: Iterable[Sequence]) -> List[int]:
+        """
+        Enrolls many people at once from (person_id, role, start, end) tuples.
+        """
+        return self._service.add_members(team_id, members)
+
+    def remove_members(self, member_ids: Iterable[int]) -> int:
+        """Removes many memberships at once; returns how many were removed."""
+        return self._service.remove_members(member_ids)
+
+    def move_members(
+        self, from_team_id: int, to_team_id: int, person_ids: Iterable[int]
+    ) -> int:
+        """Moves people between teams at once; returns how many were moved."""
+        return self._service.move_members(from_team_id, to_team_id, person_ids)
@@ -20,6 +20,9 @@ from .entities import (
     OrganizationalUnit,
     Role,
 )
+from .hierarchy import HierarchyNode, InitiativeRollup
+from .query import In, Range
+from .upsert import UpsertResult
 from .repositories import (
     PersonRepositoryInterface,
     TeamRepositoryInterface,
@@ -38,6 +41,11 @@ __all__ = [
     "Organization",
     "OrganizationalUnit",
     "Role",
+    "HierarchyNode",
+    "InitiativeRollup",
+    "In",
+    "Range",
+    "UpsertResult",
     "PersonRepositoryInterface",
     "TeamRepositoryInterface",
     "InitiativeRepository",
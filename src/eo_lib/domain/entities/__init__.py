@@ -2,7 +2,7 @@ from .person import Person, PersonEmail
 from .initiative import Initiative, InitiativeType
 from .team import Team, TeamMember
 from .organization import Organization
-from .organizational_unit import OrganizationalUnit
+from .organizational_unit import OrganizationalUnit, OrganizationalUnitClosure
 from .role import Role
 
 __all__ = [
@@ -14,5 +14,6 @@ __all__ = [
     "TeamMember",
     "Organization",
     "OrganizationalUnit",
+    "OrganizationalUnitClosure",
     "Role",
 ]
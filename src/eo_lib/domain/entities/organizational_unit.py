@@ -68,3 +68,42 @@ class OrganizationalUnit(Base):
         self.parent_id = parent_id
         if id:
             self.id = id
+
+
+class OrganizationalUnitClosure(Base):
+    """
+    Organizational Unit Closure Model.
+
+    One row per (ancestor, descendant) pair of the unit hierarchy, including
+    each unit paired with itself at depth 0, so "is A under B?" is a single
+    primary-key lookup. Maintained by the Organizational Unit repositories
+    when ``Config.ORG_UNIT_CLOSURE`` is enabled.
+
+    Attributes:
+        ancestor_id (int): The unit at the top of the pair.
+        descendant_id (int): The unit at the bottom of the pair.
+        depth (int): Number of edges between the two units.
+    """
+
+    __tablename__ = "organizational_unit_closure"
+
+    ancestor_id = Column(
+        Integer, ForeignKey("organizational_units.id"), primary_key=True
+    )
+    descendant_id = Column(
+        Integer, ForeignKey("organizational_units.id"), primary_key=True, index=True
+    )
+    depth = Column(Integer, nullable=False)
+
+    def __init__(self, ancestor_id: int, descendant_id: int, depth: int):
+        """
+        Initializes a new OrganizationalUnitClosure row.
+
+        Args:
+            ancestor_id (int): The ancestor unit ID.
+            descendant_id (int): The descendant unit ID.
+            depth (int): Distance between the units (0 for a unit and itself).
+        """
+        self.ancestor_id = ancestor_id
+        self.descendant_id = descendant_id
+        self.depth = depth
@@ -1,8 +1,8 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Date
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, Index, func
 from sqlalchemy.orm import relationship
 from eo_lib.domain.base import Base
 from eo_lib.domain.entities.initiative import initiative_persons
-from typing import Optional, List
+from typing import Iterable, Optional, List
 from datetime import date
 
 
@@ -78,6 +78,28 @@ class Person(Base):
         if id:
             self.id = id
 
+    def set_emails(self, addresses: Iterable[str]) -> bool:
+        """
+        Makes ``addresses`` the person's set of emails.
+
+        PersonEmail objects whose address is kept are reused, so the ORM only
+        deletes the removed addresses and inserts the added ones.
+
+        Args:
+            addresses (Iterable[str]): The wanted addresses; duplicates are fine.
+
+        Returns:
+            bool: True if the set of addresses changed.
+        """
+        wanted = list(dict.fromkeys(addresses))
+        current = {email.email: email for email in self.emails}
+        if set(wanted) == current.keys():
+            return False
+        self.emails = [
+            current.get(address) or PersonEmail(email=address) for address in wanted
+        ]
+        return True
+
 
 class PersonEmail(Base):
     """
@@ -101,6 +123,9 @@ class PersonEmail(Base):
 
     person = relationship("Person", back_populates="emails")
 
+    # Case-insensitive lookups (get_by_emails) match on lower(email).
+    __table_args__ = (Index("ix_person_emails_email_lower", func.lower(email)),)
+
     def __init__(
         self, email: str, person_id: Optional[int] = None, id: Optional[int] = None
     ):
@@ -117,3 +142,8 @@ class PersonEmail(Base):
             self.person_id = person_id
         if id:
             self.id = id
+
+    @staticmethod
+    def normalize(address: str) -> str:
+        """Returns the form addresses are compared in: trimmed and lower-cased."""
+        return address.strip().lower()
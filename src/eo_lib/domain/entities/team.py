@@ -85,6 +85,7 @@ class TeamMember(Base):
         person (relationship): Relationship to the participant Person.
         team (relationship): Relationship to the parent Team.
         role (relationship): Relationship to the defined Role.
+        role_name (str): Role name given at creation, until it is resolved.
     """
 
     __tablename__ = "team_members"
@@ -101,6 +102,9 @@ class TeamMember(Base):
     team = relationship("Team", back_populates="members")
     role = relationship("Role", back_populates="team_memberships", lazy="joined")
 
+    # Role name given to __init__, pending resolution to role_id.
+    role_name = None
+
     def __init__(
         self,
         person_id: int,
@@ -118,7 +122,8 @@ class TeamMember(Base):
             person_id (int): ID of the Person joining the team.
             team_id (int): ID of the Team being joined.
             role_id (int, optional): ID of the Role assigned to the person. Defaults to None.
-            role (Role or str, optional): Role object or Role name as string. Defaults to None.
+            role (Role or str, optional): Role object or Role name as string; a
+                name is resolved when the membership is stored. Defaults to None.
             start_date (date, optional): Date when membership begins. Defaults to None.
             end_date (date, optional): Date when membership ends. Defaults to None.
             id (int, optional): Database ID for existing records. Defaults to None.
@@ -128,9 +133,9 @@ class TeamMember(Base):
         self.role_id = role_id
         if role:
             if isinstance(role, str):
-                from eo_lib.domain.entities.role import Role
-
-                self.role = Role(name=role)
+                # Resolved to role_id by the repository's role registry, so
+                # an existing role is never inserted again.
+                self.role_name = role
             else:
                 self.role = role
         self.start_date = start_date
@@ -0,0 +1,35 @@
+from typing import Any, Dict, List, NamedTuple
+
+
+class HierarchyNode(NamedTuple):
+    """
+    One entity reached while traversing a parent/child hierarchy.
+
+    Attributes:
+        entity: The entity at this node (e.g. an OrganizationalUnit).
+        depth (int): Number of edges from the queried entity (0 for itself).
+        path (List[int]): IDs from the queried entity to this one, inclusive.
+    """
+
+    entity: Any
+    depth: int
+    path: List[int]
+
+
+class InitiativeRollup(NamedTuple):
+    """
+    Totals for an initiative and everything below it.
+
+    Attributes:
+        initiative_id (int): The initiative at the top of the rollup.
+        descendants (int): Number of initiatives below it, at any depth.
+        by_status (Dict[str, int]): Those descendants counted per status.
+        team_ids (List[int]): Teams assigned to it or to any descendant.
+        person_ids (List[int]): Persons assigned to it or to any descendant.
+    """
+
+    initiative_id: int
+    descendants: int
+    by_status: Dict[str, int]
+    team_ids: List[int]
+    person_ids: List[int]
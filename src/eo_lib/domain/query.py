@@ -0,0 +1,50 @@
+from typing import Any, Iterable, Mapping, NamedTuple, Sequence, Union
+
+# Conditions of a repository ``find``: column name to condition. A plain value
+# matches by equality (None matches NULL); In and Range are described below.
+Where = Mapping[str, Any]
+
+# Sort columns of a ``find``, most significant first; a "-" prefix sorts a
+# column descending. NULLs sort last either way and ``id`` breaks ties.
+OrderBy = Union[str, Sequence[str]]
+
+
+class In(NamedTuple):
+    """
+    Condition matching a column equal to any of ``values``.
+
+    Attributes:
+        values (Iterable): The accepted values; empty matches nothing.
+    """
+
+    values: Iterable[Any]
+
+
+class Range(NamedTuple):
+    """
+    Condition matching a column within bounds; NULL never matches.
+
+    Unset bounds are open, e.g. ``Range(ge=start, lt=end)`` is a half-open
+    interval.
+
+    Attributes:
+        ge: Inclusive lower bound.
+        gt: Exclusive lower bound.
+        le: Inclusive upper bound.
+        lt: Exclusive upper bound.
+    """
+
+    ge: Any = None
+    gt: Any = None
+    le: Any = None
+    lt: Any = None
+
+
+class _Unset:
+    def __repr__(self) -> str:
+        return "UNSET"
+
+
+# Default of arguments for which None is a meaningful value, such as the
+# ``after_value`` of list_page (None is the NULL sort value of a row).
+UNSET: Any = _Unset()
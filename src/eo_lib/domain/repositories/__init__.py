@@ -5,7 +5,10 @@ Defines the contracts for data access across different storage strategies.
 """
 
 from libbase.infrastructure.interface import IRepository as GenericRepositoryInterface
-from .team_repository import TeamRepositoryInterface
+from .listing_repository import ListingRepositoryInterface
+from .async_repository import AsyncRepositoryInterface
+from .upsert_repository import UpsertRepositoryInterface
+from .team_repository import Membership, TeamRepositoryInterface
 from .person_repository import PersonRepositoryInterface
 from .initiative_repository import InitiativeRepository
 from .initiative_type_repository import InitiativeTypeRepository
@@ -14,10 +17,14 @@ from .organizational_unit_repository import OrganizationalUnitRepositoryInterfac
 
 __all__ = [
     "TeamRepositoryInterface",
+    "Membership",
     "PersonRepositoryInterface",
     "InitiativeRepository",
     "InitiativeTypeRepository",
     "OrganizationRepositoryInterface",
     "OrganizationalUnitRepositoryInterface",
     "GenericRepositoryInterface",
+    "ListingRepositoryInterface",
+    "AsyncRepositoryInterface",
+    "UpsertRepositoryInterface",
 ]
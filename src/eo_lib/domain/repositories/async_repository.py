@@ -0,0 +1,82 @@
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, Generic, List, Optional, Sequence, TypeVar
+from eo_lib.domain.query import UNSET, OrderBy, Where
+
+T = TypeVar("T")
+
+
+class AsyncRepositoryInterface(ABC, Generic[T]):
+    """
+    Interface for asyncio repositories.
+
+    Mirrors the generic CRUD operations and the ListingRepositoryInterface
+    methods as coroutines, for callers running on an event loop.
+    """
+
+    @abstractmethod
+    async def add(self, entity: T) -> T:
+        """Persists a new entity and returns it with its ID."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(
+        self, id: int, load_profile: Optional[str] = None
+    ) -> Optional[T]:
+        """Retrieves an entity by ID, or None."""
+        pass
+
+    @abstractmethod
+    async def get_all(self, load_profile: Optional[str] = None) -> List[T]:
+        """Retrieves all entities."""
+        pass
+
+    @abstractmethod
+    async def update(self, entity: T) -> T:
+        """Persists changes to an existing entity."""
+        pass
+
+    @abstractmethod
+    async def delete(self, id: int) -> bool:
+        """Deletes an entity by ID; returns False if it does not exist."""
+        pass
+
+    @abstractmethod
+    async def list_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        order_by: str = "id",
+        load_profile: Optional[str] = None,
+        after_value: Any = UNSET,
+    ) -> List[T]:
+        """Retrieves one keyset page, as ListingRepositoryInterface.list_page."""
+        pass
+
+    @abstractmethod
+    def iter_all(
+        self, batch_size: int = 1000, load_profile: Optional[str] = None
+    ) -> AsyncIterator[T]:
+        """Streams every entity, as ListingRepositoryInterface.iter_all."""
+        pass
+
+    @abstractmethod
+    async def project(
+        self,
+        fields: Sequence[str],
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Retrieves only the given fields, as ListingRepositoryInterface.project."""
+        pass
+
+    @abstractmethod
+    async def find(
+        self,
+        where: Optional[Where] = None,
+        order_by: OrderBy = "id",
+        limit: Optional[int] = None,
+        offset: int = 0,
+        load_profile: Optional[str] = None,
+    ) -> List[T]:
+        """Retrieves matching entities, as ListingRepositoryInterface.find."""
+        pass
@@ -1,12 +1,31 @@
+from abc import abstractmethod
+from typing import Dict, Sequence
 from eo_lib.domain.entities.initiative import Initiative
+from eo_lib.domain.hierarchy import InitiativeRollup
 from libbase.infrastructure.interface import IRepository as GenericRepositoryInterface
+from eo_lib.domain.repositories.listing_repository import ListingRepositoryInterface
 
 
-class InitiativeRepository(GenericRepositoryInterface[Initiative]):
+class InitiativeRepository(
+    GenericRepositoryInterface[Initiative], ListingRepositoryInterface[Initiative]
+):
     """
     Interface for Initiative Repository.
 
     Extends GenericRepositoryInterface to provide specific data access
     operations for Initiative entities. Inherits standard CRUD functionality.
     """
-    pass
+
+    @abstractmethod
+    def get_rollups(self, initiative_ids: Sequence[int]) -> Dict[int, InitiativeRollup]:
+        """
+        Aggregates each initiative's subtree of sub-initiatives.
+
+        Args:
+            initiative_ids (Sequence[int]): The initiatives to roll up.
+
+        Returns:
+            Dict[int, InitiativeRollup]: One rollup per existing initiative;
+            unknown IDs are left out.
+        """
+        pass
@@ -2,9 +2,13 @@ from abc import abstractmethod
 from typing import Optional
 from eo_lib.domain.entities.initiative import InitiativeType
 from libbase.infrastructure.interface import IRepository as GenericRepositoryInterface
+from eo_lib.domain.repositories.listing_repository import ListingRepositoryInterface
 
 
-class InitiativeTypeRepository(GenericRepositoryInterface[InitiativeType]):
+class InitiativeTypeRepository(
+    GenericRepositoryInterface[InitiativeType],
+    ListingRepositoryInterface[InitiativeType],
+):
     """
     Interface for InitiativeType Repository.
     """
@@ -0,0 +1,134 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Generic, Iterator, List, Optional, Sequence, TypeVar
+from eo_lib.domain.query import UNSET, OrderBy, Where
+
+T = TypeVar("T")
+
+
+class ListingRepositoryInterface(ABC, Generic[T]):
+    """
+    Interface for scalable list operations shared by every repository.
+
+    Complements the generic ``get_all`` with keyset (seek) pagination, so the
+    cost of a page does not depend on how deep into the listing it is, and
+    with streaming iteration for full scans in bounded memory, and with a
+    small predicate query that every backend evaluates the same way.
+
+    Implementations also accept a ``load_profile`` keyword on ``get_by_id``
+    and ``get_all``, selecting how much of the object graph is loaded.
+    """
+
+    @abstractmethod
+    def list_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        order_by: str = "id",
+        load_profile: Optional[str] = None,
+        after_value: Any = UNSET,
+    ) -> List[T]:
+        """
+        Retrieves one page of entities in ascending ``(order_by, id)`` order.
+
+        Args:
+            after_id (int, optional): ID of the last entity of the previous
+                page. None starts from the beginning.
+            limit (int): Maximum number of entities to return. Defaults to 50.
+            order_by (str): Column to sort by; NULLs sort last and ``id``
+                breaks ties. Defaults to "id".
+            load_profile (str, optional): Named eager-loading profile
+                (e.g. "summary", "full"). Defaults to the model mappings.
+            after_value: The ``order_by`` value of that last entity (None
+                for NULL). Carrying it in the cursor lets paging continue
+                even if the entity was deleted meanwhile; by default it is
+                read from the ``after_id`` row.
+
+        Returns:
+            List[T]: The entities following ``after_id``.
+
+        Raises:
+            ValueError: If ``order_by`` is not a column, ``limit`` < 1, the
+                load profile is unknown, or ``after_value`` is not given and
+                the ``after_id`` entity no longer exists.
+        """
+        pass
+
+    @abstractmethod
+    def iter_all(
+        self, batch_size: int = 1000, load_profile: Optional[str] = None
+    ) -> Iterator[T]:
+        """
+        Iterates over every entity without materializing the full list.
+
+        Args:
+            batch_size (int): Rows fetched per round trip by database
+                backends. Defaults to 1000.
+            load_profile (str, optional): Named eager-loading profile.
+
+        Yields:
+            T: Each stored entity, in ascending ID order where the backend
+            keeps one.
+        """
+        pass
+
+    @abstractmethod
+    def project(
+        self,
+        fields: Sequence[str],
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves only the given fields of the entities, in ``id`` order.
+
+        Database backends fetch every field, including many-to-one fields
+        such as ``initiative_type.name``, in a single query, so list views
+        do not load a related object per row.
+
+        Args:
+            fields (Sequence[str]): Column names, or ``relationship.column``
+                for many-to-one relationships.
+            after_id (int, optional): Keyset start, as in ``list_page``.
+            limit (int, optional): Maximum number of rows. Defaults to all.
+
+        Returns:
+            List[Dict[str, Any]]: One dict per entity, keyed by field.
+
+        Raises:
+            ValueError: If a field cannot be projected.
+        """
+        pass
+
+    @abstractmethod
+    def find(
+        self,
+        where: Optional[Where] = None,
+        order_by: OrderBy = "id",
+        limit: Optional[int] = None,
+        offset: int = 0,
+        load_profile: Optional[str] = None,
+    ) -> List[T]:
+        """
+        Retrieves the entities matching every condition, sorted and sliced.
+
+        Database backends run it as one SELECT; in-process backends narrow
+        the candidates through their secondary indexes when they can.
+
+        Args:
+            where (Mapping, optional): Column name to condition: a value for
+                equality (None matches NULL), ``In(values)`` or ``Range(...)``.
+            order_by (str or Sequence[str]): Sort columns, most significant
+                first; prefix with "-" for descending. NULLs sort last and
+                ``id`` breaks ties. Defaults to "id".
+            limit (int, optional): Maximum number of entities. Defaults to all.
+            offset (int): Number of matching entities to skip. Defaults to 0.
+            load_profile (str, optional): Named eager-loading profile.
+
+        Returns:
+            List[T]: The matching entities.
+
+        Raises:
+            ValueError: If a field is not a column, ``limit`` < 1, ``offset``
+                < 0 or the load profile is unknown.
+        """
+        pass
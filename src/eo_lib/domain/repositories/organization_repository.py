@@ -1,8 +1,14 @@
 from eo_lib.domain.entities import Organization
 from libbase.infrastructure.interface import IRepository as GenericRepositoryInterface
+from eo_lib.domain.repositories.listing_repository import ListingRepositoryInterface
+from eo_lib.domain.repositories.upsert_repository import UpsertRepositoryInterface
 
 
-class OrganizationRepositoryInterface(GenericRepositoryInterface[Organization]):
+class OrganizationRepositoryInterface(
+    GenericRepositoryInterface[Organization],
+    ListingRepositoryInterface[Organization],
+    UpsertRepositoryInterface,
+):
     """
     Interface for Organization Repository.
     """
@@ -1,9 +1,78 @@
+from abc import abstractmethod
+from typing import List, Optional
 from eo_lib.domain.entities import OrganizationalUnit
+from eo_lib.domain.hierarchy import HierarchyNode
 from libbase.infrastructure.interface import IRepository as GenericRepositoryInterface
+from eo_lib.domain.repositories.listing_repository import ListingRepositoryInterface
 
 
-class OrganizationalUnitRepositoryInterface(GenericRepositoryInterface[OrganizationalUnit]):
+class OrganizationalUnitRepositoryInterface(
+    GenericRepositoryInterface[OrganizationalUnit],
+    ListingRepositoryInterface[OrganizationalUnit],
+):
     """
     Interface for Organizational Unit Repository.
     """
-    pass
+
+    @abstractmethod
+    def get_subtree(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """
+        Retrieves a unit and every unit below it.
+
+        Args:
+            unit_id (int): The root of the subtree.
+            max_depth (int, optional): Deepest level to include (0 is the
+                unit itself). Defaults to no limit.
+
+        Returns:
+            List[HierarchyNode]: Ordered by depth, then ID; empty if the unit
+            does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def get_ancestry(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """
+        Retrieves a unit and its chain of parents up to the root.
+
+        Args:
+            unit_id (int): The unit to start from.
+            max_depth (int, optional): Highest level to include (1 is the
+                parent). Defaults to no limit.
+
+        Returns:
+            List[HierarchyNode]: The unit first, then each parent in turn;
+            empty if the unit does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def is_within(self, unit_id: int, ancestor_id: int) -> bool:
+        """
+        Checks whether a unit is ``ancestor_id`` itself or below it.
+
+        Uses the closure table when it is enabled, otherwise walks up from
+        ``unit_id``.
+
+        Args:
+            unit_id (int): The unit to check.
+            ancestor_id (int): The candidate ancestor.
+
+        Returns:
+            bool: True if ``ancestor_id`` is on the unit's path to the root.
+        """
+        pass
+
+    @abstractmethod
+    def rebuild_closure(self) -> int:
+        """
+        Recomputes the closure table from the units' parent links.
+
+        Returns:
+            int: Number of (ancestor, descendant) pairs stored.
+        """
+        pass
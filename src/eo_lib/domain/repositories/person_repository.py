@@ -1,13 +1,71 @@
+from abc import abstractmethod
+from typing import Any, Dict, Iterable, List, Mapping, Sequence
 from eo_lib.domain.entities.person import Person
 from libbase.infrastructure.interface import IRepository as GenericRepositoryInterface
+from eo_lib.domain.repositories.listing_repository import ListingRepositoryInterface
+from eo_lib.domain.repositories.upsert_repository import UpsertRepositoryInterface
 
 
-class PersonRepositoryInterface(GenericRepositoryInterface[Person]):
+class PersonRepositoryInterface(
+    GenericRepositoryInterface[Person],
+    ListingRepositoryInterface[Person],
+    UpsertRepositoryInterface,
+):
     """
     Interface for Person Repository.
 
     Extends GenericRepositoryInterface to provide specific data access
     operations for Person entities. Inherits standard CRUD functionality.
+    Upserts are keyed by ``identification_id``; a row's ``emails`` list, when
+    given, becomes the person's exact set of emails, keyed by address.
     """
 
-    pass
+    @abstractmethod
+    def add_many(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> List[int]:
+        """
+        Stores many Persons and their emails in chunks.
+
+        Args:
+            rows (Iterable[dict]): Person attributes with the keys ``name``,
+                ``identification_id``, ``birthday`` and ``emails`` (list of str).
+            chunk_size (int): Number of persons written per batch.
+
+        Returns:
+            List[int]: The new Person IDs, in input order.
+        """
+        pass
+
+    @abstractmethod
+    def get_by_emails(self, emails: Sequence[str]) -> Dict[str, Person]:
+        """
+        Resolves email addresses to the Persons owning them.
+
+        Args:
+            emails (Sequence[str]): Distinct addresses, already normalized with
+                ``PersonEmail.normalize``. Stored addresses match ignoring case.
+
+        Returns:
+            dict: Person per given address; unknown addresses are left out.
+        """
+        pass
+
+    @abstractmethod
+    def set_emails_many(self, emails: Mapping[int, Sequence[str]]) -> int:
+        """
+        Makes each list the exact set of emails of its Person.
+
+        Only the differences are written: kept addresses are untouched, missing
+        ones are deleted and new ones inserted or moved from their old owner.
+
+        Args:
+            emails (Mapping[int, Sequence[str]]): Addresses per Person ID.
+
+        Returns:
+            int: How many of the given Persons had their set changed.
+
+        Raises:
+            ValueError: If a Person does not exist; nothing is written then.
+        """
+        pass
@@ -1,10 +1,21 @@
 from abc import abstractmethod
-from typing import List
+from datetime import date
+from typing import Iterable, List, Optional, Sequence, Tuple
 from eo_lib.domain.entities import Team, TeamMember
 from libbase.infrastructure.interface import IRepository as GenericRepositoryInterface
+from eo_lib.domain.repositories.listing_repository import ListingRepositoryInterface
+from eo_lib.domain.repositories.upsert_repository import UpsertRepositoryInterface
 
 
-class TeamRepositoryInterface(GenericRepositoryInterface[Team]):
+# (person_id, role name, start_date, end_date) of one membership to create.
+Membership = Tuple[int, Optional[str], Optional[date], Optional[date]]
+
+
+class TeamRepositoryInterface(
+    GenericRepositoryInterface[Team],
+    ListingRepositoryInterface[Team],
+    UpsertRepositoryInterface,
+):
     """
     Interface for Team Repository.
 
@@ -50,3 +61,51 @@ class TeamRepositoryInterface(GenericRepositoryInterface[Team]):
             List[TeamMember]: A list of TeamMember association entities.
         """
         pass
+
+    @abstractmethod
+    def add_members(self, team_id: int, members: Sequence[Membership]) -> List[int]:
+        """
+        Enrolls many Persons into a Team in one transaction.
+
+        Role names that do not exist yet are created.
+
+        Args:
+            team_id (int): ID of the Team.
+            members (Sequence[Membership]): One tuple per membership.
+
+        Returns:
+            List[int]: IDs of the new TeamMember associations, in input order.
+        """
+        pass
+
+    @abstractmethod
+    def remove_members(self, member_ids: Iterable[int]) -> int:
+        """
+        Deletes many TeamMember associations in one transaction.
+
+        Args:
+            member_ids (Iterable[int]): IDs of the associations to remove.
+
+        Returns:
+            int: Number of associations removed; unknown IDs are ignored.
+        """
+        pass
+
+    @abstractmethod
+    def move_members(
+        self, from_team_id: int, to_team_id: int, person_ids: Iterable[int]
+    ) -> int:
+        """
+        Moves Persons' memberships from one Team to another in one transaction.
+
+        Role and dates are kept.
+
+        Args:
+            from_team_id (int): ID of the Team the Persons leave.
+            to_team_id (int): ID of the Team the Persons join.
+            person_ids (Iterable[int]): IDs of the Persons to move.
+
+        Returns:
+            int: Number of memberships moved.
+        """
+        pass
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable
+from eo_lib.domain.upsert import UpsertResult
+
+
+class UpsertRepositoryInterface(ABC):
+    """
+    Interface for repositories whose entities have a natural key.
+
+    The key and the written columns of each entity are listed in
+    ``eo_lib.domain.upsert.UPSERT_SPECS``.
+    """
+
+    @abstractmethod
+    def upsert_many(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """
+        Inserts the rows whose key is new and updates the ones that changed.
+
+        Args:
+            rows (Iterable[dict]): Full records with distinct natural keys.
+            chunk_size (int): Number of rows written per batch.
+
+        Returns:
+            UpsertResult: How many rows were inserted, updated and unchanged.
+        """
+        pass
@@ -0,0 +1,26 @@
+from typing import Dict, NamedTuple, Tuple
+from eo_lib.domain.entities import Organization, Person, Team
+
+
+class UpsertResult(NamedTuple):
+    """
+    Outcome of an upsert by natural key.
+
+    Attributes:
+        inserted (int): Rows whose key was not stored yet.
+        updated (int): Stored rows that changed.
+        unchanged (int): Stored rows that already matched.
+    """
+
+    inserted: int
+    updated: int
+    unchanged: int
+
+
+# Natural key and the columns an upsert writes, per entity. A row is the
+# full record: the columns it leaves out are written as NULL.
+UPSERT_SPECS: Dict[type, Tuple[str, Tuple[str, ...]]] = {
+    Person: ("identification_id", ("name", "birthday")),
+    Team: ("name", ("description", "short_name", "organization_id")),
+    Organization: ("name", ("description", "short_name")),
+}
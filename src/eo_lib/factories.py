@@ -1,3 +1,4 @@
+from typing import Optional
 from eo_lib.config import Config
 
 from eo_lib.infrastructure.repositories import (
@@ -7,12 +8,6 @@ from eo_lib.infrastructure.repositories import (
     PostgresInitiativeTypeRepository,
     PostgresOrganizationRepository,
     PostgresOrganizationalUnitRepository,
-    InMemoryPersonRepository,
-    InMemoryTeamRepository,
-    InMemoryInitiativeRepository,
-    InMemoryInitiativeTypeRepository,
-    InMemoryOrganizationRepository,
-    InMemoryOrgUnitRepository,
     JsonPersonRepository,
     JsonTeamRepository,
     JsonInitiativeRepository,
@@ -21,12 +16,45 @@ from eo_lib.infrastructure.repositories import (
     JsonOrgUnitRepository,
 )
 
+from eo_lib.infrastructure.repositories.async_repositories import (
+    AsyncPostgresPersonRepository,
+    AsyncPostgresTeamRepository,
+    AsyncPostgresInitiativeRepository,
+    AsyncPostgresInitiativeTypeRepository,
+    AsyncPostgresOrganizationRepository,
+    AsyncPostgresOrganizationalUnitRepository,
+    AsyncRepositoryAdapter,
+)
+from eo_lib.infrastructure.repositories.initiative_type_cache import (
+    AsyncCachedInitiativeTypeRepository,
+    CachedInitiativeTypeRepository,
+    InitiativeTypeCache,
+)
+from eo_lib.infrastructure.repositories.memory_store import MemoryStore
+
 from eo_lib.services import (
     PersonService,
     TeamService,
     InitiativeService,
     OrganizationService,
     OrganizationalUnitService,
+    AsyncPersonService,
+    AsyncTeamService,
+    AsyncInitiativeService,
+    AsyncOrganizationService,
+    AsyncOrganizationalUnitService,
+)
+
+# Slots of the repository tuples, in ServiceFactory strategy order.
+_PERSONS, _TEAMS, _INITIATIVES, _INITIATIVE_TYPES, _ORGANIZATIONS, _ORG_UNITS = range(6)
+
+_ASYNC_STRATEGIES = (
+    AsyncPostgresPersonRepository,
+    AsyncPostgresTeamRepository,
+    AsyncPostgresInitiativeRepository,
+    AsyncPostgresInitiativeTypeRepository,
+    AsyncPostgresOrganizationRepository,
+    AsyncPostgresOrganizationalUnitRepository,
 )
 
 
@@ -36,28 +64,21 @@ class ServiceFactory:
 
     The factory determines which storage strategy (Postgres, Memory, or JSON)
     to use based on the application configuration and injects the corresponding
-    repository into the created services.
+    repository into the created services. Memory storage injects the
+    repositories of the shared MemoryStore named by the configuration.
     """
 
     @staticmethod
     def _get_strategies():
         """
-        Determines the repository classes based on the configured storage type.
+        Determines the repository classes for JSON or database storage.
+
+        Memory storage takes its repositories from a MemoryStore instead.
 
         Returns:
             tuple: (PersonRepo, TeamRepo, InitiativeRepo, InitiativeTypeRepo, OrganizationRepo, OrgUnitRepo)
         """
-        t = Config.get_storage_type().lower()
-        if t == "memory":
-            return (
-                InMemoryPersonRepository,
-                InMemoryTeamRepository,
-                InMemoryInitiativeRepository,
-                InMemoryInitiativeTypeRepository,
-                InMemoryOrganizationRepository,
-                InMemoryOrgUnitRepository,
-            )
-        elif t == "json":
+        if Config.get_storage_type().lower() == "json":
             return (
                 JsonPersonRepository,
                 JsonTeamRepository,
@@ -76,31 +97,142 @@ class ServiceFactory:
                 PostgresOrganizationalUnitRepository,
             )
 
+    @staticmethod
+    def _get_memory_store() -> Optional[MemoryStore]:
+        """
+        Returns the shared store when memory storage is configured.
+
+        Returns:
+            MemoryStore: The named store; None for other storage types, and a
+            new private store when the configured name is empty.
+        """
+        if Config.get_storage_type().lower() != "memory":
+            return None
+        name = Config.get_memory_store_name()
+        return MemoryStore.named(name) if name else MemoryStore()
+
+    @staticmethod
+    def _get_repositories(store: Optional[MemoryStore], *slots: int):
+        """
+        Provides the repositories at the given slots for the configured storage.
+
+        Only the selected repository classes are instantiated.
+
+        Args:
+            store (MemoryStore, optional): The memory store, if configured.
+            *slots (int): Positions in the ``_get_strategies`` order.
+
+        Returns:
+            tuple: One repository per slot, in the order asked.
+        """
+        if store is not None:
+            repositories = store.repositories()
+            return tuple(repositories[slot] for slot in slots)
+        strategies = ServiceFactory._get_strategies()
+        return tuple(strategies[slot]() for slot in slots)
+
+    @staticmethod
+    def _get_initiative_type_cache(
+        store: Optional[MemoryStore],
+    ) -> Optional[InitiativeTypeCache]:
+        """The store's shared type cache; other storage gets a cache per service."""
+        return store.initiative_type_cache if store is not None else None
+
     @staticmethod
     def create_person_service() -> PersonService:
-        RepoClass, _, _, _, _, _ = ServiceFactory._get_strategies()
-        return PersonService(RepoClass())
+        store = ServiceFactory._get_memory_store()
+        (repo,) = ServiceFactory._get_repositories(store, _PERSONS)
+        return PersonService(repo)
 
     @staticmethod
     def create_team_service() -> TeamService:
-        _, RepoClass, _, _, _, _ = ServiceFactory._get_strategies()
-        return TeamService(RepoClass())
+        store = ServiceFactory._get_memory_store()
+        (repo,) = ServiceFactory._get_repositories(store, _TEAMS)
+        return TeamService(repo)
 
     @staticmethod
     def create_initiative_service() -> InitiativeService:
-        _, TeamRepoClass, InitiativeRepoClass, InitiativeTypeRepoClass, _, _ = (
-            ServiceFactory._get_strategies()
+        store = ServiceFactory._get_memory_store()
+        initiative_repo, initiative_type_repo, team_repo = (
+            ServiceFactory._get_repositories(
+                store, _INITIATIVES, _INITIATIVE_TYPES, _TEAMS
+            )
         )
         return InitiativeService(
-            InitiativeRepoClass(), InitiativeTypeRepoClass(), TeamRepoClass()
+            initiative_repo,
+            CachedInitiativeTypeRepository(
+                initiative_type_repo, ServiceFactory._get_initiative_type_cache(store)
+            ),
+            team_repo,
         )
 
     @staticmethod
     def create_organization_service() -> OrganizationService:
-        _, _, _, _, RepoClass, _ = ServiceFactory._get_strategies()
-        return OrganizationService(RepoClass())
+        store = ServiceFactory._get_memory_store()
+        (repo,) = ServiceFactory._get_repositories(store, _ORGANIZATIONS)
+        return OrganizationService(repo)
 
     @staticmethod
     def create_organizational_unit_service() -> OrganizationalUnitService:
-        _, _, _, _, _, RepoClass = ServiceFactory._get_strategies()
-        return OrganizationalUnitService(RepoClass())
+        store = ServiceFactory._get_memory_store()
+        (repo,) = ServiceFactory._get_repositories(store, _ORG_UNITS)
+        return OrganizationalUnitService(repo)
+
+    @staticmethod
+    def _get_async_repositories(store: Optional[MemoryStore], *slots: int):
+        """
+        Provides the asyncio repositories at the given slots.
+
+        Database storage uses the AsyncPostgres* repositories; memory and JSON
+        storage wrap their repositories in an AsyncRepositoryAdapter. Only the
+        selected repositories are instantiated.
+
+        Returns:
+            tuple: One repository per slot, in the order asked.
+        """
+        if Config.get_storage_type().lower() in ("memory", "json"):
+            return tuple(
+                AsyncRepositoryAdapter(repo)
+                for repo in ServiceFactory._get_repositories(store, *slots)
+            )
+        return tuple(_ASYNC_STRATEGIES[slot]() for slot in slots)
+
+    @staticmethod
+    def create_async_person_service() -> AsyncPersonService:
+        store = ServiceFactory._get_memory_store()
+        (repo,) = ServiceFactory._get_async_repositories(store, _PERSONS)
+        return AsyncPersonService(repo)
+
+    @staticmethod
+    def create_async_team_service() -> AsyncTeamService:
+        store = ServiceFactory._get_memory_store()
+        (repo,) = ServiceFactory._get_async_repositories(store, _TEAMS)
+        return AsyncTeamService(repo)
+
+    @staticmethod
+    def create_async_initiative_service() -> AsyncInitiativeService:
+        store = ServiceFactory._get_memory_store()
+        initiative_repo, initiative_type_repo, team_repo = (
+            ServiceFactory._get_async_repositories(
+                store, _INITIATIVES, _INITIATIVE_TYPES, _TEAMS
+            )
+        )
+        return AsyncInitiativeService(
+            initiative_repo,
+            AsyncCachedInitiativeTypeRepository(
+                initiative_type_repo, ServiceFactory._get_initiative_type_cache(store)
+            ),
+            team_repo,
+        )
+
+    @staticmethod
+    def create_async_organization_service() -> AsyncOrganizationService:
+        store = ServiceFactory._get_memory_store()
+        (repo,) = ServiceFactory._get_async_repositories(store, _ORGANIZATIONS)
+        return AsyncOrganizationService(repo)
+
+    @staticmethod
+    def create_async_organizational_unit_service() -> AsyncOrganizationalUnitService:
+        store = ServiceFactory._get_memory_store()
+        (repo,) = ServiceFactory._get_async_repositories(store, _ORG_UNITS)
+        return AsyncOrganizationalUnitService(repo)
@@ -2,6 +2,7 @@
 # Typically infrastructure exports repositories.
 from .repositories import (
     GenericPostgresRepository,
+    PostgresRepository,
     PostgresPersonRepository,
     PostgresTeamRepository,
     PostgresInitiativeRepository,
@@ -19,6 +20,7 @@ from .database import PostgresClient
 
 __all__ = [
     "GenericPostgresRepository",
+    "PostgresRepository",
     "PostgresPersonRepository",
     "PostgresTeamRepository",
     "PostgresInitiativeRepository",
@@ -0,0 +1,27 @@
+from itertools import islice
+from typing import Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Splits an iterable into lists of at most ``size`` items.
+
+    Items are consumed lazily, so only one chunk is held in memory at a time.
+
+    Args:
+        items (Iterable[T]): The items to split.
+        size (int): Maximum number of items per chunk.
+
+    Yields:
+        List[T]: The next chunk.
+    """
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
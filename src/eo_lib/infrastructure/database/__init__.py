@@ -1,3 +1,14 @@
 from .postgres_client import PostgresClient
+from .async_client import AsyncPostgresClient
+from .pool import InstrumentedQueuePool, PoolStatistics
+from .bulk_import import PostgresBulkImporter, read_csv, read_ndjson
 
-__all__ = ["PostgresClient"]
+__all__ = [
+    "PostgresClient",
+    "AsyncPostgresClient",
+    "InstrumentedQueuePool",
+    "PoolStatistics",
+    "PostgresBulkImporter",
+    "read_csv",
+    "read_ndjson",
+]
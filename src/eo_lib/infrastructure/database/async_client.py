@@ -0,0 +1,236 @@
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Optional
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from eo_lib.config import Config
+from eo_lib.domain.base import Base
+
+# Session bound by an active session_scope() in the current task. Tasks
+# started inside the scope inherit the variable, so the owning task is kept
+# in the session's info and checked by _active_session().
+_scoped_session: ContextVar[Optional[AsyncSession]] = ContextVar(
+    "eo_lib_async_scoped_session", default=None
+)
+
+
+def _active_session() -> Optional[AsyncSession]:
+    """
+    Returns the session of the session_scope() the current task runs in.
+
+    Raises:
+        RuntimeError: If the scope was opened by another task. An AsyncSession
+            must not be used concurrently, so tasks started inside a scope
+            (``asyncio.gather``, ``create_task``) cannot take part in it.
+    """
+    active = _scoped_session.get()
+    if active is not None and active.info["task"] is not asyncio.current_task():
+        raise RuntimeError(
+            "A session_scope() belongs to the task that opened it; tasks "
+            "started inside it cannot share its session. Await the "
+            "operations in the scope's own task instead."
+        )
+    return active
+
+
+class AsyncPostgresClient:
+    """
+    Singleton asyncio Database Client for PostgreSQL.
+
+    Manages the SQLAlchemy AsyncEngine (asyncpg driver; aiosqlite for SQLite)
+    and its session factory. Repository operations check a connection out of
+    the engine's pool only while they run, so many concurrent tasks share a
+    small pool.
+    """
+
+    _instance = None
+    _engine = None
+    _SessionLocal = None
+
+    def __new__(cls):
+        """
+        Ensures only one instance of AsyncPostgresClient exists.
+
+        Returns:
+            AsyncPostgresClient: The singleton instance.
+        """
+        if cls._instance is None:
+            cls._instance = super(AsyncPostgresClient, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        """
+        Initializes the async engine and session factory from Config.
+        """
+        db_url = Config.get_async_database_url()
+        self._engine = create_async_engine(
+            db_url, echo=False, **self._engine_options(db_url)
+        )
+        self._SessionLocal = async_sessionmaker(
+            self._engine, autoflush=False, expire_on_commit=False
+        )
+
+    @staticmethod
+    def _engine_options(db_url: str) -> Dict[str, Any]:
+        """
+        Builds the pool keyword arguments for create_async_engine from Config.
+
+        Args:
+            db_url (str): The async database connection string.
+
+        Returns:
+            dict: Keyword arguments for create_async_engine.
+        """
+        if make_url(db_url).get_backend_name() == "sqlite":
+            return {}
+
+        settings = Config.get_pool_settings()
+        options: Dict[str, Any] = {
+            "pool_size": settings["pool_size"],
+            "max_overflow": settings["max_overflow"],
+            "pool_timeout": settings["pool_timeout"],
+            "pool_recycle": settings["pool_recycle"],
+            "pool_pre_ping": settings["pool_pre_ping"],
+        }
+        if settings["statement_timeout_ms"] > 0:
+            options["connect_args"] = {
+                "server_settings": {
+                    "statement_timeout": str(settings["statement_timeout_ms"])
+                }
+            }
+        return options
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Returns the status of the async engine's connection pool.
+
+        Returns:
+            dict: ``status`` as reported by the pool.
+        """
+        return {"status": self._engine.pool.status()}
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Provides the AsyncSession for one repository read.
+
+        Inside a session_scope() this is the scope's session; otherwise a
+        short-lived session that is closed when the block exits.
+
+        Yields:
+            AsyncSession: The active database session.
+
+        Raises:
+            RuntimeError: If called from a task started inside another task's
+                session_scope().
+        """
+        active = _active_session()
+        if active is not None:
+            yield active
+            return
+        async with self._SessionLocal() as session:
+            yield session
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[AsyncSession]:
+        """
+        Provides the AsyncSession for one repository write.
+
+        Outside a session_scope() the write runs in its own transaction and is
+        committed on success. Inside one it is only flushed; a failure marks
+        the scope so that it can no longer be committed.
+
+        Yields:
+            AsyncSession: The active database session.
+
+        Raises:
+            RuntimeError: If called from a task started inside another task's
+                session_scope().
+        """
+        active = _active_session()
+        if active is None:
+            async with self._SessionLocal() as session:
+                async with session.begin():
+                    yield session
+            return
+        try:
+            yield active
+            await active.flush()
+        except Exception:
+            active.info["rolled_back"] = True
+            await active.rollback()
+            raise
+
+    @staticmethod
+    def scope_session() -> Optional[AsyncSession]:
+        """
+        Returns the AsyncSession of the current task's session_scope(), if any.
+
+        Raises:
+            RuntimeError: If called from a task started inside another task's
+                session_scope().
+        """
+        return _active_session()
+
+    @asynccontextmanager
+    async def session_scope(self) -> AsyncIterator[AsyncSession]:
+        """
+        Runs a block of async work in one AsyncSession and one transaction.
+
+        The scope belongs to the task that opens it. Nested scopes in that
+        task join the outermost one, while tasks started inside the block
+        (``asyncio.gather``, ``create_task``) inherit the scope but get a
+        RuntimeError when they use it, since an AsyncSession cannot serve
+        concurrent operations. Separate tasks opening their own scopes each
+        get their own session.
+
+        Yields:
+            AsyncSession: The session bound to the scope.
+
+        Raises:
+            RuntimeError: If an operation inside the block failed and rolled
+                back the batch, but the error was swallowed by the caller, or
+                if the scope is entered from a task started inside it.
+        """
+        active = _active_session()
+        if active is not None:
+            yield active
+            return
+
+        session = self._SessionLocal()
+        session.info["task"] = asyncio.current_task()
+        token = _scoped_session.set(session)
+        try:
+            yield session
+            if session.info.get("rolled_back"):
+                raise RuntimeError(
+                    "Unit of work was rolled back by a failed operation; "
+                    "nothing was committed"
+                )
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            _scoped_session.reset(token)
+            await session.close()
+
+    async def create_tables(self) -> None:
+        """
+        Creates all database tables defined in the ORM models.
+        Useful for development and testing environments.
+        """
+        async with self._engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def dispose(self) -> None:
+        """
+        Closes every pooled connection, e.g. on application shutdown.
+        """
+        await self._engine.dispose()
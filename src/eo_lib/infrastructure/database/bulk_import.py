@@ -0,0 +1,346 @@
+import csv
+import io
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from eo_lib.infrastructure.database.postgres_client import PostgresClient
+
+ProgressCallback = Callable[[str, int], None]
+
+# Resolves a staged person reference (identification_id or email) to persons.id.
+_PERSON_JOINS = """
+    LEFT JOIN persons p ON p.identification_id = s.identification_id
+    LEFT JOIN person_emails e ON e.email = s.email
+"""
+_PERSON_ID = "COALESCE(p.id, e.person_id)"
+
+# target -> (staging columns, merge statements run in order); statements are
+# formatted with {staging}, {person_id} and {person_joins}. Staging tables also
+# number their rows in input order (_row), so when several rows share a key,
+# DISTINCT ON keeps the last one.
+_TARGETS: Dict[str, Tuple[List[Tuple[str, str]], List[str]]] = {
+    "persons": (
+        [("identification_id", "text"), ("name", "text"), ("birthday", "date")],
+        [
+            """
+            INSERT INTO persons (name, identification_id, birthday)
+            SELECT DISTINCT ON (s.identification_id)
+                s.name, s.identification_id, s.birthday
+            FROM {staging} s
+            WHERE s.identification_id IS NOT NULL
+            ORDER BY s.identification_id, s._row DESC
+            ON CONFLICT (identification_id) DO UPDATE
+            SET name = EXCLUDED.name, birthday = EXCLUDED.birthday
+            """
+        ],
+    ),
+    "person_emails": (
+        [("identification_id", "text"), ("email", "text")],
+        [
+            """
+            INSERT INTO person_emails (person_id, email)
+            SELECT DISTINCT ON (s.email) p.id, s.email
+            FROM {staging} s
+            JOIN persons p ON p.identification_id = s.identification_id
+            ORDER BY s.email, s._row DESC
+            ON CONFLICT (email) DO NOTHING
+            """
+        ],
+    ),
+    "teams": (
+        [
+            ("name", "text"),
+            ("description", "text"),
+            ("short_name", "text"),
+            ("organization_name", "text"),
+        ],
+        [
+            """
+            INSERT INTO teams (name, description, short_name, organization_id)
+            SELECT DISTINCT ON (s.name) s.name, s.description, s.short_name, o.id
+            FROM {staging} s
+            LEFT JOIN organizations o ON o.name = s.organization_name
+            ORDER BY s.name, s._row DESC
+            ON CONFLICT (name) DO UPDATE
+            SET description = EXCLUDED.description,
+                short_name = EXCLUDED.short_name,
+                organization_id = COALESCE(
+                    EXCLUDED.organization_id, teams.organization_id
+                )
+            """
+        ],
+    ),
+    "team_members": (
+        [
+            ("team_name", "text"),
+            ("identification_id", "text"),
+            ("email", "text"),
+            ("role", "text"),
+            ("start_date", "timestamp"),
+            ("end_date", "timestamp"),
+        ],
+        [
+            """
+            INSERT INTO roles (name)
+            SELECT DISTINCT s.role FROM {staging} s WHERE s.role IS NOT NULL
+            ON CONFLICT (name) DO NOTHING
+            """,
+            """
+            WITH resolved AS (
+                SELECT t.id AS team_id, {person_id} AS person_id,
+                    r.id AS role_id,
+                    COALESCE(s.start_date, now()) AS start_date,
+                    s.end_date, s._row
+                FROM {staging} s
+                JOIN teams t ON t.name = s.team_name
+                LEFT JOIN roles r ON r.name = s.role
+                {person_joins}
+            )
+            INSERT INTO team_members (person_id, team_id, role_id, start_date, end_date)
+            SELECT DISTINCT ON (res.team_id, res.person_id, res.role_id)
+                res.person_id, res.team_id, res.role_id, res.start_date, res.end_date
+            FROM resolved res
+            WHERE res.person_id IS NOT NULL
+            AND NOT EXISTS (
+                SELECT 1 FROM team_members m
+                WHERE m.team_id = res.team_id
+                AND m.person_id = res.person_id
+                AND m.role_id IS NOT DISTINCT FROM res.role_id
+            )
+            ORDER BY res.team_id, res.person_id, res.role_id, res._row DESC
+            """,
+        ],
+    ),
+    "initiative_teams": (
+        [("initiative_name", "text"), ("team_name", "text")],
+        [
+            """
+            INSERT INTO initiative_teams (initiative_id, team_id)
+            SELECT DISTINCT i.id, t.id
+            FROM {staging} s
+            JOIN initiatives i ON i.name = s.initiative_name
+            JOIN teams t ON t.name = s.team_name
+            ON CONFLICT DO NOTHING
+            """
+        ],
+    ),
+    "initiative_persons": (
+        [("initiative_name", "text"), ("identification_id", "text"), ("email", "text")],
+        [
+            """
+            INSERT INTO initiative_persons (initiative_id, person_id)
+            SELECT DISTINCT i.id, {person_id}
+            FROM {staging} s
+            JOIN initiatives i ON i.name = s.initiative_name
+            {person_joins}
+            WHERE {person_id} IS NOT NULL
+            ON CONFLICT DO NOTHING
+            """
+        ],
+    ),
+    "organization_persons": (
+        [
+            ("organization_name", "text"),
+            ("identification_id", "text"),
+            ("email", "text"),
+        ],
+        [
+            """
+            INSERT INTO organization_persons (organization_id, person_id)
+            SELECT DISTINCT o.id, {person_id}
+            FROM {staging} s
+            JOIN organizations o ON o.name = s.organization_name
+            {person_joins}
+            WHERE {person_id} IS NOT NULL
+            ON CONFLICT DO NOTHING
+            """
+        ],
+    ),
+}
+
+
+def read_csv(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily reads a CSV file with a header row.
+
+    Args:
+        path (str): Path to the CSV file.
+
+    Yields:
+        dict: One row keyed by column name.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def read_ndjson(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily reads a newline-delimited JSON file.
+
+    Args:
+        path (str): Path to the NDJSON file.
+
+    Yields:
+        dict: One decoded object per non-empty line.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class _CsvCopyStream:
+    """
+    Read-only file object that encodes rows as CSV on demand.
+
+    COPY FROM STDIN pulls fixed-size blocks through read(), so only one block
+    of encoded text is held in memory regardless of the input size.
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        columns: List[str],
+        on_row: Optional[Callable[[int], None]] = None,
+    ):
+        self._rows = iter(rows)
+        self._columns = columns
+        self._on_row = on_row
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+        self._pending = ""
+        self.count = 0
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._pending) < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._writer.writerow(
+                ["" if row.get(c) is None else row.get(c) for c in self._columns]
+            )
+            self.count += 1
+            if self._on_row:
+                self._on_row(self.count)
+            self._pending += self._buffer.getvalue()
+            self._buffer.seek(0)
+            self._buffer.truncate()
+
+        if size < 0:
+            data, self._pending = self._pending, ""
+        else:
+            data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+    def readline(self, size: int = -1) -> str:
+        return self.read(size)
+
+
+class PostgresBulkImporter:
+    """
+    Bulk loader based on PostgreSQL COPY FROM STDIN.
+
+    Rows are streamed into a temporary staging table, natural keys
+    (identification_id, email, team/initiative/organization names) are
+    resolved to IDs with set-based joins, and the result is merged into the
+    target table in the same transaction. Memory use does not depend on the
+    input size. Rows whose keys cannot be resolved are skipped; of several
+    rows with the same key, the last one wins.
+
+    Supported targets: ``persons`` (keyed by identification_id),
+    ``person_emails``, ``teams`` (keyed by name), ``team_members``,
+    ``initiative_teams``, ``initiative_persons`` and ``organization_persons``.
+    Persons are referenced by ``identification_id`` or ``email``.
+    """
+
+    TARGETS = tuple(_TARGETS)
+
+    def __init__(
+        self,
+        client: Optional[PostgresClient] = None,
+        progress: Optional[ProgressCallback] = None,
+        progress_every: int = 10000,
+    ):
+        """
+        Initializes the importer.
+
+        Args:
+            client (PostgresClient, optional): Database client. Defaults to the singleton.
+            progress (callable, optional): Called as ``progress(target, rows_streamed)``
+                every ``progress_every`` rows and once when streaming ends.
+            progress_every (int): Reporting interval in rows. Defaults to 10000.
+        """
+        self._client = client or PostgresClient()
+        self._progress = progress
+        self._progress_every = progress_every
+
+    def import_rows(self, target: str, rows: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Loads rows into a target table.
+
+        Args:
+            target (str): One of TARGETS.
+            rows (Iterable[dict]): Rows keyed by the target's staging columns.
+
+        Returns:
+            dict: ``staged`` (rows streamed) and ``merged`` (rows written by
+            the final merge statement).
+
+        Raises:
+            ValueError: If the target is unknown.
+        """
+        if target not in _TARGETS:
+            raise ValueError(f"Unknown import target '{target}'")
+        columns, statements = _TARGETS[target]
+        staging = f"_import_{target}"
+        names = [name for name, _ in columns]
+
+        def on_row(count: int) -> None:
+            if self._progress and count % self._progress_every == 0:
+                self._progress(target, count)
+
+        stream = _CsvCopyStream(rows, names, on_row)
+        connection = self._client._engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(
+                f"CREATE TEMP TABLE {staging} (_row bigserial, "
+                f"{', '.join(f'{n} {t}' for n, t in columns)}) ON COMMIT DROP"
+            )
+            cursor.copy_expert(
+                f"COPY {staging} ({', '.join(names)}) FROM STDIN WITH (FORMAT csv)",
+                stream,
+            )
+            if self._progress:
+                self._progress(target, stream.count)
+            merged = 0
+            for statement in statements:
+                cursor.execute(
+                    statement.format(
+                        staging=staging,
+                        person_id=_PERSON_ID,
+                        person_joins=_PERSON_JOINS,
+                    )
+                )
+                merged = cursor.rowcount
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+        return {"staged": stream.count, "merged": merged}
+
+    def import_file(self, target: str, path: str) -> Dict[str, int]:
+        """
+        Loads a CSV (with header) or NDJSON (.ndjson/.jsonl) file into a target.
+
+        Args:
+            target (str): One of TARGETS.
+            path (str): Path to the input file.
+
+        Returns:
+            dict: See import_rows.
+        """
+        reader = read_ndjson if path.endswith((".ndjson", ".jsonl")) else read_csv
+        return self.import_rows(target, reader(path))
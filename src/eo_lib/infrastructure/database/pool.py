@@ -0,0 +1,114 @@
+import bisect
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+
+class PoolStatistics:
+    """
+    Thread-safe collector of connection acquisition metrics.
+
+    Records how long callers waited to obtain a connection from the pool in a
+    fixed-bucket histogram, together with checkout and timeout counters.
+    """
+
+    # Upper bounds (in milliseconds) of the wait time histogram buckets.
+    BUCKETS_MS: Tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clears every counter and histogram bucket."""
+        with self._lock:
+            self._counts: List[int] = [0] * (len(self.BUCKETS_MS) + 1)
+            self._checkouts = 0
+            self._timeouts = 0
+            self._wait_total = 0.0
+            self._wait_max = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        """
+        Records a successful connection acquisition.
+
+        Args:
+            seconds (float): Time spent waiting for the connection.
+        """
+        index = bisect.bisect_left(self.BUCKETS_MS, seconds * 1000.0)
+        with self._lock:
+            self._counts[index] += 1
+            self._checkouts += 1
+            self._wait_total += seconds
+            self._wait_max = max(self._wait_max, seconds)
+
+    def record_timeout(self) -> None:
+        """Records a checkout that failed because the pool was exhausted."""
+        with self._lock:
+            self._timeouts += 1
+
+    def snapshot(self) -> Dict[str, object]:
+        """
+        Returns a point-in-time copy of the collected metrics.
+
+        Returns:
+            dict: Checkout/timeout counters, wait totals (seconds) and a
+            ``wait_time_histogram`` mapping bucket labels to counts.
+        """
+        with self._lock:
+            labels = [f"le_{int(b)}ms" for b in self.BUCKETS_MS] + ["gt_5000ms"]
+            return {
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "wait_time_total": self._wait_total,
+                "wait_time_max": self._wait_max,
+                "wait_time_histogram": dict(zip(labels, self._counts)),
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that measures connection acquisition time.
+
+    The time spent in ``connect()`` (queue wait, new connection and pre-ping)
+    is recorded in a PoolStatistics instance that survives pool recreation.
+    """
+
+    def __init__(self, *args, statistics: Optional[PoolStatistics] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.statistics = statistics or PoolStatistics()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.statistics.record_timeout()
+            raise
+        self.statistics.record_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.statistics = self.statistics
+        return pool
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Returns current pool occupancy merged with acquisition metrics.
+
+        Returns:
+            dict: ``pool_size``, ``checked_out``, ``checked_in``, ``overflow``
+            plus the keys returned by PoolStatistics.snapshot().
+        """
+        data: Dict[str, object] = {
+            "pool_size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": self.overflow(),
+        }
+        data.update(self.statistics.snapshot())
+        return data
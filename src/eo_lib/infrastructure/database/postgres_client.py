@@ -1,7 +1,74 @@
-from sqlalchemy import create_engine, text
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker, Session, scoped_session
 from eo_lib.config import Config
 from eo_lib.domain.base import Base
+from eo_lib.infrastructure.database.pool import InstrumentedQueuePool
+from eo_lib.infrastructure.database.replicas import ReplicaRouter
+
+R = TypeVar("R")
+
+# Session bound by an active session_scope() in the current thread/task.
+_scoped_session: ContextVar[Optional[Session]] = ContextVar(
+    "eo_lib_scoped_session", default=None
+)
+# Replica chosen for the read running in the current thread/task.
+_replica_engine: ContextVar[Optional[Engine]] = ContextVar(
+    "eo_lib_replica_engine", default=None
+)
+# Session of the replica read running in the current thread/task.
+_read_session: ContextVar[Optional[Session]] = ContextVar(
+    "eo_lib_read_session", default=None
+)
+# Set by primary_reads() while reads must not go to a replica.
+_primary_reads: ContextVar[bool] = ContextVar("eo_lib_primary_reads", default=False)
+
+
+class RoutingSession(Session):
+    """
+    Session that sends the SELECTs of a replica read to the chosen replica.
+
+    Everything else (flushes, refreshes after writes, lazy loads outside
+    ``PostgresClient.run_read``) uses the primary engine.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        replica = _replica_engine.get()
+        if replica is not None and not self._flushing and getattr(
+            clause, "is_select", False
+        ):
+            return replica
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+class UnitOfWorkSession(Session):
+    """
+    Session whose commits are deferred to the end of a unit of work.
+
+    Repositories commit after every write; inside a unit of work those commits
+    only flush, so the whole batch runs in one transaction that session_scope()
+    commits once. A rollback requested by a failed operation marks the batch
+    so that it can no longer be committed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.defer_commits = True
+        self.rolled_back = False
+
+    def commit(self) -> None:
+        if self.defer_commits:
+            self.flush()
+        else:
+            super().commit()
+
+    def rollback(self) -> None:
+        if self.defer_commits:
+            self.rolled_back = True
+        super().rollback()
 
 
 class PostgresClient:
@@ -15,6 +82,9 @@ class PostgresClient:
     _instance = None
     _engine = None
     _SessionLocal = None
+    _ReadSessionLocal = None
+    _UnitOfWorkSession = None
+    _replicas: Optional[ReplicaRouter] = None
 
     def __new__(cls):
         """
@@ -34,10 +104,164 @@ class PostgresClient:
         Uses configuration from the Config class.
         """
         db_url = Config.get_database_url()
-        self._engine = create_engine(db_url, echo=False)
+        self._engine = create_engine(db_url, echo=False, **self._engine_options(db_url))
         self._SessionLocal = scoped_session(sessionmaker(
-            autocommit=False, autoflush=False, bind=self._engine, expire_on_commit=False
+            class_=RoutingSession,
+            autoflush=False,
+            bind=self._engine,
+            expire_on_commit=False,
+        ))
+        # Replica reads get their own per-thread session, so what they load
+        # never enters the identity map that writes are flushed from.
+        self._ReadSessionLocal = scoped_session(sessionmaker(
+            class_=RoutingSession,
+            autoflush=False,
+            bind=self._engine,
+            expire_on_commit=False,
         ))
+        self._UnitOfWorkSession = sessionmaker(
+            class_=UnitOfWorkSession,
+            autoflush=False,
+            bind=self._engine,
+            expire_on_commit=False,
+        )
+        replica_urls = Config.get_replica_urls()
+        self._replicas = None
+        if replica_urls:
+            self._replicas = ReplicaRouter(
+                [
+                    create_engine(url, echo=False, **self._engine_options(url))
+                    for url in replica_urls
+                ],
+                Config.DB_REPLICA_RETRY_INTERVAL,
+            )
+
+    @staticmethod
+    def _engine_options(db_url: str) -> Dict[str, Any]:
+        """
+        Builds the pool keyword arguments for create_engine from Config.
+
+        SQLite keeps SQLAlchemy's default pooling, since its pools do not
+        accept sizing arguments.
+
+        Args:
+            db_url (str): The database connection string.
+
+        Returns:
+            dict: Keyword arguments for create_engine.
+        """
+        if make_url(db_url).get_backend_name() == "sqlite":
+            return {}
+
+        settings = Config.get_pool_settings()
+        options: Dict[str, Any] = {
+            "poolclass": InstrumentedQueuePool,
+            "pool_size": settings["pool_size"],
+            "max_overflow": settings["max_overflow"],
+            "pool_timeout": settings["pool_timeout"],
+            "pool_recycle": settings["pool_recycle"],
+            "pool_pre_ping": settings["pool_pre_ping"],
+        }
+        if settings["statement_timeout_ms"] > 0:
+            options["connect_args"] = {
+                "options": f"-c statement_timeout={settings['statement_timeout_ms']}"
+            }
+        return options
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Returns connection pool telemetry for monitoring and pool sizing.
+
+        Returns:
+            dict: Pool occupancy (pool_size, checked_out, checked_in, overflow),
+            checkout/timeout counters and the acquisition wait time histogram.
+            Only ``status`` is reported for pools that are not instrumented.
+        """
+        pool = self._engine.pool
+        if isinstance(pool, InstrumentedQueuePool):
+            return pool.stats()
+        return {"status": pool.status()}
+
+    def get_replica_status(self) -> List[Dict[str, Any]]:
+        """
+        Reports the health of the configured read replicas.
+
+        Returns:
+            list: ``url`` and ``healthy`` per replica; empty without replicas.
+        """
+        return self._replicas.status() if self._replicas else []
+
+    def run_read(self, operation: Callable[[], R]) -> R:
+        """
+        Runs a repository read on the next healthy replica.
+
+        Reads stay on the primary inside a session_scope(), so a unit of
+        work always sees its own writes, inside primary_reads(), and when no
+        replica is configured or healthy. A replica read runs in the
+        thread's read session rather than the session writes use, so its
+        possibly stale objects are never flushed back to the primary. A
+        replica that fails with a connection-level error is marked down and
+        the read is retried once on the primary.
+
+        Args:
+            operation (Callable[[], R]): The read; it must use
+                ``current_session()`` for its queries.
+
+        Returns:
+            R: The operation's result.
+        """
+        if (
+            self._replicas is None
+            or _scoped_session.get() is not None
+            or _primary_reads.get()
+        ):
+            return operation()
+        replica = self._replicas.choose()
+        if replica is None:
+            return operation()
+
+        session = self._ReadSessionLocal()
+        session_token = _read_session.set(session)
+        try:
+            token = _replica_engine.set(replica)
+            try:
+                result = operation()
+            except (exc.OperationalError, exc.InterfaceError):
+                failed = True
+            else:
+                failed = False
+            finally:
+                _replica_engine.reset(token)
+            if failed:
+                self._replicas.mark_down(replica)
+                session.rollback()
+                result = operation()
+            # Ends the read transaction so the connection is released.
+            session.commit()
+            return result
+        except Exception:
+            # Any other error would leave the thread's read session aborted.
+            session.rollback()
+            raise
+        finally:
+            _read_session.reset(session_token)
+
+    @staticmethod
+    @contextmanager
+    def primary_reads() -> Iterator[None]:
+        """
+        Sends every read of the block to the primary, in the writer session.
+
+        Wrap the reads of a read-modify-write in it: the objects then come
+        from the primary and live in the session the write is flushed from,
+        so a lagging replica cannot overwrite newer data. Only a context
+        flag is set; no client or connection is created.
+        """
+        token = _primary_reads.set(True)
+        try:
+            yield
+        finally:
+            _primary_reads.reset(token)
 
     def get_session(self) -> Session:
         """
@@ -51,6 +275,79 @@ class PostgresClient:
         assert self._SessionLocal is not None
         return self._SessionLocal()
 
+    def current_session(self) -> Session:
+        """
+        Resolves the Session that repositories should use right now.
+
+        Inside a session_scope() this is the scope's Session, during a replica
+        read the thread's read Session; otherwise it is the calling thread's
+        scoped Session, so threads never share one.
+
+        Returns:
+            Session: The active database session.
+        """
+        session = _scoped_session.get()
+        if session is None:
+            session = _read_session.get()
+        if session is not None:
+            return session
+        return self.get_session()
+
+    @staticmethod
+    def scope_session() -> Optional[Session]:
+        """
+        Returns the Session of the active session_scope(), if any.
+
+        Writes made through it are only committed when the scope exits.
+        """
+        return _scoped_session.get()
+
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """
+        Runs a block of work in one Session and one transaction.
+
+        Repositories resolve their session lazily, so every repository call
+        made inside the block shares this Session. Their per-call commits are
+        turned into flushes and the transaction is committed once when the
+        block exits; any error rolls back the whole batch. The Session is
+        closed on exit, releasing its identity map and connection.
+        Nested scopes join the outermost one.
+
+        Yields:
+            Session: The Session bound to the scope.
+
+        Raises:
+            RuntimeError: If an operation inside the block failed and rolled
+                back the batch, but the error was swallowed by the caller.
+        """
+        active = _scoped_session.get()
+        if active is not None:
+            yield active
+            return
+
+        if not self._UnitOfWorkSession:
+            self._initialize()
+        assert self._UnitOfWorkSession is not None
+        session = self._UnitOfWorkSession()
+        token = _scoped_session.set(session)
+        try:
+            yield session
+            if session.rolled_back:
+                raise RuntimeError(
+                    "Unit of work was rolled back by a failed operation; "
+                    "nothing was committed"
+                )
+            session.defer_commits = False
+            session.commit()
+        except Exception:
+            session.defer_commits = False
+            session.rollback()
+            raise
+        finally:
+            _scoped_session.reset(token)
+            session.close()
+
     def create_tables(self):
         """
         Utility method to create all database tables defined in the ORM models.
@@ -0,0 +1,86 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+
+class ReplicaRouter:
+    """
+    Round-robin selection over read-replica engines with health checks.
+
+    A replica that fails a read is marked down and skipped. Once its retry
+    interval has elapsed it is probed with ``SELECT 1`` before it receives
+    reads again; a failed probe keeps it down for another interval.
+    """
+
+    def __init__(self, engines: Sequence[Engine], retry_interval: float = 30.0):
+        """
+        Initializes the router.
+
+        Args:
+            engines (Sequence[Engine]): One engine per replica.
+            retry_interval (float): Seconds a failed replica stays out of the
+                rotation before it is probed again. Defaults to 30.
+        """
+        self._engines = list(engines)
+        self._retry_interval = retry_interval
+        self._down_until: Dict[Engine, float] = {}
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @property
+    def engines(self) -> List[Engine]:
+        """The replica engines, in rotation order."""
+        return list(self._engines)
+
+    def choose(self) -> Optional[Engine]:
+        """
+        Returns the next healthy replica, or None when all are down.
+        """
+        for _ in range(len(self._engines)):
+            with self._lock:
+                engine = self._engines[self._next]
+                self._next = (self._next + 1) % len(self._engines)
+                down_until = self._down_until.get(engine)
+            if down_until is None:
+                return engine
+            if time.monotonic() >= down_until and self.probe(engine):
+                return engine
+        return None
+
+    def probe(self, engine: Engine) -> bool:
+        """
+        Checks a replica with ``SELECT 1`` and updates its health.
+
+        Returns:
+            bool: True if the replica answered.
+        """
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        except Exception:
+            self.mark_down(engine)
+            return False
+        with self._lock:
+            self._down_until.pop(engine, None)
+        return True
+
+    def mark_down(self, engine: Engine) -> None:
+        """Takes a replica out of the rotation for one retry interval."""
+        with self._lock:
+            self._down_until[engine] = time.monotonic() + self._retry_interval
+
+    def status(self) -> List[Dict[str, Any]]:
+        """
+        Reports the health of every replica.
+
+        Returns:
+            list: ``url`` (password masked) and ``healthy`` per replica.
+        """
+        with self._lock:
+            down = set(self._down_until)
+        return [
+            {"url": engine.url.render_as_string(), "healthy": engine not in down}
+            for engine in self._engines
+        ]
@@ -1,7 +1,9 @@
 from libbase.infrastructure.sql_repository import (
     GenericSqlRepository as GenericPostgresRepository,
 )
+from .memory_indexes import IndexSpec
 from .memory_repositories import (
+    InMemoryRepository,
     InMemoryPersonRepository,
     InMemoryTeamRepository,
     InMemoryInitiativeRepository,
@@ -9,7 +11,9 @@ from .memory_repositories import (
     InMemoryOrganizationRepository,
     InMemoryOrgUnitRepository,
 )
+from .memory_store import MemoryStore
 from .json_repositories import (
+    JsonRepository,
     JsonPersonRepository,
     JsonTeamRepository,
     JsonInitiativeRepository,
@@ -17,31 +21,55 @@ from .json_repositories import (
     JsonOrganizationRepository,
     JsonOrgUnitRepository,
 )
+from .postgres_repository import PostgresRepository
 from .postgres_person_repository import PostgresPersonRepository
 from .postgres_initiative_repository import PostgresInitiativeRepository
 from .postgres_initiative_type_repository import PostgresInitiativeTypeRepository
 from .postgres_team_repository import PostgresTeamRepository
 from .postgres_organization_repository import PostgresOrganizationRepository
 from .postgres_organizational_unit_repository import PostgresOrganizationalUnitRepository
+from .async_repositories import (
+    AsyncPostgresRepository,
+    AsyncPostgresPersonRepository,
+    AsyncPostgresTeamRepository,
+    AsyncPostgresInitiativeRepository,
+    AsyncPostgresInitiativeTypeRepository,
+    AsyncPostgresOrganizationRepository,
+    AsyncPostgresOrganizationalUnitRepository,
+    AsyncRepositoryAdapter,
+)
 
 __all__ = [
     "GenericPostgresRepository",
+    "IndexSpec",
+    "InMemoryRepository",
     "InMemoryPersonRepository",
     "InMemoryTeamRepository",
     "InMemoryInitiativeRepository",
     "InMemoryInitiativeTypeRepository",
     "InMemoryOrganizationRepository",
     "InMemoryOrgUnitRepository",
+    "MemoryStore",
+    "JsonRepository",
     "JsonPersonRepository",
     "JsonTeamRepository",
     "JsonInitiativeRepository",
     "JsonInitiativeTypeRepository",
     "JsonOrganizationRepository",
     "JsonOrgUnitRepository",
+    "PostgresRepository",
     "PostgresPersonRepository",
     "PostgresInitiativeRepository",
     "PostgresInitiativeTypeRepository",
     "PostgresTeamRepository",
     "PostgresOrganizationRepository",
     "PostgresOrganizationalUnitRepository",
+    "AsyncPostgresRepository",
+    "AsyncPostgresPersonRepository",
+    "AsyncPostgresTeamRepository",
+    "AsyncPostgresInitiativeRepository",
+    "AsyncPostgresInitiativeTypeRepository",
+    "AsyncPostgresOrganizationRepository",
+    "AsyncPostgresOrganizationalUnitRepository",
+    "AsyncRepositoryAdapter",
 ]
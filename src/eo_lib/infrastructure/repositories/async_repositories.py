@@ -0,0 +1,646 @@
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+from sqlalchemy import Select, delete, func, inspect, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from eo_lib.config import Config
+from eo_lib.domain.entities import (
+    Initiative,
+    InitiativeType,
+    Organization,
+    OrganizationalUnit,
+    OrganizationalUnitClosure,
+    Person,
+    PersonEmail,
+    Team,
+    TeamMember,
+)
+from eo_lib.domain.hierarchy import HierarchyNode, InitiativeRollup
+from eo_lib.domain.repositories import Membership
+from eo_lib.domain.repositories.async_repository import AsyncRepositoryInterface
+from eo_lib.domain.query import UNSET, OrderBy, Where
+from eo_lib.domain.upsert import UPSERT_SPECS, UpsertResult
+
+from eo_lib.infrastructure.batching import chunked
+from eo_lib.infrastructure.database.async_client import AsyncPostgresClient
+from eo_lib.infrastructure.repositories.hierarchy import (
+    check_max_depth,
+    rollups_from_rows,
+)
+from eo_lib.infrastructure.repositories.listing import (
+    check_listing_args,
+    check_query_args,
+    missing_anchor,
+)
+from eo_lib.infrastructure.repositories.load_profiles import FULL, load_options
+from eo_lib.infrastructure.repositories.role_registry import RoleRegistry
+from eo_lib.infrastructure.repositories.sql_statements import (
+    anchor_statement,
+    closure_attach_statement,
+    closure_contains_statement,
+    closure_detach_statement,
+    closure_parent_statement,
+    closure_rebuild_statement,
+    closure_self_statement,
+    closure_unlink_statement,
+    email_changes,
+    first_person_per_email,
+    hierarchy_statement,
+    member_rows,
+    members_delete_statement,
+    members_insert_statement,
+    members_move_statement,
+    natural_ids_statement,
+    page_statement,
+    parse_path,
+    person_emails_prune_statement,
+    person_emails_statement,
+    person_emails_upsert_statement,
+    persons_by_email_statement,
+    project_statement,
+    query_statement,
+    rollup_statement,
+    stream_statement,
+    upsert_statement,
+)
+
+T = TypeVar("T")
+
+
+class AsyncPostgresRepository(AsyncRepositoryInterface[T]):
+    """
+    Base class for the asyncio PostgreSQL repositories.
+
+    Every operation runs in the active ``AsyncPostgresClient.session_scope()``
+    or in a short-lived session of its own. Objects are returned detached, so
+    nothing may be lazy loaded afterwards: the relationships declared
+    ``lazy="joined"`` plus the class's ``_preload`` are always loaded.
+    """
+
+    # Relationships loaded with selectinload in addition to the joined ones.
+    _preload: Tuple[str, ...] = ()
+
+    def __init__(self, model: Type[T]):
+        """
+        Initializes the repository for a model.
+
+        Args:
+            model (Type[T]): The mapped entity class.
+        """
+        self._model_class = model
+
+    @property
+    def _client(self) -> AsyncPostgresClient:
+        """The async database client, resolved per operation."""
+        return AsyncPostgresClient()
+
+    def _loaded_attributes(self) -> List[str]:
+        """Relationships that are loaded with every entity."""
+        return [
+            rel.key
+            for rel in inspect(self._model_class).relationships
+            if rel.lazy == "joined" or rel.key in self._preload
+        ]
+
+    def _read_options(self, load_profile: Optional[str]) -> List[Any]:
+        """Loader options for a read under a load profile."""
+        model = self._model_class
+        if load_profile in (None, FULL):
+            return [selectinload(getattr(model, key)) for key in self._preload]
+        return load_options(model, load_profile)
+
+    def _read_statement(self, load_profile: Optional[str]) -> Select:
+        """Selects entities under a load profile."""
+        options = self._read_options(load_profile)
+        return select(self._model_class).options(*options)
+
+    async def _profiled(
+        self, session: AsyncSession, statement: Select, load_profile: Optional[str]
+    ) -> Select:
+        """
+        Reloads existing objects for an explicit profile, after a flush.
+
+        Inside a transaction scope, an object first read under another profile
+        is then reloaded as asked; default reads keep the objects in the
+        identity map, unflushed edits included.
+        """
+        if load_profile is None:
+            return statement
+        await session.flush()
+        return statement.execution_options(populate_existing=True)
+
+    async def add(self, entity: T) -> T:
+        """Inserts an entity and loads its generated ID and relationships."""
+        async with self._client.transaction() as session:
+            session.add(entity)
+            await session.flush()
+            await session.refresh(entity, self._loaded_attributes())
+        return entity
+
+    async def get_by_id(
+        self, id: int, load_profile: Optional[str] = None
+    ) -> Optional[T]:
+        """Retrieves an entity by ID, optionally with a named load profile."""
+        model = self._model_class
+        statement = self._read_statement(load_profile).where(model.id == id)
+        async with self._client.session() as session:
+            statement = await self._profiled(session, statement, load_profile)
+            return (await session.scalars(statement)).unique().first()
+
+    async def get_all(self, load_profile: Optional[str] = None) -> List[T]:
+        """Retrieves all entities, optionally with a named load profile."""
+        statement = self._read_statement(load_profile)
+        async with self._client.session() as session:
+            statement = await self._profiled(session, statement, load_profile)
+            return list((await session.scalars(statement)).unique())
+
+    async def update(self, entity: T) -> T:
+        """Merges a (possibly detached) entity and persists its changes."""
+        async with self._client.transaction() as session:
+            merged = await session.merge(entity)
+            await session.flush()
+            await session.refresh(merged, self._loaded_attributes())
+        return merged
+
+    async def delete(self, id: int) -> bool:
+        """Deletes an entity by ID; returns False if it does not exist."""
+        async with self._client.transaction() as session:
+            entity = await session.get(self._model_class, id)
+            if entity is None:
+                return False
+            await session.delete(entity)
+        return True
+
+    async def list_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        order_by: str = "id",
+        load_profile: Optional[str] = None,
+        after_value: Any = UNSET,
+    ) -> List[T]:
+        """Retrieves one page using a keyset (seek) predicate instead of OFFSET."""
+        model = self._model_class
+        check_listing_args(model, limit, order_by)
+        options = self._read_options(load_profile)
+        async with self._client.session() as session:
+            anchor = None if after_value is UNSET else after_value
+            if after_id is not None and order_by != "id" and after_value is UNSET:
+                row = (
+                    await session.execute(anchor_statement(model, order_by, after_id))
+                ).first()
+                if row is None:
+                    raise missing_anchor(after_id)
+                anchor = row[0]
+            statement = page_statement(
+                model, order_by, limit, after_id, anchor, options
+            )
+            statement = await self._profiled(session, statement, load_profile)
+            return list((await session.scalars(statement)).unique())
+
+    async def iter_all(
+        self, batch_size: int = 1000, load_profile: Optional[str] = None
+    ) -> AsyncIterator[T]:
+        """Streams the table with ``yield_per``, one batch per round trip."""
+        statement = stream_statement(
+            self._model_class, batch_size, load_profile, self._preload
+        )
+        async with self._client.session() as session:
+            async for entity in await session.stream_scalars(statement):
+                yield entity
+
+    async def find(
+        self,
+        where: Optional[Where] = None,
+        order_by: OrderBy = "id",
+        limit: Optional[int] = None,
+        offset: int = 0,
+        load_profile: Optional[str] = None,
+    ) -> List[T]:
+        """Translates the conditions, sort and slice into one SELECT."""
+        model = self._model_class
+        conditions, ordering = check_query_args(model, where, order_by, limit, offset)
+        options = self._read_options(load_profile)
+        statement = query_statement(model, conditions, ordering, limit, offset, options)
+        async with self._client.session() as session:
+            statement = await self._profiled(session, statement, load_profile)
+            return list((await session.scalars(statement)).unique())
+
+    async def project(
+        self,
+        fields: Sequence[str],
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Selects only the requested columns in one statement."""
+        statement = project_statement(self._model_class, fields, after_id, limit)
+        async with self._client.session() as session:
+            result = await session.execute(statement)
+            return [dict(row) for row in result.mappings()]
+
+    async def _upsert_rows(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int
+    ) -> UpsertResult:
+        """Upserts by natural key with one INSERT ... ON CONFLICT per chunk."""
+        model = self._model_class
+        key, fields = UPSERT_SPECS[model]
+        inserted = updated = unchanged = 0
+        async with self._client.transaction() as session:
+            dialect_name = session.sync_session.get_bind().dialect.name
+            for chunk in chunked(rows, chunk_size):
+                keys = [row[key] for row in chunk]
+                statement = natural_ids_statement(model, key, keys)
+                existing = dict((await session.execute(statement)).all())
+                statement = upsert_statement(dialect_name, model, key, fields, chunk)
+                written = dict((await session.execute(statement)).all())
+                changed = written.keys() | await self._upsert_children(
+                    session, chunk, {**existing, **written}
+                )
+                new = len(written.keys() - existing.keys())
+                inserted += new
+                updated += len(changed) - new
+                unchanged += len(chunk) - len(changed)
+        return UpsertResult(inserted, updated, unchanged)
+
+    async def _upsert_children(
+        self, session: AsyncSession, chunk: List[Dict[str, Any]], ids: Dict[Any, int]
+    ) -> Set[Any]:
+        """Writes the collections carried by upserted rows; see PostgresRepository."""
+        return set()
+
+
+class AsyncPostgresPersonRepository(AsyncPostgresRepository[Person]):
+    """
+    Asyncio PostgreSQL implementation of the Person Repository.
+    """
+
+    def __init__(self):
+        super().__init__(Person)
+
+    async def add_many(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> List[int]:
+        """
+        Inserts persons and emails with multi-row INSERT ... RETURNING per chunk.
+
+        All chunks are committed together.
+        """
+        ids: List[int] = []
+        async with self._client.transaction() as session:
+            for chunk in chunked(rows, chunk_size):
+                person_ids = (
+                    await session.scalars(
+                        insert(Person).returning(
+                            Person.id, sort_by_parameter_order=True
+                        ),
+                        [
+                            {
+                                "name": row["name"],
+                                "identification_id": row.get("identification_id"),
+                                "birthday": row.get("birthday"),
+                            }
+                            for row in chunk
+                        ],
+                    )
+                ).all()
+                emails = [
+                    {"person_id": person_id, "email": email}
+                    for person_id, row in zip(person_ids, chunk)
+                    for email in row.get("emails") or []
+                ]
+                if emails:
+                    await session.execute(insert(PersonEmail), emails)
+                ids.extend(person_ids)
+        return ids
+
+    async def upsert_many(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """Upserts persons by identification_id and their emails by address."""
+        return await self._upsert_rows(rows, chunk_size)
+
+    async def _upsert_children(
+        self, session: AsyncSession, chunk: List[Dict[str, Any]], ids: Dict[Any, int]
+    ) -> Set[Any]:
+        """Replaces the email sets that differ, moving addresses between persons."""
+        keys: Dict[int, Any] = {}
+        wanted: Dict[int, List[str]] = {}
+        for row in chunk:
+            person_id = ids[row["identification_id"]]
+            keys[person_id] = row["identification_id"]
+            if row.get("emails") is not None:
+                wanted[person_id] = row["emails"]
+        if not wanted:
+            return set()
+        changed = await self._write_emails(session, wanted)
+        return {keys[person_id] for person_id in changed}
+
+    async def get_by_emails(self, emails: Sequence[str]) -> Dict[str, Person]:
+        """Resolves the addresses with one query on the ``lower(email)`` index."""
+        if not emails:
+            return {}
+        statement = persons_by_email_statement(emails)
+        async with self._client.session() as session:
+            return first_person_per_email((await session.execute(statement)).unique())
+
+    async def set_emails_many(self, emails: Mapping[int, Sequence[str]]) -> int:
+        """Writes only the email differences: one SELECT, DELETE and upsert."""
+        async with self._client.transaction() as session:
+            changed = await self._write_emails(session, emails)
+        return len(changed)
+
+    async def _write_emails(
+        self, session: AsyncSession, wanted: Mapping[int, Sequence[str]]
+    ) -> List[int]:
+        """Replaces the email sets that differ; returns those persons' IDs."""
+        stored = await session.execute(person_emails_statement(wanted))
+        changed, owners = email_changes(wanted, stored)
+        if changed:
+            await session.execute(person_emails_prune_statement(changed, owners))
+        if owners:
+            dialect_name = session.sync_session.get_bind().dialect.name
+            await session.execute(person_emails_upsert_statement(dialect_name, owners))
+        return changed
+
+
+class AsyncPostgresTeamRepository(AsyncPostgresRepository[Team]):
+    """
+    Asyncio PostgreSQL implementation of the Team Repository.
+    """
+
+    def __init__(self):
+        super().__init__(Team)
+
+    async def add_member(self, member: TeamMember) -> TeamMember:
+        """Persists a new TeamMember association in the database."""
+        async with self._client.transaction() as session:
+            if member.role_name and member.role is None:
+                registry = RoleRegistry.for_session(session.sync_session)
+                role_ids = await registry.resolve_async(session, [member.role_name])
+                member.role_id = role_ids[member.role_name]
+            session.add(member)
+            await session.flush()
+            await session.refresh(member)
+        return member
+
+    async def remove_member(self, member_id: int) -> bool:
+        """Deletes a TeamMember association from the database."""
+        async with self._client.transaction() as session:
+            member = await session.get(TeamMember, member_id)
+            if member is None:
+                return False
+            await session.delete(member)
+        return True
+
+    async def get_members(self, team_id: int) -> List[TeamMember]:
+        """Retrieves all membership associations for a specific Team."""
+        statement = select(TeamMember).where(TeamMember.team_id == team_id)
+        async with self._client.session() as session:
+            return list((await session.scalars(statement)).unique())
+
+    async def add_members(
+        self, team_id: int, members: Sequence[Membership]
+    ) -> List[int]:
+        """Inserts every membership with one multi-row INSERT ... RETURNING."""
+        if not members:
+            return []
+        async with self._client.transaction() as session:
+            registry = RoleRegistry.for_session(session.sync_session)
+            role_ids = await registry.resolve_async(
+                session, (role for _, role, _, _ in members if role)
+            )
+            ids = await session.scalars(
+                members_insert_statement(), member_rows(team_id, members, role_ids)
+            )
+            return list(ids)
+
+    async def remove_members(self, member_ids: Iterable[int]) -> int:
+        """Deletes the associations with one DELETE ... WHERE id IN (...)."""
+        ids = list(member_ids)
+        if not ids:
+            return 0
+        async with self._client.transaction() as session:
+            return (await session.execute(members_delete_statement(ids))).rowcount
+
+    async def move_members(
+        self, from_team_id: int, to_team_id: int, person_ids: Iterable[int]
+    ) -> int:
+        """Re-points the memberships with one UPDATE."""
+        ids = list(person_ids)
+        if not ids:
+            return 0
+        statement = members_move_statement(from_team_id, to_team_id, ids)
+        async with self._client.transaction() as session:
+            return (await session.execute(statement)).rowcount
+
+    async def upsert_many(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """Upserts teams by name."""
+        return await self._upsert_rows(rows, chunk_size)
+
+
+class AsyncPostgresInitiativeRepository(AsyncPostgresRepository[Initiative]):
+    """
+    Asyncio PostgreSQL implementation of the Initiative Repository.
+    """
+
+    _preload = ("initiative_type",)
+
+    def __init__(self):
+        super().__init__(Initiative)
+
+    async def get_rollups(
+        self, initiative_ids: Sequence[int]
+    ) -> Dict[int, InitiativeRollup]:
+        """Rolls up every requested subtree with one recursive query."""
+        if not initiative_ids:
+            return {}
+        statement = rollup_statement(list(initiative_ids))
+        async with self._client.session() as session:
+            return rollups_from_rows(await session.execute(statement))
+
+
+class AsyncPostgresInitiativeTypeRepository(AsyncPostgresRepository[InitiativeType]):
+    """
+    Asyncio PostgreSQL implementation of the InitiativeType Repository.
+    """
+
+    def __init__(self):
+        super().__init__(InitiativeType)
+
+    async def get_by_name(self, name: str) -> Optional[InitiativeType]:
+        """Retrieves an initiative type by its unique name."""
+        statement = select(InitiativeType).where(InitiativeType.name == name)
+        async with self._client.session() as session:
+            return (await session.scalars(statement)).first()
+
+
+class AsyncPostgresOrganizationRepository(AsyncPostgresRepository[Organization]):
+    """
+    Asyncio PostgreSQL implementation of the Organization Repository.
+    """
+
+    def __init__(self):
+        super().__init__(Organization)
+
+    async def upsert_many(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """Upserts organizations by name."""
+        return await self._upsert_rows(rows, chunk_size)
+
+
+class AsyncPostgresOrganizationalUnitRepository(
+    AsyncPostgresRepository[OrganizationalUnit]
+):
+    """
+    Asyncio PostgreSQL implementation of the Organizational Unit Repository.
+
+    Maintains the closure table like PostgresOrganizationalUnitRepository.
+    """
+
+    def __init__(self, closure: Optional[bool] = None):
+        super().__init__(OrganizationalUnit)
+        self._use_closure = Config.ORG_UNIT_CLOSURE if closure is None else closure
+
+    async def add(self, entity: OrganizationalUnit) -> OrganizationalUnit:
+        """Inserts a unit and, if enabled, its closure pairs."""
+        if not self._use_closure:
+            return await super().add(entity)
+        async with self._client.session_scope() as session:
+            await super().add(entity)
+            await session.execute(closure_self_statement(entity.id))
+            if entity.parent_id is not None:
+                await session.execute(
+                    closure_attach_statement(entity.id, entity.parent_id)
+                )
+        return entity
+
+    async def update(self, entity: OrganizationalUnit) -> OrganizationalUnit:
+        """Updates a unit and, if it was re-parented, moves its closure pairs."""
+        if not self._use_closure:
+            return await super().update(entity)
+        async with self._client.session_scope() as session:
+            old_parent = await session.scalar(closure_parent_statement(entity.id))
+            merged = await super().update(entity)
+            if old_parent != entity.parent_id:
+                await session.execute(closure_detach_statement(entity.id))
+                if entity.parent_id is not None:
+                    await session.execute(
+                        closure_attach_statement(entity.id, entity.parent_id)
+                    )
+        return merged
+
+    async def delete(self, id: int) -> bool:
+        """Deletes a unit after removing its closure pairs."""
+        if not self._use_closure:
+            return await super().delete(id)
+        async with self._client.session_scope() as session:
+            await session.execute(closure_detach_statement(id))
+            await session.execute(closure_unlink_statement(id))
+            return await super().delete(id)
+
+    async def is_within(self, unit_id: int, ancestor_id: int) -> bool:
+        """One primary-key lookup in the closure table, or a recursive CTE."""
+        if not self._use_closure:
+            ancestry = await self.get_ancestry(unit_id)
+            return any(node.entity.id == ancestor_id for node in ancestry)
+        statement = closure_contains_statement(unit_id, ancestor_id)
+        async with self._client.session() as session:
+            return (await session.scalar(statement)) is not None
+
+    async def rebuild_closure(self) -> int:
+        """Replaces the closure table in one transaction."""
+        async with self._client.transaction() as session:
+            units = await session.scalar(select(func.count(OrganizationalUnit.id)))
+            await session.execute(delete(OrganizationalUnitClosure))
+            await session.execute(closure_rebuild_statement(units))
+            return await session.scalar(
+                select(func.count()).select_from(OrganizationalUnitClosure)
+            )
+
+    async def _walk(
+        self, unit_id: int, descending: bool, max_depth: Optional[int]
+    ) -> List[HierarchyNode]:
+        check_max_depth(max_depth)
+        statement = hierarchy_statement(
+            OrganizationalUnit, unit_id, descending, max_depth
+        )
+        async with self._client.session() as session:
+            result = await session.execute(statement)
+            return [
+                HierarchyNode(unit, depth, parse_path(path))
+                for unit, depth, path in result
+            ]
+
+    async def get_subtree(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """Retrieves a unit and its descendants with one recursive CTE."""
+        return await self._walk(unit_id, True, max_depth)
+
+    async def get_ancestry(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """Retrieves a unit and its ancestors with one recursive CTE."""
+        return await self._walk(unit_id, False, max_depth)
+
+
+class AsyncRepositoryAdapter:
+    """
+    Exposes an in-process repository (memory or JSON) through the asyncio API.
+
+    Every public method of the wrapped repository becomes a coroutine that
+    runs it inline, so the async services work on every storage strategy.
+    """
+
+    def __init__(self, repository: Any):
+        """
+        Wraps a synchronous repository.
+
+        Args:
+            repository: An InMemory* or Json* repository instance.
+        """
+        self._repository = repository
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._repository, name)
+        if not callable(attr):
+            return attr
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return attr(*args, **kwargs)
+
+        return call
+
+    async def add(self, entity: Any) -> Any:
+        """Adds an entity and returns it, as the asyncio interface requires."""
+        self._repository.add(entity)
+        return entity
+
+    async def update(self, entity: Any) -> Any:
+        """Updates an entity and returns it, as the asyncio interface requires."""
+        self._repository.update(entity)
+        return entity
+
+    async def iter_all(
+        self, batch_size: int = 1000, load_profile: Optional[str] = None
+    ) -> AsyncIterator[Any]:
+        """Iterates over the wrapped repository's iter_all."""
+        for entity in self._repository.iter_all(
+            batch_size=batch_size, load_profile=load_profile
+        ):
+            yield entity
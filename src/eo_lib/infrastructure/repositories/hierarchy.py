@@ -0,0 +1,299 @@
+from collections import defaultdict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+from eo_lib.config import Config
+from eo_lib.domain.hierarchy import HierarchyNode, InitiativeRollup
+
+# In-process traversals matching the recursive CTE of hierarchy_statement.
+
+
+def check_max_depth(max_depth: Optional[int]) -> None:
+    """
+    Validates a hierarchy depth limit.
+
+    Raises:
+        ValueError: If ``max_depth`` is negative.
+    """
+    if max_depth is not None and max_depth < 0:
+        raise ValueError("max_depth must not be negative")
+
+
+def _children_index(
+    entities: Iterable[Any],
+) -> Tuple[Dict[int, Any], Dict[Optional[int], List[Any]]]:
+    by_id: Dict[int, Any] = {}
+    children: Dict[Optional[int], List[Any]] = defaultdict(list)
+    for entity in entities:
+        by_id[entity.id] = entity
+        children[entity.parent_id].append(entity)
+    return by_id, children
+
+
+def _walk_down(
+    start: Any,
+    children_of: Callable[[int], Iterable[Any]],
+    max_depth: Optional[int] = None,
+) -> List[HierarchyNode]:
+    nodes = [HierarchyNode(start, 0, [start.id])]
+    level = nodes
+    visited = {start.id}
+    while level and (max_depth is None or level[0].depth < max_depth):
+        next_level = []
+        for node in level:
+            for child in children_of(node.entity.id):
+                if child.id not in visited:
+                    visited.add(child.id)
+                    next_level.append(
+                        HierarchyNode(child, node.depth + 1, node.path + [child.id])
+                    )
+        next_level.sort(key=lambda node: node.entity.id)
+        nodes.extend(next_level)
+        level = next_level
+    return nodes
+
+
+def rollup_entities(
+    initiatives: Iterable[Any], root_ids: Sequence[int]
+) -> Dict[int, InitiativeRollup]:
+    """
+    Aggregates initiative subtrees in process, matching ``rollup_statement``.
+
+    The children index is built once and shared by every root.
+    """
+    by_id, children = _children_index(initiatives)
+    rollups = {}
+    for root_id in root_ids:
+        if root_id not in by_id:
+            continue
+        nodes = _walk_down(by_id[root_id], lambda id: children.get(id, ()))
+        by_status: Dict[str, int] = defaultdict(int)
+        team_ids: Set[int] = set()
+        person_ids: Set[int] = set()
+        for node in nodes:
+            if node.depth > 0:
+                by_status[node.entity.status] += 1
+            team_ids.update(team.id for team in node.entity.teams)
+            person_ids.update(person.id for person in node.entity.persons)
+        rollups[root_id] = InitiativeRollup(
+            root_id,
+            len(nodes) - 1,
+            dict(by_status),
+            sorted(team_ids),
+            sorted(person_ids),
+        )
+    return rollups
+
+
+def rollups_from_rows(rows: Iterable[Any]) -> Dict[int, InitiativeRollup]:
+    """Folds the rows of ``rollup_statement`` into one rollup per root."""
+    totals: Dict[int, Dict[str, int]] = {}
+    teams: Dict[int, Set[int]] = defaultdict(set)
+    persons: Dict[int, Set[int]] = defaultdict(set)
+    for row in rows:
+        if row.team_id is not None:
+            teams[row.root_id].add(row.team_id)
+        elif row.person_id is not None:
+            persons[row.root_id].add(row.person_id)
+        else:
+            by_status = totals.setdefault(row.root_id, {})
+            if row.total:
+                by_status[row.status] = row.total
+    return {
+        root_id: InitiativeRollup(
+            root_id,
+            sum(by_status.values()),
+            by_status,
+            sorted(teams[root_id]),
+            sorted(persons[root_id]),
+        )
+        for root_id, by_status in totals.items()
+    }
+
+
+def _walk_up(
+    entity: Optional[Any],
+    get_parent: Callable[[int], Optional[Any]],
+    max_depth: Optional[int] = None,
+) -> List[HierarchyNode]:
+    nodes: List[HierarchyNode] = []
+    path: List[int] = []
+    while entity is not None and entity.id not in path:
+        path = path + [entity.id]
+        nodes.append(HierarchyNode(entity, len(path) - 1, path))
+        if max_depth is not None and len(path) > max_depth:
+            break
+        if entity.parent_id is None:
+            break
+        entity = get_parent(entity.parent_id)
+    return nodes
+
+
+class ClosureIndex:
+    """
+    In-process closure table: every (ancestor, descendant, depth) of a tree.
+
+    Both directions are indexed, so membership checks are one dict lookup
+    and moving a subtree touches only the pairs that cross its boundary.
+    """
+
+    def __init__(self):
+        self._ancestors: Dict[int, Dict[int, int]] = {}
+        self._descendants: Dict[int, Dict[int, int]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(ancestors) for ancestors in self._ancestors.values())
+
+    def contains(self, unit_id: int, ancestor_id: int) -> bool:
+        """True if ``unit_id`` is ``ancestor_id`` or below it."""
+        return ancestor_id in self._ancestors.get(unit_id, ())
+
+    def parent_of(self, unit_id: int) -> Optional[int]:
+        """The indexed parent of a unit, or None for a root."""
+        ancestors = self._ancestors.get(unit_id, {})
+        return next((a for a, depth in ancestors.items() if depth == 1), None)
+
+    def link(self, unit_id: int, parent_id: Optional[int]) -> None:
+        """Adds a new leaf unit under ``parent_id``."""
+        self._ancestors[unit_id] = {unit_id: 0}
+        self._descendants[unit_id] = {unit_id: 0}
+        if parent_id is not None:
+            self._attach(unit_id, parent_id)
+
+    def move(self, unit_id: int, parent_id: Optional[int]) -> None:
+        """Re-parents a unit together with its whole subtree."""
+        self._detach(unit_id)
+        if parent_id is not None:
+            self._attach(unit_id, parent_id)
+
+    def unlink(self, unit_id: int) -> None:
+        """Removes a unit; its descendants keep only the pairs among themselves."""
+        self._detach(unit_id)
+        for descendant in self._descendants.pop(unit_id, {}):
+            self._ancestors.get(descendant, {}).pop(unit_id, None)
+        self._ancestors.pop(unit_id, None)
+
+    def rebuild(self, entities: Iterable[Any]) -> int:
+        """
+        Recomputes every pair from the units' parent_id links.
+
+        Returns:
+            int: Number of pairs in the index.
+        """
+        parents = {entity.id: entity.parent_id for entity in entities}
+        self._ancestors = {}
+        self._descendants = {unit_id: {} for unit_id in parents}
+        for unit_id in parents:
+            ancestors: Dict[int, int] = {}
+            current: Optional[int] = unit_id
+            while current in parents and current not in ancestors:
+                ancestors[current] = len(ancestors)
+                self._descendants[current][unit_id] = ancestors[current]
+                current = parents[current]
+            self._ancestors[unit_id] = ancestors
+        return len(self)
+
+    def _attach(self, unit_id: int, parent_id: int) -> None:
+        above = dict(self._ancestors.get(parent_id, {}))
+        below = dict(self._descendants.get(unit_id, {}))
+        for ancestor, up in above.items():
+            for descendant, down in below.items():
+                self._ancestors[descendant][ancestor] = up + down + 1
+                self._descendants[ancestor][descendant] = up + down + 1
+
+    def _detach(self, unit_id: int) -> None:
+        below = self._descendants.get(unit_id, {})
+        for descendant in below:
+            ancestors = self._ancestors[descendant]
+            for ancestor in [a for a in ancestors if a not in below]:
+                del ancestors[ancestor]
+                self._descendants[ancestor].pop(descendant, None)
+
+
+class InProcessHierarchyMixin:
+    """
+    Hierarchy queries for the memory and JSON Organizational Unit repositories.
+
+    Subtree and ancestry queries walk the units through ``_tree_lookups``;
+    repositories with a parent_id index follow it level by level, the others
+    index the stored units in one pass per query. When the closure table is
+    enabled, a ClosureIndex is built from the stored units on first use and
+    kept current by add, update and delete.
+    """
+
+    def __init__(self, *args: Any, closure: Optional[bool] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._use_closure = Config.ORG_UNIT_CLOSURE if closure is None else closure
+        self._closure: Optional[ClosureIndex] = None
+
+    def _closure_index(self) -> ClosureIndex:
+        if self._closure is None:
+            self._closure = ClosureIndex()
+            self._closure.rebuild(self.get_all())
+        return self._closure
+
+    def add(self, entity: Any) -> Any:
+        result = super().add(entity)
+        if self._closure is not None:
+            self._closure.link(entity.id, entity.parent_id)
+        return result
+
+    def update(self, entity: Any) -> Any:
+        result = super().update(entity)
+        if self._closure is not None:
+            if self._closure.parent_of(entity.id) != entity.parent_id:
+                self._closure.move(entity.id, entity.parent_id)
+        return result
+
+    def delete(self, id: int) -> bool:
+        deleted = super().delete(id)
+        if deleted and self._closure is not None:
+            self._closure.unlink(id)
+        return deleted
+
+    def _tree_lookups(
+        self,
+    ) -> Tuple[Callable[[int], Optional[Any]], Callable[[int], Iterable[Any]]]:
+        """The unit-by-ID and children-of-unit lookups the walks follow."""
+        by_id, children = _children_index(self.get_all())
+        return by_id.get, lambda unit_id: children.get(unit_id, ())
+
+    def get_subtree(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """Walks down from a unit, one level of children at a time."""
+        check_max_depth(max_depth)
+        get_unit, children_of = self._tree_lookups()
+        start = get_unit(unit_id)
+        if start is None:
+            return []
+        return _walk_down(start, children_of, max_depth)
+
+    def get_ancestry(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """Follows the parent_id chain up from a unit."""
+        check_max_depth(max_depth)
+        get_unit, _ = self._tree_lookups()
+        return _walk_up(get_unit(unit_id), get_unit, max_depth)
+
+    def is_within(self, unit_id: int, ancestor_id: int) -> bool:
+        """Checks the closure index, or walks up from the unit when it is off."""
+        if self._use_closure:
+            return self._closure_index().contains(unit_id, ancestor_id)
+        return any(
+            node.entity.id == ancestor_id for node in self.get_ancestry(unit_id)
+        )
+
+    def rebuild_closure(self) -> int:
+        """Recomputes the closure index from the stored units."""
+        self._closure = ClosureIndex()
+        return self._closure.rebuild(self.get_all())
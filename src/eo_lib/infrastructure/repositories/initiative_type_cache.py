@@ -0,0 +1,234 @@
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from eo_lib.domain.entities import InitiativeType
+from eo_lib.infrastructure.database.async_client import AsyncPostgresClient
+from eo_lib.infrastructure.database.postgres_client import PostgresClient
+
+# (id, name, description) of a cached type; copies are handed out, so callers
+# never share or mutate a cached instance.
+_Snapshot = Tuple[int, str, Optional[str]]
+
+# session.info keys of the cache changes a transaction has not committed, and
+# of the caches it loaded, which a rollback invalidates.
+_PENDING = "eo_lib.initiative_type_cache.pending"
+_LOADED = "eo_lib.initiative_type_cache.loaded"
+
+
+class InitiativeTypeCache:
+    """
+    Thread-safe name to InitiativeType map for the cached repositories.
+
+    It is filled with one ``get_all`` on first use and then kept current by
+    the writes that go through the cached repository.
+    """
+
+    def __init__(self):
+        self._by_name: Dict[str, _Snapshot] = {}
+        self._names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self.loaded = False
+
+    def get(self, name: str) -> Optional[InitiativeType]:
+        """Returns a copy of the cached type with this name, if any."""
+        snapshot = self._by_name.get(name)
+        if snapshot is None:
+            return None
+        type_id, type_name, description = snapshot
+        return InitiativeType(name=type_name, description=description, id=type_id)
+
+    def load(self, types: Iterable[InitiativeType]) -> None:
+        """Replaces the cached types with a complete listing."""
+        with self._lock:
+            self._by_name.clear()
+            self._names.clear()
+            for itype in types:
+                self._put(itype)
+            self.loaded = True
+
+    def put(self, itype: InitiativeType) -> None:
+        """Caches a type, replacing whatever was cached under its ID."""
+        with self._lock:
+            self._drop(itype.id)
+            self._put(itype)
+
+    def drop(self, type_id: int) -> None:
+        """Forgets the type with this ID."""
+        with self._lock:
+            self._drop(type_id)
+
+    def invalidate(self) -> None:
+        """Forgets every type; the next lookup reloads the full listing."""
+        with self._lock:
+            self._by_name.clear()
+            self._names.clear()
+            self.loaded = False
+
+    def _put(self, itype: InitiativeType) -> None:
+        if itype.id is None:
+            return
+        self._by_name[itype.name] = (itype.id, itype.name, itype.description)
+        self._names[itype.id] = itype.name
+
+    def _drop(self, type_id: int) -> None:
+        name = self._names.pop(type_id, None)
+        if name is not None:
+            self._by_name.pop(name, None)
+
+
+def _copy(itype: InitiativeType) -> InitiativeType:
+    """A detached copy of the cached fields of a type, taken right away."""
+    return InitiativeType(name=itype.name, description=itype.description, id=itype.id)
+
+
+def _written(result: Any, entity: InitiativeType) -> InitiativeType:
+    """The stored type of a write: the repository's result, if it returns one."""
+    return result if isinstance(result, InitiativeType) else entity
+
+
+class CachedInitiativeTypeRepository:
+    """
+    Name cache in front of an InitiativeType repository.
+
+    ``get_by_name`` is served from the cache once it has been warmed by a
+    single ``get_all``; only names it does not know fall through to the
+    wrapped repository. Every other method is passed through.
+
+    Inside a unit of work, what ``add``, ``update`` and the name lookups
+    would cache is held back until the transaction commits and discarded on
+    rollback, like the role IDs of RoleRegistry, so the cache never returns
+    a type that was undone. A ``delete`` forgets the type at once and again
+    on commit. The warming ``get_all`` is cached right away, so a batch of
+    lookups in one unit of work runs it once; as it may list types the
+    transaction wrote, a rollback invalidates the cache it loaded. Outside a
+    unit of work every write is already committed, and memory or JSON stores
+    have no transaction, so the cache is updated straight away.
+
+    Writes made through other repository instances or processes are not
+    seen; call ``invalidate`` after renaming or deleting types elsewhere.
+    """
+
+    def __init__(self, repository: Any, cache: Optional[InitiativeTypeCache] = None):
+        """
+        Wraps an InitiativeType repository.
+
+        Args:
+            repository: Any synchronous InitiativeType repository.
+            cache (InitiativeTypeCache, optional): Cache to use, e.g. one shared
+                with other wrappers of the same store. Defaults to a new one.
+        """
+        self._repository = repository
+        self._cache = cache or InitiativeTypeCache()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repository, name)
+
+    def _transaction(self) -> Optional[Session]:
+        """The session of the open unit of work, if any."""
+        return PostgresClient.scope_session()
+
+    def _apply(self, change: Callable[[], None]) -> None:
+        """Applies a cache change now, or when the open unit of work commits."""
+        session = self._transaction()
+        if session is None:
+            change()
+        else:
+            session.info.setdefault(_PENDING, []).append(change)
+
+    def _load(self, types: Iterable[InitiativeType]) -> None:
+        self._cache.load(_copy(itype) for itype in types)
+        session = self._transaction()
+        if session is not None:
+            session.info.setdefault(_LOADED, []).append(self._cache)
+
+    def _put(self, itype: InitiativeType) -> None:
+        itype = _copy(itype)
+        self._apply(lambda: self._cache.put(itype))
+
+    def _drop(self, type_id: int) -> None:
+        self._cache.drop(type_id)
+        self._apply(lambda: self._cache.drop(type_id))
+
+    def get_by_name(self, name: str) -> Optional[InitiativeType]:
+        """Looks a type up by name, hitting the store only for unknown names."""
+        if not self._cache.loaded:
+            self._load(self._repository.get_all())
+        itype = self._cache.get(name)
+        if itype is None:
+            itype = self._repository.get_by_name(name)
+            if itype is not None:
+                self._put(itype)
+        return itype
+
+    def add(self, entity: InitiativeType) -> Any:
+        result = self._repository.add(entity)
+        self._put(_written(result, entity))
+        return result
+
+    def update(self, entity: InitiativeType) -> Any:
+        result = self._repository.update(entity)
+        self._put(_written(result, entity))
+        return result
+
+    def delete(self, id: int) -> Any:
+        result = self._repository.delete(id)
+        self._drop(id)
+        return result
+
+    def invalidate(self) -> None:
+        """Drops the cached types."""
+        self._cache.invalidate()
+
+
+class AsyncCachedInitiativeTypeRepository(CachedInitiativeTypeRepository):
+    """
+    Asyncio counterpart of CachedInitiativeTypeRepository.
+
+    Wraps an AsyncPostgresInitiativeTypeRepository or an AsyncRepositoryAdapter.
+    """
+
+    def _transaction(self) -> Optional[Session]:
+        """The session of the open async unit of work, if any."""
+        session = AsyncPostgresClient.scope_session()
+        return None if session is None else session.sync_session
+
+    async def get_by_name(self, name: str) -> Optional[InitiativeType]:
+        """Looks a type up by name, hitting the store only for unknown names."""
+        if not self._cache.loaded:
+            self._load(await self._repository.get_all())
+        itype = self._cache.get(name)
+        if itype is None:
+            itype = await self._repository.get_by_name(name)
+            if itype is not None:
+                self._put(itype)
+        return itype
+
+    async def add(self, entity: InitiativeType) -> Any:
+        result = await self._repository.add(entity)
+        self._put(_written(result, entity))
+        return result
+
+    async def update(self, entity: InitiativeType) -> Any:
+        result = await self._repository.update(entity)
+        self._put(_written(result, entity))
+        return result
+
+    async def delete(self, id: int) -> Any:
+        result = await self._repository.delete(id)
+        self._drop(id)
+        return result
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending(session: Session) -> None:
+    session.info.pop(_LOADED, None)
+    for change in session.info.pop(_PENDING, ()):
+        change()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING, None)
+    for cache in session.info.pop(_LOADED, ()):
+        cache.invalidate()
@@ -1,7 +1,22 @@
 import json
 import os
-from typing import List, Optional
+from datetime import datetime
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+)
+from eo_lib.config import Config
 from eo_lib.domain.repositories import (
+    Membership,
     PersonRepositoryInterface,
     TeamRepositoryInterface,
     InitiativeRepository,
@@ -11,6 +26,7 @@ from eo_lib.domain.repositories import (
 )
 from eo_lib.domain.entities import (
     Person,
+    PersonEmail,
     Team,
     TeamMember,
     Initiative,
@@ -20,13 +36,302 @@ from eo_lib.domain.entities import (
 )
 
 from libbase.infrastructure.json_repository import GenericJsonRepository
+from eo_lib.domain.hierarchy import InitiativeRollup
+from eo_lib.domain.query import UNSET, OrderBy, Where
+from eo_lib.domain.upsert import UPSERT_SPECS, UpsertResult
+from eo_lib.infrastructure.repositories.hierarchy import (
+    InProcessHierarchyMixin,
+    rollup_entities,
+)
+from eo_lib.infrastructure.repositories.listing import (
+    check_listing_args,
+    check_query_args,
+    project_entities,
+    query_entities,
+    seek_page,
+)
+from eo_lib.infrastructure.repositories.load_profiles import check_load_profile
+
+T = TypeVar("T")
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+class _JsonRecordStream:
+    """
+    Incrementally decodes the records of a JSON array or ID-keyed object.
+
+    The file is read in fixed-size blocks and each record is decoded as soon
+    as it is complete, so only one block and one record are held at a time.
+    """
+
+    def __init__(self, f: IO[str], read_size: int = 1 << 16):
+        self._file = f
+        self._read_size = read_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+
+    def _fill(self) -> bool:
+        chunk = self._file.read(self._read_size)
+        if not chunk:
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Returns the next non-whitespace character without consuming it."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos].isspace():
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _decode(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, self._pos = self._decoder.raw_decode(self._buffer, self._pos)
+                return value
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+
+    def __iter__(self) -> Iterator[Any]:
+        opener = self._peek()
+        if opener not in ("[", "{"):
+            return
+        self._pos += 1
+        closer = "]" if opener == "[" else "}"
+        while True:
+            char = self._peek()
+            if char in (closer, ""):
+                return
+            if char == ",":
+                self._pos += 1
+                continue
+            if opener == "{":
+                self._decode()  # record key
+                self._peek()
+                self._pos += 1  # ':'
+            yield self._decode()
+
+
+class JsonRepository(GenericJsonRepository[T]):
+    """
+    Base class for the JSON repositories.
+
+    Adds the list operations shared by every storage strategy on top of the
+    generic file-backed store.
+    """
+
+    def __init__(self, filename: str, model: Type[T]):
+        """Initializes the store for a model persisted in ``filename``."""
+        super().__init__(filename, model)
+        self._model_class = model
+        self._data_file = os.path.join(Config.get_json_dir(), filename)
+
+    def get_by_id(self, id: int, load_profile: Optional[str] = None) -> Optional[T]:
+        """Retrieves an entity; load profiles are validated, objects are whole."""
+        check_load_profile(self._model_class, load_profile)
+        return super().get_by_id(id)
+
+    def get_all(self, load_profile: Optional[str] = None) -> List[T]:
+        """Retrieves all entities; load profiles are validated only."""
+        check_load_profile(self._model_class, load_profile)
+        return super().get_all()
+
+    def list_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        order_by: str = "id",
+        load_profile: Optional[str] = None,
+        after_value: Any = UNSET,
+    ) -> List[T]:
+        """Selects one keyset page from the file without sorting all of it."""
+        check_listing_args(self._model_class, limit, order_by)
+        check_load_profile(self._model_class, load_profile)
+        return seek_page(self.list(), after_id, limit, order_by, after_value)
+
+    def iter_all(
+        self, batch_size: int = 1000, load_profile: Optional[str] = None
+    ) -> Iterator[T]:
+        """
+        Streams records from the JSON file, converting them one at a time.
+
+        Falls back to the generic ``list()`` when the store file is not in
+        the configured JSON directory.
+        """
+        check_load_profile(self._model_class, load_profile)
+        if not os.path.exists(self._data_file):
+            yield from self.list()
+            return
+        with open(self._data_file, encoding="utf-8") as f:
+            for record in _JsonRecordStream(f):
+                yield self._to_obj(record)
+
+    def project(
+        self,
+        fields: Sequence[str],
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Projects the stored entities to dicts holding only ``fields``."""
+        return project_entities(
+            self.iter_all(), self._model_class, fields, after_id, limit
+        )
+
+    def find(
+        self,
+        where: Optional[Where] = None,
+        order_by: OrderBy = "id",
+        limit: Optional[int] = None,
+        offset: int = 0,
+        load_profile: Optional[str] = None,
+    ) -> List[T]:
+        """Filters the streamed records, keeping only the matches in memory."""
+        model = self._model_class
+        conditions, ordering = check_query_args(model, where, order_by, limit, offset)
+        entities = self.iter_all(load_profile=load_profile)
+        return query_entities(entities, conditions, ordering, limit, offset)
+
+    def _load_records(self) -> List[dict]:
+        """Reads every stored record as a dict."""
+        if not os.path.exists(self._data_file):
+            return [self._to_dict(entity) for entity in self.list()]
+        with open(self._data_file, encoding="utf-8") as f:
+            data = json.load(f)
+        return list(data.values()) if isinstance(data, dict) else data
+
+    def _save_records(
+        self, records: List[dict], added: List[dict], changed: List[dict]
+    ) -> None:
+        """
+        Stores the added and changed records with a single rewrite of the file.
+
+        Args:
+            records (List[dict]): Every stored record, changes applied.
+            added (List[dict]): New records without an ID, not in ``records``.
+            changed (List[dict]): Records of ``records`` that were modified.
+        """
+        if not os.path.exists(self._data_file):
+            for record in changed:
+                self.update(self._to_obj(record))
+            for record in added:
+                entity = self._to_obj({**record, "id": None})
+                self.add(entity)
+                record["id"] = entity.id
+            return
+        with open(self._data_file, encoding="utf-8") as f:
+            keyed = isinstance(json.load(f), dict)
+        next_id = max((record["id"] for record in records), default=0) + 1
+        for record_id, record in enumerate(added, next_id):
+            record["id"] = record_id
+        records = records + added
+        data = {str(r["id"]): r for r in records} if keyed else records
+        tmp_path = f"{self._data_file}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self._data_file)
+
+    def _upsert_rows(self, rows: Iterable[Dict[str, Any]]) -> UpsertResult:
+        """
+        Merges rows into the file through a hash index on the natural key.
+
+        Records are compared in their stored form, so fields the file does
+        not keep never count as a change. The file is rewritten once.
+        """
+        model = self._model_class
+        key, fields = UPSERT_SPECS[model]
+        records = self._load_records()
+        stored = {r[key]: r for r in records if r.get(key) is not None}
+        index = self._children_index(records)
+        added: List[dict] = []
+        changed: Dict[int, dict] = {}
+        updated = unchanged = 0
+        for row in rows:
+            entity = model(**{key: row[key], **{f: row[f] for f in fields}})
+            record = self._to_dict(entity)
+            previous = stored.get(row[key])
+            record["id"] = previous["id"] if previous else None
+            for other in self._merge_children(previous, record, row, index):
+                if other.get("id") is not None:
+                    changed[other["id"]] = other
+            if previous is None:
+                added.append(record)
+                stored[row[key]] = record
+            elif record != previous:
+                previous.update(record)
+                changed[previous["id"]] = previous
+                updated += 1
+            else:
+                unchanged += 1
+        if added or changed:
+            self._save_records(records, added, list(changed.values()))
+        return UpsertResult(len(added), updated, unchanged)
+
+    def _children_index(self, records: List[dict]) -> Any:
+        """Builds the lookup ``_merge_children`` needs during one upsert."""
+        return None
+
+    def _merge_children(
+        self,
+        previous: Optional[dict],
+        record: dict,
+        row: Dict[str, Any],
+        index: Any,
+    ) -> List[dict]:
+        """
+        Applies the collections of an upserted row to its new ``record``.
+
+        Returns:
+            List[dict]: Other stored records the merge had to modify.
+        """
+        return []
 
 
-class JsonPersonRepository(GenericJsonRepository[Person], PersonRepositoryInterface):
+class JsonPersonRepository(JsonRepository[Person], PersonRepositoryInterface):
     """JSON implementation of the Person Repository."""
 
     def __init__(self):
         super().__init__("persons.json", Person)
+        self._email_index: Dict[str, dict] = {}
+        self._email_index_version: Optional[tuple] = None
+
+    def get_by_emails(self, emails: Sequence[str]) -> Dict[str, Person]:
+        """
+        Resolves the addresses through a normalized email hash index.
+
+        The index is built from one read of the file and reused until the
+        file is replaced or its modification time or size changes.
+        """
+        index = self._emails_by_address()
+        return {
+            address: self._to_obj(index[address])
+            for address in emails
+            if address in index
+        }
+
+    def _emails_by_address(self) -> Dict[str, dict]:
+        if not os.path.exists(self._data_file):
+            version = None
+        else:
+            stat = os.stat(self._data_file)
+            version = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            if version == self._email_index_version:
+                return self._email_index
+        index: Dict[str, dict] = {}
+        for record in self._load_records():
+            for address in record.get("emails") or []:
+                index.setdefault(PersonEmail.normalize(address), record)
+        self._email_index, self._email_index_version = index, version
+        return index
 
     def _to_obj(self, data: dict) -> Person:
         """Converts JSON dict to Person entity."""
@@ -50,8 +355,81 @@ class JsonPersonRepository(GenericJsonRepository[Person], PersonRepositoryInterf
             "identification_id": person.identification_id,
         }
 
-
-class JsonTeamRepository(GenericJsonRepository[Team], TeamRepositoryInterface):
+    def add_many(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> List[int]:
+        """Stores many persons in the JSON file, one record at a time."""
+        ids = []
+        for row in rows:
+            person = Person(
+                name=row["name"],
+                emails=row.get("emails"),
+                identification_id=row.get("identification_id"),
+                birthday=row.get("birthday"),
+            )
+            self.add(person)
+            ids.append(person.id)
+        return ids
+
+    def upsert_many(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """Merges persons by identification_id and their emails by address."""
+        return self._upsert_rows(rows)
+
+    def _children_index(self, records: List[dict]) -> Dict[str, dict]:
+        """Record owning every stored email address."""
+        return {email: record for record in records for email in record["emails"]}
+
+    def _merge_children(
+        self,
+        previous: Optional[dict],
+        record: dict,
+        row: Dict[str, Any],
+        owners: Dict[str, dict],
+    ) -> List[dict]:
+        """Makes the row's emails the person's own, moving them if needed."""
+        kept = previous["emails"] if previous else []
+        if row.get("emails") is None or set(row["emails"]) == set(kept):
+            record["emails"] = kept
+            return []
+        record["emails"] = list(dict.fromkeys(row["emails"]))
+        owner_of_record = previous if previous is not None else record
+        modified = []
+        for address in record["emails"]:
+            owner = owners.get(address)
+            if owner is not None and owner is not owner_of_record:
+                owner["emails"] = [e for e in owner["emails"] if e != address]
+                modified.append(owner)
+            owners[address] = owner_of_record
+        return modified
+
+    def set_emails_many(self, emails: Mapping[int, Sequence[str]]) -> int:
+        """Replaces the email sets that differ with a single rewrite of the file."""
+        records = self._load_records()
+        by_id = {record["id"]: record for record in records}
+        for person_id in emails:
+            if person_id not in by_id:
+                raise ValueError(f"Person {person_id} not found")
+        owners = self._children_index(records)
+        changed: Dict[int, dict] = {}
+        count = 0
+        for person_id, wanted in emails.items():
+            previous = by_id[person_id]
+            record = dict(previous)
+            row = {"emails": wanted}
+            for other in self._merge_children(previous, record, row, owners):
+                changed[other["id"]] = other
+            if record["emails"] != previous["emails"]:
+                previous.update(record)
+                changed[person_id] = previous
+                count += 1
+        if changed:
+            self._save_records(records, [], list(changed.values()))
+        return count
+
+
+class JsonTeamRepository(JsonRepository[Team], TeamRepositoryInterface):
     """JSON implementation of the Team Repository."""
 
     def __init__(self):
@@ -75,20 +453,109 @@ class JsonTeamRepository(GenericJsonRepository[Team], TeamRepositoryInterface):
             "short_name": team.short_name,
         }
 
+    def _members_file(self) -> str:
+        return os.path.join(Config.get_json_dir(), "team_members.json")
+
+    def _load_members(self) -> List[dict]:
+        path = self._members_file()
+        if not os.path.exists(path):
+            return []
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_members(self, records: List[dict]) -> None:
+        """Replaces the membership file atomically, so a batch is all or nothing."""
+        path = self._members_file()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(records, f)
+        os.replace(tmp_path, path)
+
+    def _member_to_obj(self, data: dict) -> TeamMember:
+        """Converts JSON dict to TeamMember association."""
+        return TeamMember(
+            person_id=data["person_id"],
+            team_id=data["team_id"],
+            role=data.get("role"),
+            start_date=_parse_datetime(data.get("start_date")),
+            end_date=_parse_datetime(data.get("end_date")),
+            id=data["id"],
+        )
+
     def add_member(self, member: TeamMember) -> TeamMember:
-        """Stub for adding a member in JSON mode."""
+        """Stores a membership association in the JSON membership file."""
+        role = member.role.name if member.role else member.role_name
+        [member.id] = self.add_members(
+            member.team_id,
+            [(member.person_id, role, member.start_date, member.end_date)],
+        )
         return member
 
     def remove_member(self, member_id: int) -> bool:
-        """Stub for removing a member in JSON mode."""
-        return False
+        """Removes a membership association from the JSON membership file."""
+        return self.remove_members([member_id]) == 1
 
     def get_members(self, team_id: int) -> List[TeamMember]:
-        """Stub for listing members in JSON mode."""
-        return []
-
-
-class JsonInitiativeRepository(GenericJsonRepository[Initiative], InitiativeRepository):
+        """Lists the membership associations of a team from the JSON file."""
+        return [
+            self._member_to_obj(record)
+            for record in self._load_members()
+            if record["team_id"] == team_id
+        ]
+
+    def add_members(self, team_id: int, members: Sequence[Membership]) -> List[int]:
+        """Appends many memberships with a single rewrite of the file."""
+        records = self._load_members()
+        next_id = max((record["id"] for record in records), default=0) + 1
+        ids = list(range(next_id, next_id + len(members)))
+        for member_id, (person_id, role, start_date, end_date) in zip(ids, members):
+            records.append(
+                {
+                    "id": member_id,
+                    "team_id": team_id,
+                    "person_id": person_id,
+                    "role": role,
+                    "start_date": start_date.isoformat() if start_date else None,
+                    "end_date": end_date.isoformat() if end_date else None,
+                }
+            )
+        if ids:
+            self._save_members(records)
+        return ids
+
+    def remove_members(self, member_ids: Iterable[int]) -> int:
+        """Removes many memberships with a single rewrite of the file."""
+        ids = set(member_ids)
+        records = self._load_members()
+        kept = [record for record in records if record["id"] not in ids]
+        if len(kept) != len(records):
+            self._save_members(kept)
+        return len(records) - len(kept)
+
+    def move_members(
+        self, from_team_id: int, to_team_id: int, person_ids: Iterable[int]
+    ) -> int:
+        """Re-points the matching memberships with a single rewrite of the file."""
+        persons = set(person_ids)
+        records = self._load_members()
+        moved = 0
+        for record in records:
+            if record["team_id"] == from_team_id and record["person_id"] in persons:
+                record["team_id"] = to_team_id
+                moved += 1
+        if moved:
+            self._save_members(records)
+        return moved
+
+    def upsert_many(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """Merges teams by name with a single rewrite of the file."""
+        return self._upsert_rows(rows)
+
+
+class JsonInitiativeRepository(JsonRepository[Initiative], InitiativeRepository):
     """JSON implementation of the Initiative Repository."""
 
     def __init__(self):
@@ -101,6 +568,7 @@ class JsonInitiativeRepository(GenericJsonRepository[Initiative], InitiativeRepo
             id=data["id"],
             description=data.get("description"),
             initiative_type_id=data.get("initiative_type_id"),
+            parent_id=data.get("parent_id"),
         )
 
     def _to_dict(self, initiative: Initiative) -> dict:
@@ -110,11 +578,16 @@ class JsonInitiativeRepository(GenericJsonRepository[Initiative], InitiativeRepo
             "status": initiative.status,
             "description": initiative.description,
             "initiative_type_id": initiative.initiative_type_id,
+            "parent_id": initiative.parent_id,
         }
 
+    def get_rollups(self, initiative_ids: Sequence[int]) -> Dict[int, InitiativeRollup]:
+        """Rolls up subtrees through a parent_id index shared by every root."""
+        return rollup_entities(self.get_all(), initiative_ids)
+
 
 class JsonInitiativeTypeRepository(
-    GenericJsonRepository[InitiativeType], InitiativeTypeRepository
+    JsonRepository[InitiativeType], InitiativeTypeRepository
 ):
     """JSON implementation of the InitiativeType Repository."""
 
@@ -136,7 +609,7 @@ class JsonInitiativeTypeRepository(
 
 
 class JsonOrganizationRepository(
-    GenericJsonRepository[Organization], OrganizationRepositoryInterface
+    JsonRepository[Organization], OrganizationRepositoryInterface
 ):
     """JSON implementation of the Organization Repository."""
 
@@ -159,14 +632,24 @@ class JsonOrganizationRepository(
             "short_name": obj.short_name,
         }
 
+    def upsert_many(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """Merges organizations by name with a single rewrite of the file."""
+        return self._upsert_rows(rows)
+
 
 class JsonOrgUnitRepository(
-    GenericJsonRepository[OrganizationalUnit], OrganizationalUnitRepositoryInterface
+    InProcessHierarchyMixin,
+    JsonRepository[OrganizationalUnit],
+    OrganizationalUnitRepositoryInterface,
 ):
     """JSON implementation of the Organizational Unit Repository."""
 
-    def __init__(self):
-        super().__init__("organizational_units.json", OrganizationalUnit)
+    def __init__(self, closure: Optional[bool] = None):
+        super().__init__(
+            "organizational_units.json", OrganizationalUnit, closure=closure
+        )
 
     def _to_obj(self, data: dict) -> OrganizationalUnit:
         return OrganizationalUnit(
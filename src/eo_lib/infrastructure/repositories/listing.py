@@ -0,0 +1,295 @@
+import heapq
+import operator
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+from sqlalchemy import inspect
+from eo_lib.domain.query import UNSET, In, OrderBy, Range, Where
+
+# Comparison per Range field, in declaration order (ge, gt, le, lt).
+RANGE_OPERATORS = (operator.ge, operator.gt, operator.le, operator.lt)
+
+T = TypeVar("T")
+
+
+def check_listing_args(model: type, limit: int, order_by: str) -> None:
+    """
+    Validates list_page arguments against a mapped model.
+
+    Raises:
+        ValueError: If ``order_by`` is not a column of the model or ``limit`` < 1.
+    """
+    if limit < 1:
+        raise ValueError("Page limit must be at least 1")
+    if order_by not in model.__table__.columns:
+        raise ValueError(f"Cannot order {model.__name__} by '{order_by}'")
+
+
+def seek_key(order_by: str) -> Callable[[Any], Tuple]:
+    """
+    Builds the ``(order_by, id)`` sort key used for in-process keyset paging.
+
+    NULL values sort after every non-NULL value, matching the SQL ordering.
+    """
+
+    def key(entity: Any) -> Tuple:
+        value = getattr(entity, order_by)
+        if value is None:
+            return (1, entity.id)
+        return (0, value, entity.id)
+
+    return key
+
+
+def missing_anchor(after_id: int) -> ValueError:
+    """The error of a list_page whose ``after_id`` row is gone."""
+    return ValueError(
+        f"Entity {after_id} no longer exists; pass its after_value to "
+        "continue paging after it"
+    )
+
+
+def seek_page(
+    entities: Iterable[T],
+    after_id: Optional[int],
+    limit: int,
+    order_by: str,
+    after_value: Any = UNSET,
+) -> List[T]:
+    """
+    Selects one keyset page from an iterable of entities in a single pass.
+
+    Args:
+        entities (Iterable[T]): Candidate entities (any order).
+        after_id (int, optional): ID of the last entity of the previous page.
+        limit (int): Maximum page size.
+        order_by (str): Attribute to sort by; ``id`` breaks ties.
+        after_value: ``order_by`` value of that entity; looked up if UNSET.
+
+    Returns:
+        List[T]: Up to ``limit`` entities sorted by ``(order_by, id)``.
+
+    Raises:
+        ValueError: If the value is looked up and the entity does not exist.
+    """
+    key = seek_key(order_by)
+    if after_id is None:
+        return heapq.nsmallest(limit, entities, key=key)
+
+    if order_by == "id":
+        anchor_key: Tuple = (0, after_id, after_id)
+    elif after_value is None:
+        anchor_key = (1, after_id)
+    elif after_value is not UNSET:
+        anchor_key = (0, after_value, after_id)
+    else:
+        entities = list(entities)
+        anchor = next((e for e in entities if e.id == after_id), None)
+        if anchor is None:
+            raise missing_anchor(after_id)
+        anchor_key = key(anchor)
+    return heapq.nsmallest(
+        limit, (e for e in entities if key(e) > anchor_key), key=key
+    )
+
+
+def split_projection(
+    model: type, fields: Sequence[str]
+) -> List[Tuple[str, Optional[str], str]]:
+    """
+    Validates projection fields against a mapped model.
+
+    A field is either a column of the model (``name``) or a column of a
+    many-to-one relationship (``initiative_type.name``).
+
+    Returns:
+        List[Tuple]: ``(field, relationship or None, column)`` per field.
+
+    Raises:
+        ValueError: If a field is not a column or a scalar relationship column.
+    """
+    if not fields:
+        raise ValueError("At least one projection field is required")
+    relationships = inspect(model).relationships
+    parts = []
+    for field in fields:
+        relation, _, column = field.rpartition(".")
+        if not relation:
+            if column not in model.__table__.columns:
+                raise ValueError(f"Cannot project {model.__name__} field '{field}'")
+            parts.append((field, None, column))
+            continue
+        rel = relationships.get(relation)
+        if rel is None or rel.uselist or column not in rel.mapper.columns:
+            raise ValueError(f"Cannot project {model.__name__} field '{field}'")
+        parts.append((field, relation, column))
+    return parts
+
+
+def project_entities(
+    entities: Iterable[Any],
+    model: type,
+    fields: Sequence[str],
+    after_id: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Projects in-process entities to dicts in ``id`` order.
+
+    Relationship fields read the related object when it is attached and are
+    None otherwise.
+    """
+    parts = split_projection(model, fields)
+    if after_id is not None:
+        entities = (e for e in entities if e.id > after_id)
+    if limit is None:
+        selected = sorted(entities, key=lambda e: e.id)
+    else:
+        selected = heapq.nsmallest(limit, entities, key=lambda e: e.id)
+
+    def value(entity: Any, relation: Optional[str], column: str) -> Any:
+        if relation is not None:
+            entity = getattr(entity, relation, None)
+        return getattr(entity, column, None) if entity is not None else None
+
+    return [
+        {field: value(e, relation, column) for field, relation, column in parts}
+        for e in selected
+    ]
+
+
+def check_query_args(
+    model: type,
+    where: Optional[Where],
+    order_by: OrderBy,
+    limit: Optional[int],
+    offset: int,
+) -> Tuple[Dict[str, Any], List[Tuple[str, bool]]]:
+    """
+    Validates ``find`` arguments against a mapped model.
+
+    Returns:
+        tuple: The conditions (In values materialized as lists) and a
+            ``(column, descending)`` pair per sort column.
+
+    Raises:
+        ValueError: If a condition or sort field is not a column of the model,
+            ``limit`` < 1 or ``offset`` < 0.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError("Query limit must be at least 1")
+    if offset < 0:
+        raise ValueError("Query offset must not be negative")
+    columns = model.__table__.columns
+    conditions: Dict[str, Any] = {}
+    for field, condition in (where or {}).items():
+        if field not in columns:
+            raise ValueError(f"Cannot filter {model.__name__} by '{field}'")
+        if isinstance(condition, In):
+            condition = In(list(condition.values))
+        conditions[field] = condition
+    ordering = []
+    for field in [order_by] if isinstance(order_by, str) else order_by:
+        descending = field.startswith("-")
+        column = field[1:] if descending else field
+        if column not in columns:
+            raise ValueError(f"Cannot order {model.__name__} by '{column}'")
+        ordering.append((column, descending))
+    return conditions, ordering
+
+
+def _predicate(field: str, condition: Any) -> Callable[[Any], bool]:
+    """Compiles one ``find`` condition to a test with SQL NULL semantics."""
+    value_of = operator.attrgetter(field)
+    if condition is None:
+        return lambda entity: value_of(entity) is None
+    if not isinstance(condition, (In, Range)):
+        return lambda entity: value_of(entity) == condition
+    if isinstance(condition, In):
+        accepted = condition.values
+        try:
+            accepted = set(accepted)
+        except TypeError:
+            pass
+
+        def test(value: Any) -> bool:
+            return value in accepted
+
+    else:
+        bounds = [
+            (compare, bound)
+            for compare, bound in zip(RANGE_OPERATORS, condition)
+            if bound is not None
+        ]
+
+        def test(value: Any) -> bool:
+            return all(compare(value, bound) for compare, bound in bounds)
+
+    def predicate(entity: Any) -> bool:
+        value = value_of(entity)
+        return value is not None and test(value)
+
+    return predicate
+
+
+def query_entities(
+    entities: Iterable[T],
+    conditions: Dict[str, Any],
+    ordering: Sequence[Tuple[str, bool]],
+    limit: Optional[int],
+    offset: int,
+) -> List[T]:
+    """
+    Filters, sorts and slices in-process entities like ``query_statement``.
+
+    Arguments are the ones returned by ``check_query_args``. NULLs sort last
+    in both directions and ``id`` breaks ties.
+    """
+    selected = entities
+    for field, condition in conditions.items():
+        selected = filter(_predicate(field, condition), selected)
+    if not any(descending for _, descending in ordering):
+        key = _ascending_key([column for column, _ in ordering])
+        if limit is not None:
+            return heapq.nsmallest(offset + limit, selected, key=key)[offset:]
+        return sorted(selected, key=key)[offset:]
+
+    selected = sorted(selected, key=operator.attrgetter("id"))
+    # Stable sorts from the least significant column up.
+    for column, descending in reversed(ordering):
+        selected.sort(key=_column_key(column, descending), reverse=descending)
+    end = None if limit is None else offset + limit
+    return selected[offset:end]
+
+
+def _ascending_key(columns: Sequence[str]) -> Callable[[Any], Any]:
+    """Sort key of ascending columns with NULLs last, ``id`` breaking ties."""
+    if all(column == "id" for column in columns):
+        return operator.attrgetter("id")
+    values_of = operator.attrgetter(*columns, "id")
+
+    def key(entity: Any) -> Tuple:
+        *values, entity_id = values_of(entity)
+        return (*((v is None, v) for v in values), entity_id)
+
+    return key
+
+
+def _column_key(column: str, descending: bool) -> Callable[[Any], Tuple]:
+    """Sort key of one column placing NULLs last in either direction."""
+    value_of = operator.attrgetter(column)
+
+    def key(entity: Any) -> Tuple:
+        value = value_of(entity)
+        # reverse=True flips the flag too, so NULLs stay last.
+        return ((value is not None) if descending else (value is None), value)
+
+    return key
@@ -0,0 +1,87 @@
+from typing import Callable, Dict, List, Optional
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, lazyload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+from eo_lib.domain.entities import Initiative, Person, Team, TeamMember
+
+SUMMARY = "summary"
+FULL = "full"
+
+
+def _summary(model: type, *keep: str) -> List[LoaderOption]:
+    """Defers every relationship of the model except ``keep`` to first access."""
+    return [
+        lazyload(getattr(model, rel.key))
+        for rel in inspect(model).relationships
+        if rel.key not in keep
+    ]
+
+
+# Model-specific profiles; "summary" and "full" exist for every model.
+_PROFILES: Dict[type, Dict[str, Callable[[], List[LoaderOption]]]] = {
+    Person: {
+        "with_emails": lambda: [
+            selectinload(Person.emails),
+            *_summary(Person, "emails"),
+        ],
+    },
+    Team: {
+        "with_members": lambda: [
+            selectinload(Team.members)
+            .joinedload(TeamMember.person)
+            .lazyload(Person.emails),
+            selectinload(Team.members).joinedload(TeamMember.role),
+            *_summary(Team, "members"),
+        ],
+    },
+    Initiative: {
+        "with_teams": lambda: [
+            selectinload(Initiative.teams).lazyload(Team.members),
+            joinedload(Initiative.initiative_type),
+            *_summary(Initiative, "teams", "initiative_type"),
+        ],
+    },
+}
+
+
+def load_options(model: type, profile: Optional[str]) -> List[LoaderOption]:
+    """
+    Resolves a named load profile into SQLAlchemy loader options.
+
+    Profiles:
+        - ``summary``: no relationship is loaded up front; each one is
+          loaded lazily on first access (which fails once the object is
+          detached or, with asyncio, outside a greenlet).
+        - ``full`` or None: the eager loading declared on the model mappings.
+        - ``with_emails`` (Person), ``with_members`` (Team: members with their
+          person and role) and ``with_teams`` (Initiative: teams and type),
+          each loading only that part of the graph with ``selectinload``.
+
+    Args:
+        model (type): The mapped entity class.
+        profile (str, optional): The profile name.
+
+    Returns:
+        List[LoaderOption]: Options for ``Query.options``/``Select.options``.
+
+    Raises:
+        ValueError: If the profile does not exist for the model.
+    """
+    if profile is None or profile == FULL:
+        return []
+    if profile == SUMMARY:
+        return _summary(model)
+    factory = _PROFILES.get(model, {}).get(profile)
+    if factory is None:
+        raise ValueError(f"Unknown load profile '{profile}' for {model.__name__}")
+    return factory()
+
+
+def check_load_profile(model: type, profile: Optional[str]) -> None:
+    """
+    Validates a load profile name for backends that keep whole objects.
+
+    Raises:
+        ValueError: If the profile does not exist for the model.
+    """
+    load_options(model, profile)
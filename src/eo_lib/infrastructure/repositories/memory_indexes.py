@@ -0,0 +1,102 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+KeyFunction = Callable[[Any], Iterable[Hashable]]
+
+
+class IndexSpec(NamedTuple):
+    """
+    Declares a secondary index of an in-memory store.
+
+    Attributes:
+        name (str): Index name; also the attribute indexed when ``keys`` is None.
+        keys (callable, optional): Returns every key of an object, for derived
+            or multi-valued keys such as normalized email addresses.
+    """
+
+    name: str
+    keys: Optional[KeyFunction] = None
+
+
+def _attribute_keys(name: str) -> KeyFunction:
+    return lambda obj: (getattr(obj, name, None),)
+
+
+class SecondaryIndex:
+    """
+    Hash index from a key to the IDs of the stored objects having it.
+
+    None keys are not indexed. Objects are indexed as a whole by ``put``, so
+    lookups reflect each object as it was when last put.
+    """
+
+    def __init__(self, spec: IndexSpec):
+        self.name = spec.name
+        self._keys = spec.keys or _attribute_keys(spec.name)
+        self._ids: Dict[Hashable, Dict[int, None]] = {}
+        self._entries: Dict[int, Tuple[Hashable, ...]] = {}
+
+    def put(self, obj_id: int, obj: Any) -> None:
+        """Indexes an object under its current keys, replacing its old ones."""
+        self.drop(obj_id)
+        keys = tuple(dict.fromkeys(k for k in self._keys(obj) if k is not None))
+        for key in keys:
+            self._ids.setdefault(key, {})[obj_id] = None
+        if keys:
+            self._entries[obj_id] = keys
+
+    def drop(self, obj_id: int) -> None:
+        """Removes an object from the index."""
+        for key in self._entries.pop(obj_id, ()):
+            ids = self._ids[key]
+            del ids[obj_id]
+            if not ids:
+                del self._ids[key]
+
+    def ids(self, key: Hashable) -> List[int]:
+        """IDs of the objects having this key, ascending."""
+        return sorted(self._ids.get(key, ()))
+
+    def clear(self) -> None:
+        self._ids.clear()
+        self._entries.clear()
+
+
+class MemoryIndexes:
+    """The secondary indexes of one in-memory store, kept current together."""
+
+    def __init__(self, specs: Iterable[IndexSpec]):
+        self._indexes = {spec.name: SecondaryIndex(spec) for spec in specs}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._indexes
+
+    def __getitem__(self, name: str) -> SecondaryIndex:
+        return self._indexes[name]
+
+    def put(self, obj_id: int, obj: Any) -> None:
+        """(Re-)indexes an object in every index."""
+        for index in self._indexes.values():
+            index.put(obj_id, obj)
+
+    def drop(self, obj_id: int) -> None:
+        """Removes an object from every index."""
+        for index in self._indexes.values():
+            index.drop(obj_id)
+
+    def rebuild(self, objects: Mapping[int, Any]) -> None:
+        """Re-indexes a whole store, e.g. after objects were changed in place."""
+        for index in self._indexes.values():
+            index.clear()
+        for obj_id, obj in objects.items():
+            self.put(obj_id, obj)
@@ -1,5 +1,20 @@
-from typing import List, Optional
+import threading
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 from eo_lib.domain.repositories import (
+    Membership,
     PersonRepositoryInterface,
     TeamRepositoryInterface,
     InitiativeRepository,
@@ -9,6 +24,8 @@ from eo_lib.domain.repositories import (
 )
 from eo_lib.domain.entities import (
     Person,
+    PersonEmail,
+    Role,
     Team,
     TeamMember,
     Initiative,
@@ -18,94 +35,550 @@ from eo_lib.domain.entities import (
 )
 
 from libbase.infrastructure.memory_repository import GenericMemoryRepository
+from eo_lib.domain.hierarchy import InitiativeRollup
+from eo_lib.domain.query import UNSET, In, OrderBy, Range, Where
+from eo_lib.domain.upsert import UPSERT_SPECS, UpsertResult
+from eo_lib.infrastructure.repositories.hierarchy import (
+    InProcessHierarchyMixin,
+    rollup_entities,
+)
+from eo_lib.infrastructure.repositories.listing import (
+    check_listing_args,
+    check_query_args,
+    project_entities,
+    query_entities,
+    seek_page,
+)
+from eo_lib.infrastructure.repositories.load_profiles import check_load_profile
+from eo_lib.infrastructure.repositories.memory_indexes import IndexSpec, MemoryIndexes
+
+T = TypeVar("T")
+
+
+class InMemoryRepository(GenericMemoryRepository[T]):
+    """
+    Base class for the In-Memory repositories.
+
+    Adds the list operations shared by every storage strategy on top of the
+    generic dictionary-backed store, and the secondary indexes declared by
+    ``indexes``. Indexes are kept current by add, update and delete; after
+    changing a stored object in place, pass it to ``update``.
+
+    Repositories are thread-safe: writers serialize on a re-entrant lock,
+    while readers take no lock. Point and index lookups rely on single dict
+    operations being atomic; scans read an immutable snapshot of the store
+    that the first scan after a write publishes, so a scan sees either all or
+    none of a batch write.
+    """
+
+    # Secondary hash indexes of the store, e.g. foreign keys and unique names.
+    indexes: Tuple[IndexSpec, ...] = ()
+
+    def __init__(self, model: Type[T]):
+        """Initializes the store for a model."""
+        super().__init__(model)
+        self._model_class = model
+        self._indexes = MemoryIndexes(self.indexes)
+        self._write_lock = threading.RLock()
+        self._snapshot: Optional[Tuple[T, ...]] = None
+
+    def add(self, entity: T) -> Any:
+        with self._write_lock:
+            result = super().add(entity)
+            self._indexes.put(entity.id, entity)
+            self._snapshot = None
+        return result
+
+    def update(self, entity: T) -> Any:
+        with self._write_lock:
+            result = super().update(entity)
+            self._indexes.put(entity.id, entity)
+            self._snapshot = None
+        return result
+
+    def delete(self, id: int) -> Any:
+        with self._write_lock:
+            result = super().delete(id)
+            self._indexes.drop(id)
+            self._snapshot = None
+        return result
+
+    def _values(self) -> Tuple[T, ...]:
+        """The stored entities as of the last write, copied once per write."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._write_lock:
+                snapshot = self._snapshot
+                if snapshot is None:
+                    snapshot = self._snapshot = tuple(self._storage.values())
+        return snapshot
+
+    def _replace_all(self, entities: Iterable[T], next_id: int) -> None:
+        """
+        Swaps the whole store for restored entities, e.g. from a snapshot.
+
+        New storage and indexes are built aside and published together, so
+        lock-free readers see either the old store or the new one.
+        """
+        storage = {entity.id: entity for entity in entities}
+        indexes = MemoryIndexes(self.indexes)
+        indexes.rebuild(storage)
+        with self._write_lock:
+            self._storage, self._indexes = storage, indexes
+            self._id_counter = next_id
+            self._snapshot = None
+
+    def _lookup(self, ids: Iterable[int]) -> List[T]:
+        """The stored entities with these IDs, skipping concurrently deleted ones."""
+        found = (self._storage.get(entity_id) for entity_id in ids)
+        return [entity for entity in found if entity is not None]
+
+    def find_by(self, index: str, key: Any) -> List[T]:
+        """
+        Looks entities up through a secondary index, in ID order.
+
+        Raises:
+            ValueError: If the repository declares no such index.
+        """
+        if index not in self._indexes:
+            raise ValueError(f"{self._model_class.__name__} has no index {index!r}")
+        return self._lookup(self._indexes[index].ids(key))
+
+    def _find_first(self, index: str, key: Any) -> Optional[T]:
+        found = self._lookup(self._indexes[index].ids(key))
+        return found[0] if found else None
+
+    def get_by_id(self, id: int, load_profile: Optional[str] = None) -> Optional[T]:
+        """Retrieves an entity; load profiles are validated, objects are whole."""
+        check_load_profile(self._model_class, load_profile)
+        return super().get_by_id(id)
+
+    def get_all(self, load_profile: Optional[str] = None) -> List[T]:
+        """Retrieves all entities; load profiles are validated only."""
+        check_load_profile(self._model_class, load_profile)
+        return list(self._values())
+
+    def list_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        order_by: str = "id",
+        load_profile: Optional[str] = None,
+        after_value: Any = UNSET,
+    ) -> List[T]:
+        """Selects one keyset page from the store without sorting all of it."""
+        check_listing_args(self._model_class, limit, order_by)
+        check_load_profile(self._model_class, load_profile)
+        return seek_page(self._values(), after_id, limit, order_by, after_value)
+
+    def iter_all(
+        self, batch_size: int = 1000, load_profile: Optional[str] = None
+    ) -> Iterator[T]:
+        """Iterates over a snapshot, so concurrent writes cannot break the scan."""
+        check_load_profile(self._model_class, load_profile)
+        yield from self._values()
+
+    def project(
+        self,
+        fields: Sequence[str],
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Projects the stored entities to dicts holding only ``fields``."""
+        return project_entities(
+            self._values(), self._model_class, fields, after_id, limit
+        )
+
+    def find(
+        self,
+        where: Optional[Where] = None,
+        order_by: OrderBy = "id",
+        limit: Optional[int] = None,
+        offset: int = 0,
+        load_profile: Optional[str] = None,
+    ) -> List[T]:
+        """
+        Filters, sorts and slices the store in process.
+
+        Equality and In conditions on ``id`` or an indexed column narrow the
+        candidates through the index, the most selective one winning; without
+        one, the whole store is scanned.
+        """
+        model = self._model_class
+        conditions, ordering = check_query_args(model, where, order_by, limit, offset)
+        check_load_profile(model, load_profile)
+        candidates = self._candidates(conditions)
+        return query_entities(candidates, conditions, ordering, limit, offset)
+
+    def _candidates(self, conditions: Dict[str, Any]) -> List[T]:
+        """The stored entities the indexes cannot rule out."""
+        best: Optional[Set[int]] = None
+        for field, condition in conditions.items():
+            if condition is None or isinstance(condition, Range):
+                continue
+            values = condition.values if isinstance(condition, In) else [condition]
+            if field == "id":
+                ids = {value for value in values if value in self._storage}
+            elif field in self._indexes:
+                index = self._indexes[field]
+                ids = {i for value in values for i in index.ids(value)}
+            else:
+                continue
+            if best is None or len(ids) < len(best):
+                best = ids
+        if best is None:
+            return list(self._values())
+        return self._lookup(best)
+
+    def _upsert_rows(self, rows: Iterable[Dict[str, Any]]) -> UpsertResult:
+        """Merges rows into the store through the index on the natural key."""
+        with self._write_lock:
+            return self._merge_rows(rows)
+
+    def _merge_rows(self, rows: Iterable[Dict[str, Any]]) -> UpsertResult:
+        model = self._model_class
+        key, fields = UPSERT_SPECS[model]
+        index = self._children_index()
+        inserted = updated = unchanged = 0
+        for row in rows:
+            entity = self._find_first(key, row[key])
+            if entity is None:
+                entity = model(**{key: row[key], **{f: row[f] for f in fields}})
+                self.add(entity)
+                self._merge_children(entity, row, index)
+                inserted += 1
+                continue
+            changed = False
+            for field in fields:
+                if getattr(entity, field) != row[field]:
+                    setattr(entity, field, row[field])
+                    changed = True
+            if changed:
+                self._indexes.put(entity.id, entity)
+            if self._merge_children(entity, row, index) or changed:
+                updated += 1
+            else:
+                unchanged += 1
+        return UpsertResult(inserted, updated, unchanged)
+
+    def _children_index(self) -> Any:
+        """Builds the lookup ``_merge_children`` needs during one upsert."""
+        return None
+
+    def _merge_children(self, entity: T, row: Dict[str, Any], index: Any) -> bool:
+        """Applies the collections of an upserted row; True if they changed."""
+        return False
+
+
+def _email_keys(person: Person) -> Iterable[str]:
+    return (PersonEmail.normalize(email.email) for email in person.emails)
 
 
 class InMemoryPersonRepository(
-    GenericMemoryRepository[Person], PersonRepositoryInterface
+    InMemoryRepository[Person], PersonRepositoryInterface
 ):
     """
     In-Memory implementation of the Person Repository.
     """
 
+    indexes = (IndexSpec("identification_id"), IndexSpec("email", _email_keys))
+
     def __init__(self):
         """Initializes the repository with the Person model."""
         super().__init__(Person)
 
+    def get_by_emails(self, emails: Sequence[str]) -> Dict[str, Person]:
+        """
+        Resolves the addresses through the normalized email index.
+
+        When stored addresses differ only in case, the oldest person wins.
+        """
+        found = {}
+        for address in emails:
+            person = self._find_first("email", address)
+            if person is not None:
+                found[address] = person
+        return found
+
+    def add_many(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> List[int]:
+        """Stores many persons in the in-memory store, as one write."""
+        persons = [
+            Person(
+                name=row["name"],
+                emails=row.get("emails"),
+                identification_id=row.get("identification_id"),
+                birthday=row.get("birthday"),
+            )
+            for row in rows
+        ]
+        with self._write_lock:
+            for person in persons:
+                self.add(person)
+        return [person.id for person in persons]
+
+    def upsert_many(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """Merges persons by identification_id and their emails by address."""
+        return self._upsert_rows(rows)
+
+    def _children_index(self) -> Dict[str, Person]:
+        """Owner of every stored email address."""
+        return {
+            email.email: person
+            for person in self._storage.values()
+            for email in person.emails
+        }
+
+    def _merge_children(
+        self, person: Person, row: Dict[str, Any], owners: Dict[str, Person]
+    ) -> bool:
+        """Makes the row's emails the person's own, moving them if needed."""
+        if row.get("emails") is None:
+            return False
+        wanted = list(dict.fromkeys(row["emails"]))
+        current = {email.email: email for email in person.emails}
+        if set(wanted) == current.keys():
+            return False
+        for address in current.keys() - set(wanted):
+            owners.pop(address, None)
+        for address in wanted:
+            owner = owners.get(address)
+            if owner is not None and owner is not person:
+                owner.emails = [e for e in owner.emails if e.email != address]
+                self._indexes.put(owner.id, owner)
+            owners[address] = person
+        person.set_emails(wanted)
+        self._indexes.put(person.id, person)
+        return True
+
+    def set_emails_many(self, emails: Mapping[int, Sequence[str]]) -> int:
+        """Replaces the email sets that differ, moving addresses between persons."""
+        with self._write_lock:
+            for person_id in emails:
+                if person_id not in self._storage:
+                    raise ValueError(f"Person {person_id} not found")
+            owners = self._children_index()
+            return sum(
+                self._merge_children(
+                    self._storage[person_id], {"emails": wanted}, owners
+                )
+                for person_id, wanted in emails.items()
+            )
 
-class InMemoryTeamRepository(GenericMemoryRepository[Team], TeamRepositoryInterface):
+
+class InMemoryTeamRepository(InMemoryRepository[Team], TeamRepositoryInterface):
     """
     In-Memory implementation of the Team Repository.
     """
 
+    indexes = (IndexSpec("name"), IndexSpec("organization_id"))
+
     def __init__(self):
         """Initializes the team repository and membership store."""
         super().__init__(Team)
         self._members = {}
         self._member_id_counter = 1
+        self._member_indexes = MemoryIndexes(
+            (IndexSpec("team_id"), IndexSpec("person_id"))
+        )
+        self._roles: Dict[str, Role] = {}
+
+    def _role(self, name: str) -> Role:
+        """Returns the role with this name, creating it on first use."""
+        role = self._roles.get(name)
+        if role is None:
+            role = self._roles[name] = Role(name=name, id=len(self._roles) + 1)
+        return role
 
     def add_member(self, member: TeamMember) -> TeamMember:
         """Adds a membership association to the in-memory store."""
-        member.id = self._member_id_counter
-        self._members[member.id] = member
-        self._member_id_counter += 1
+        with self._write_lock:
+            if member.role_name and member.role is None:
+                member.role = self._role(member.role_name)
+                member.role_id = member.role.id
+            member.id = self._member_id_counter
+            self._members[member.id] = member
+            self._member_indexes.put(member.id, member)
+            self._member_id_counter += 1
         return member
 
     def remove_member(self, member_id: int) -> bool:
         """Removes a membership association from the in-memory store."""
-        if member_id in self._members:
-            del self._members[member_id]
-            return True
-        return False
+        with self._write_lock:
+            if self._members.pop(member_id, None) is None:
+                return False
+            self._member_indexes.drop(member_id)
+        return True
+
+    def _replace_members(
+        self, members: Iterable[TeamMember], roles: Iterable[Role], next_id: int
+    ) -> None:
+        """Swaps every membership and role for restored ones, like _replace_all."""
+        stored = {member.id: member for member in members}
+        indexes = MemoryIndexes((IndexSpec("team_id"), IndexSpec("person_id")))
+        indexes.rebuild(stored)
+        with self._write_lock:
+            self._members, self._member_indexes = stored, indexes
+            self._roles = {role.name: role for role in roles}
+            self._member_id_counter = next_id
 
     def get_members(self, team_id: int) -> List[TeamMember]:
-        """Retrieves all members of a specific team from the in-memory store."""
-        return [m for m in self._members.values() if m.team_id == team_id]
+        """Retrieves all members of a specific team through the team_id index."""
+        found = map(self._members.get, self._member_indexes["team_id"].ids(team_id))
+        return [member for member in found if member is not None]
+
+    def add_members(self, team_id: int, members: Sequence[Membership]) -> List[int]:
+        """Adds many membership associations to the in-memory store."""
+        with self._write_lock:
+            added = [
+                self.add_member(
+                    TeamMember(
+                        person_id=person_id,
+                        team_id=team_id,
+                        role=role,
+                        start_date=start_date,
+                        end_date=end_date,
+                    )
+                )
+                for person_id, role, start_date, end_date in members
+            ]
+        return [member.id for member in added]
+
+    def remove_members(self, member_ids: Iterable[int]) -> int:
+        """Removes many membership associations from the in-memory store."""
+        with self._write_lock:
+            return sum(self.remove_member(member_id) for member_id in set(member_ids))
+
+    def move_members(
+        self, from_team_id: int, to_team_id: int, person_ids: Iterable[int]
+    ) -> int:
+        """Re-points the matching memberships to another team."""
+        persons = set(person_ids)
+        with self._write_lock:
+            moved = [
+                m for m in self.get_members(from_team_id) if m.person_id in persons
+            ]
+            for member in moved:
+                member.team_id = to_team_id
+                self._member_indexes.put(member.id, member)
+        return len(moved)
+
+    def upsert_many(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """Merges teams by name."""
+        return self._upsert_rows(rows)
 
 
 class InMemoryInitiativeRepository(
-    GenericMemoryRepository[Initiative], InitiativeRepository
+    InMemoryRepository[Initiative], InitiativeRepository
 ):
     """
     In-Memory implementation of the Initiative Repository.
     """
 
+    indexes = (
+        IndexSpec("name"),
+        IndexSpec("parent_id"),
+        IndexSpec("organization_id"),
+        IndexSpec("initiative_type_id"),
+    )
+
     def __init__(self):
         """Initializes the initiative repository."""
         super().__init__(Initiative)
 
+    def get_rollups(self, initiative_ids: Sequence[int]) -> Dict[int, InitiativeRollup]:
+        """Rolls up subtrees through a parent_id index shared by every root."""
+        return rollup_entities(self.get_all(), initiative_ids)
+
 
 class InMemoryInitiativeTypeRepository(
-    GenericMemoryRepository[InitiativeType], InitiativeTypeRepository
+    InMemoryRepository[InitiativeType], InitiativeTypeRepository
 ):
     """
     In-Memory implementation of the Initiative Type Repository.
     """
 
+    indexes = (IndexSpec("name"),)
+
     def __init__(self):
         """Initializes the initiative type repository."""
         super().__init__(InitiativeType)
 
     def get_by_name(self, name: str) -> Optional[InitiativeType]:
-        return next((t for t in self._storage.values() if t.name == name), None)
+        return self._find_first("name", name)
 
 
 class InMemoryOrganizationRepository(
-    GenericMemoryRepository[Organization], OrganizationRepositoryInterface
+    InMemoryRepository[Organization], OrganizationRepositoryInterface
 ):
     """
     In-Memory implementation of the Organization Repository.
     """
 
+    indexes = (IndexSpec("name"),)
+
     def __init__(self):
         super().__init__(Organization)
 
+    def upsert_many(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """Merges organizations by name."""
+        return self._upsert_rows(rows)
+
 
 class InMemoryOrgUnitRepository(
-    GenericMemoryRepository[OrganizationalUnit], OrganizationalUnitRepositoryInterface
+    InProcessHierarchyMixin,
+    InMemoryRepository[OrganizationalUnit],
+    OrganizationalUnitRepositoryInterface,
 ):
     """
     In-Memory implementation of the Organizational Unit Repository.
     """
 
-    def __init__(self):
-        super().__init__(OrganizationalUnit)
+    indexes = (
+        IndexSpec("name"),
+        IndexSpec("organization_id"),
+        IndexSpec("parent_id"),
+    )
+
+    def __init__(self, closure: Optional[bool] = None):
+        super().__init__(OrganizationalUnit, closure=closure)
+
+    # The closure index is written after the store, so it shares the lock.
+
+    def add(self, entity: OrganizationalUnit) -> Any:
+        with self._write_lock:
+            return super().add(entity)
+
+    def update(self, entity: OrganizationalUnit) -> Any:
+        with self._write_lock:
+            return super().update(entity)
+
+    def delete(self, id: int) -> bool:
+        with self._write_lock:
+            return super().delete(id)
+
+    def _closure_index(self) -> Any:
+        with self._write_lock:
+            return super()._closure_index()
+
+    def _tree_lookups(self) -> Any:
+        """Point lookups and the parent_id index; walks cost their own size."""
+        return self._storage.get, lambda unit_id: self.find_by("parent_id", unit_id)
+
+    def rebuild_closure(self) -> int:
+        with self._write_lock:
+            return super().rebuild_closure()
+
+    def _replace_all(
+        self, entities: Iterable[OrganizationalUnit], next_id: int
+    ) -> None:
+        with self._write_lock:
+            super()._replace_all(entities, next_id)
+            self._closure = None
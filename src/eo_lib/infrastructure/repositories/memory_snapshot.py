@@ -0,0 +1,266 @@
+import datetime
+import io
+import operator
+import os
+import pickle
+import struct
+import zlib
+from contextlib import ExitStack
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from sqlalchemy import inspect
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.instrumentation import manager_of_class
+
+from eo_lib.domain.entities import (
+    Initiative,
+    InitiativeType,
+    Organization,
+    OrganizationalUnit,
+    Person,
+    PersonEmail,
+    Role,
+    Team,
+    TeamMember,
+)
+
+# File layout: magic, format version, payload length, CRC-32 of the payload,
+# then the zlib-compressed pickle of the tables. The pickle holds only
+# builtins and datetime values; loading refuses any other class.
+MAGIC = b"EOMS"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sHQI")
+
+_ALLOWED_CLASSES = {
+    ("datetime", "date"),
+    ("datetime", "datetime"),
+    ("datetime", "time"),
+    ("datetime", "timedelta"),
+    ("datetime", "timezone"),
+}
+
+# Store attribute of every entity table, in ServiceFactory strategy order.
+_TABLES = (
+    ("persons", Person),
+    ("teams", Team),
+    ("initiatives", Initiative),
+    ("initiative_types", InitiativeType),
+    ("organizations", Organization),
+    ("org_units", OrganizationalUnit),
+)
+
+# Many-to-many links as (owner table, collection, linked table).
+_LINKS = (
+    ("initiatives", "teams", "teams"),
+    ("initiatives", "persons", "persons"),
+    ("persons", "organizations", "organizations"),
+)
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) not in _ALLOWED_CLASSES:
+            raise ValueError(f"Snapshot holds a disallowed type {module}.{name}")
+        return getattr(datetime, name)
+
+
+def _columns(model: type) -> List[str]:
+    return [column.key for column in model.__table__.columns]
+
+
+def _rows(model: type, entities: Iterable[Any]) -> Tuple[List[str], List[Tuple]]:
+    """Column names of a model and the column values of each entity."""
+    columns = _columns(model)
+    values_of = operator.attrgetter(*columns)
+    return columns, [values_of(entity) for entity in entities]
+
+
+def _entities(model: type, columns: Sequence[str], rows: Iterable[Tuple]) -> List[Any]:
+    """
+    Rebuilds entities from column values.
+
+    Like the ORM's own loading, this bypasses ``__init__`` and attribute
+    events, which would dominate the load time of a large store.
+    """
+    new_instance = manager_of_class(model).new_instance
+    entities = []
+    for row in rows:
+        entity = new_instance()
+        entity.__dict__.update(zip(columns, row))
+        entities.append(entity)
+    return entities
+
+
+def _attach(pairs: Sequence[Tuple[Any, Any]], collection: str) -> None:
+    """Fills a relationship collection and its back-populated side of each pair."""
+    if not pairs:
+        return
+    relationship = inspect(type(pairs[0][0])).relationships[collection]
+    backref = relationship.back_populates
+    backref_is_list = relationship.mapper.relationships[backref].uselist
+    forward: Dict[int, Tuple[Any, List[Any]]] = {}
+    backward: Dict[int, Tuple[Any, List[Any]]] = {}
+    for owner, other in pairs:
+        forward.setdefault(id(owner), (owner, []))[1].append(other)
+        backward.setdefault(id(other), (other, []))[1].append(owner)
+    for owner, others in forward.values():
+        set_committed_value(owner, collection, others)
+    for other, owners in backward.values():
+        set_committed_value(other, backref, owners if backref_is_list else owners[0])
+
+
+def _capture(store: Any) -> Dict[str, Any]:
+    """Collects the store's state as plain values; the caller holds the locks."""
+    tables: Dict[str, Any] = {}
+    counters: Dict[str, int] = {}
+    for attribute, model in _TABLES:
+        repo = getattr(store, attribute)
+        tables[attribute] = _rows(model, repo._storage.values())
+        counters[attribute] = repo._id_counter
+
+    persons = store.persons._storage.values()
+    emails = [(p.id, email.email) for p in persons for email in p.emails]
+    # Links to entities that are not stored (unsaved or deleted) are dropped.
+    links = {
+        f"{owner}.{collection}": [
+            (entity.id, other.id)
+            for entity in getattr(store, owner)._storage.values()
+            for other in getattr(entity, collection)
+            if other.id in getattr(store, linked)._storage
+        ]
+        for owner, collection, linked in _LINKS
+    }
+
+    teams = store.teams
+    registry = list(teams._roles.values())
+    members = list(teams._members.values())
+    # Roles in first-seen order, identified by object so unsaved ones count too.
+    roles: Dict[int, Role] = {}
+    for role in registry + [member.role for member in members]:
+        if role is not None:
+            roles.setdefault(id(role), role)
+    position = {key: i for i, key in enumerate(roles)}
+    registered = {id(role) for role in registry}
+    role_rows = [
+        (role.id, role.name, role.description, key in registered)
+        for key, role in roles.items()
+    ]
+    member_columns, member_rows = _rows(TeamMember, members)
+    member_roles = [
+        None if member.role is None else position[id(member.role)] for member in members
+    ]
+    return {
+        "tables": tables,
+        "counters": counters,
+        "person_emails": emails,
+        "links": links,
+        "roles": role_rows,
+        "team_members": (member_columns, member_rows, member_roles),
+        "team_member_counter": teams._member_id_counter,
+    }
+
+
+def _encode(state: Dict[str, Any]) -> bytes:
+    payload = zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL), 1)
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, len(payload), zlib.crc32(payload))
+    return header + payload
+
+
+def _decode(data: bytes) -> Dict[str, Any]:
+    """
+    Verifies and unpacks a snapshot file.
+
+    Raises:
+        ValueError: If the file is not a snapshot, has another format version,
+            is truncated or fails its checksum.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Not an eo_lib memory snapshot")
+    magic, version, length, checksum = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not an eo_lib memory snapshot")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot format version {version}")
+    payload = data[_HEADER.size :]
+    if len(payload) != length or zlib.crc32(payload) != checksum:
+        raise ValueError("Snapshot checksum mismatch; the file is damaged")
+    return _SnapshotUnpickler(io.BytesIO(zlib.decompress(payload))).load()
+
+
+def _repositories(store: Any) -> List[Any]:
+    return [getattr(store, attribute) for attribute, _ in _TABLES]
+
+
+def dump_snapshot(store: Any, path: str) -> int:
+    """
+    Writes every entity, membership, link and ID counter of a store to a file.
+
+    Writers of all the store's repositories are held off while the state is
+    captured, so the snapshot is consistent. The file is replaced atomically.
+
+    Args:
+        store (MemoryStore): The store to save.
+        path (str): Destination file.
+
+    Returns:
+        int: The size of the snapshot in bytes.
+    """
+    with ExitStack() as locks:
+        for repo in _repositories(store):
+            locks.enter_context(repo._write_lock)
+        state = _capture(store)
+    data = _encode(state)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
+    return len(data)
+
+
+def load_snapshot(store: Any, path: str) -> None:
+    """
+    Replaces the contents of a store with a snapshot written by dump_snapshot.
+
+    The entity graph is rebuilt aside, then every repository swaps it in, so
+    services already holding the store's repositories see the restored data.
+
+    Raises:
+        ValueError: If the file is not a valid snapshot of this format version.
+    """
+    with open(path, "rb") as f:
+        state = _decode(f.read())
+
+    restored: Dict[str, Dict[int, Any]] = {}
+    for attribute, model in _TABLES:
+        columns, rows = state["tables"][attribute]
+        entities = _entities(model, columns, rows)
+        restored[attribute] = {entity.id: entity for entity in entities}
+
+    persons = restored["persons"]
+    owners = [persons[person_id] for person_id, _ in state["person_emails"]]
+    addresses = [(email,) for _, email in state["person_emails"]]
+    emails = _entities(PersonEmail, ("email",), addresses)
+    _attach(list(zip(owners, emails)), "emails")
+    for owner, collection, linked in _LINKS:
+        entities, targets = restored[owner], restored[linked]
+        pairs = state["links"][f"{owner}.{collection}"]
+        _attach([(entities[a], targets[b]) for a, b in pairs], collection)
+
+    role_rows = [row[:3] for row in state["roles"]]
+    roles = _entities(Role, ("id", "name", "description"), role_rows)
+    registry = [role for role, row in zip(roles, state["roles"]) if row[3]]
+    member_columns, member_rows, member_roles = state["team_members"]
+    members = _entities(TeamMember, member_columns, member_rows)
+    _attach(
+        [(roles[r], m) for m, r in zip(members, member_roles) if r is not None],
+        "team_memberships",
+    )
+
+    with ExitStack() as locks:
+        for repo in _repositories(store):
+            locks.enter_context(repo._write_lock)
+        for attribute, _ in _TABLES:
+            repo = getattr(store, attribute)
+            counter = state["counters"][attribute]
+            repo._replace_all(restored[attribute].values(), counter)
+        store.teams._replace_members(members, registry, state["team_member_counter"])
+        store.initiative_type_cache.invalidate()
@@ -0,0 +1,105 @@
+import threading
+from typing import Any, Dict, Tuple
+
+from eo_lib.infrastructure.repositories.initiative_type_cache import (
+    InitiativeTypeCache,
+)
+from eo_lib.infrastructure.repositories.memory_repositories import (
+    InMemoryInitiativeRepository,
+    InMemoryInitiativeTypeRepository,
+    InMemoryOrganizationRepository,
+    InMemoryOrgUnitRepository,
+    InMemoryPersonRepository,
+    InMemoryTeamRepository,
+)
+from eo_lib.infrastructure.repositories.memory_snapshot import (
+    dump_snapshot,
+    load_snapshot,
+)
+
+
+class MemoryStore:
+    """
+    One set of in-memory repositories shared by every service built on it.
+
+    With memory storage, ServiceFactory takes its repositories from the
+    process-wide store named by ``Config.MEMORY_STORE``, so every controller
+    and service of that name sees the same entities, including the teams of
+    the initiative services. Stores are created on first use and live until
+    ``drop``; the repositories are thread-safe, so one store can back a whole
+    multi-threaded service.
+
+    Attributes:
+        persons, teams, initiatives, initiative_types, organizations,
+        org_units: The shared repositories.
+        initiative_type_cache (InitiativeTypeCache): Name cache shared by the
+            cached initiative type repositories of the store.
+    """
+
+    _stores: Dict[str, "MemoryStore"] = {}
+    _stores_lock = threading.Lock()
+
+    def __init__(self):
+        self.persons = InMemoryPersonRepository()
+        self.teams = InMemoryTeamRepository()
+        self.initiatives = InMemoryInitiativeRepository()
+        self.initiative_types = InMemoryInitiativeTypeRepository()
+        self.organizations = InMemoryOrganizationRepository()
+        self.org_units = InMemoryOrgUnitRepository()
+        self.initiative_type_cache = InitiativeTypeCache()
+
+    @classmethod
+    def named(cls, name: str = "default") -> "MemoryStore":
+        """Returns the process-wide store with this name, creating it if needed."""
+        with cls._stores_lock:
+            store = cls._stores.get(name)
+            if store is None:
+                store = cls._stores[name] = cls()
+            return store
+
+    @classmethod
+    def drop(cls, name: str = "default") -> bool:
+        """
+        Forgets a named store; the next ``named`` call starts an empty one.
+
+        Services created earlier keep the repositories they hold.
+        """
+        with cls._stores_lock:
+            return cls._stores.pop(name, None) is not None
+
+    def dump_snapshot(self, path: str) -> int:
+        """
+        Saves the whole store to a compact, checksummed binary file.
+
+        Covers every entity, email, membership, role, many-to-many link and
+        ID counter; writes are held off while the state is captured.
+
+        Returns:
+            int: The size of the snapshot in bytes.
+        """
+        return dump_snapshot(self, path)
+
+    def load_snapshot(self, path: str) -> None:
+        """
+        Replaces the store's contents with a snapshot from ``dump_snapshot``.
+
+        Raises:
+            ValueError: If the file is damaged or has another format version.
+        """
+        load_snapshot(self, path)
+
+    def repositories(self) -> Tuple[Any, ...]:
+        """
+        The shared repositories in ServiceFactory strategy order.
+
+        Returns:
+            tuple: (PersonRepo, TeamRepo, InitiativeRepo, InitiativeTypeRepo, OrganizationRepo, OrgUnitRepo)
+        """
+        return (
+            self.persons,
+            self.teams,
+            self.initiatives,
+            self.initiative_types,
+            self.organizations,
+            self.org_units,
+        )
@@ -1,17 +1,26 @@
-from eo_lib.infrastructure.database.postgres_client import PostgresClient
-from libbase.infrastructure.sql_repository import GenericSqlRepository
+from typing import Dict, Sequence
+from eo_lib.infrastructure.repositories.postgres_repository import PostgresRepository
 from eo_lib.domain.entities.initiative import Initiative
+from eo_lib.domain.hierarchy import InitiativeRollup
 from eo_lib.domain.repositories.initiative_repository import InitiativeRepository
+from eo_lib.infrastructure.repositories.hierarchy import rollups_from_rows
+from eo_lib.infrastructure.repositories.sql_statements import rollup_statement
 
 
 class PostgresInitiativeRepository(
-    GenericSqlRepository[Initiative], InitiativeRepository
+    PostgresRepository[Initiative], InitiativeRepository
 ):
     """
     PostgreSQL implementation of the Initiative Repository.
     """
 
     def __init__(self):
-        """Initializes the repository by getting a session from PostgresClient."""
-        client = PostgresClient()
-        super().__init__(client.get_session(), Initiative)
+        """Initializes the repository; the session is resolved per operation."""
+        super().__init__(Initiative)
+
+    def get_rollups(self, initiative_ids: Sequence[int]) -> Dict[int, InitiativeRollup]:
+        """Rolls up every requested subtree with one recursive query."""
+        if not initiative_ids:
+            return {}
+        statement = rollup_statement(list(initiative_ids))
+        return self._read(lambda: rollups_from_rows(self._session.execute(statement)))
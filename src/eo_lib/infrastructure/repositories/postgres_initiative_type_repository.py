@@ -1,6 +1,5 @@
 from typing import Optional
-from eo_lib.infrastructure.database.postgres_client import PostgresClient
-from libbase.infrastructure.sql_repository import GenericSqlRepository
+from eo_lib.infrastructure.repositories.postgres_repository import PostgresRepository
 from eo_lib.domain.entities.initiative import InitiativeType
 from eo_lib.domain.repositories.initiative_type_repository import (
     InitiativeTypeRepository,
@@ -8,20 +7,19 @@ from eo_lib.domain.repositories.initiative_type_repository import (
 
 
 class PostgresInitiativeTypeRepository(
-    GenericSqlRepository[InitiativeType], InitiativeTypeRepository
+    PostgresRepository[InitiativeType], InitiativeTypeRepository
 ):
     """
     PostgreSQL implementation of the InitiativeType Repository.
     """
 
     def __init__(self):
-        """Initializes the repository by getting a session from PostgresClient."""
-        client = PostgresClient()
-        super().__init__(client.get_session(), InitiativeType)
+        """Initializes the repository; the session is resolved per operation."""
+        super().__init__(InitiativeType)
 
     def get_by_name(self, name: str) -> Optional[InitiativeType]:
-        return (
-            self._session.query(InitiativeType)
+        return self._read(
+            lambda: self._session.query(InitiativeType)
             .filter(InitiativeType.name == name)
             .first()
         )
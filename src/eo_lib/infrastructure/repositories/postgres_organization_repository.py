@@ -1,17 +1,23 @@
+from typing import Any, Dict, Iterable
 from eo_lib.domain.entities import Organization
 from eo_lib.domain.repositories import OrganizationRepositoryInterface
-from libbase.infrastructure.sql_repository import GenericSqlRepository
-from eo_lib.infrastructure.database.postgres_client import PostgresClient
+from eo_lib.domain.upsert import UpsertResult
+from eo_lib.infrastructure.repositories.postgres_repository import PostgresRepository
 
 
 class PostgresOrganizationRepository(
-    GenericSqlRepository[Organization], OrganizationRepositoryInterface
+    PostgresRepository[Organization], OrganizationRepositoryInterface
 ):
     """
     PostgreSQL implementation of the Organization Repository.
     """
 
     def __init__(self):
-        """Initializes the repository by getting a session from PostgresClient."""
-        client = PostgresClient()
-        super().__init__(client.get_session(), Organization)
+        """Initializes the repository; the session is resolved per operation."""
+        super().__init__(Organization)
+
+    def upsert_many(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """Upserts organizations by name."""
+        return self._upsert_rows(rows, chunk_size)
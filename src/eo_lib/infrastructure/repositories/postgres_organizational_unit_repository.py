@@ -1,17 +1,149 @@
-from eo_lib.domain.entities import OrganizationalUnit
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+from eo_lib.config import Config
+from eo_lib.domain.entities import OrganizationalUnit, OrganizationalUnitClosure
+from eo_lib.domain.hierarchy import HierarchyNode
 from eo_lib.domain.repositories import OrganizationalUnitRepositoryInterface
-from libbase.infrastructure.sql_repository import GenericSqlRepository
-from eo_lib.infrastructure.database.postgres_client import PostgresClient
+from eo_lib.infrastructure.repositories.hierarchy import check_max_depth
+from eo_lib.infrastructure.repositories.postgres_repository import PostgresRepository
+from eo_lib.infrastructure.repositories.sql_statements import (
+    closure_attach_statement,
+    closure_contains_statement,
+    closure_detach_statement,
+    closure_parent_statement,
+    closure_rebuild_statement,
+    closure_self_statement,
+    closure_unlink_statement,
+    hierarchy_statement,
+    parse_path,
+)
 
 
 class PostgresOrganizationalUnitRepository(
-    GenericSqlRepository[OrganizationalUnit], OrganizationalUnitRepositoryInterface
+    PostgresRepository[OrganizationalUnit], OrganizationalUnitRepositoryInterface
 ):
     """
     PostgreSQL implementation of the Organizational Unit Repository.
+
+    When the closure table is enabled, add, update and delete maintain it
+    through the unit's own session, in the same transaction as the unit.
     """
 
-    def __init__(self):
-        """Initializes the repository by getting a session from PostgresClient."""
-        client = PostgresClient()
-        super().__init__(client.get_session(), OrganizationalUnit)
+    def __init__(self, closure: Optional[bool] = None):
+        """
+        Initializes the repository; the session is resolved per operation.
+
+        Args:
+            closure (bool, optional): Maintain and use the closure table.
+                Defaults to ``Config.ORG_UNIT_CLOSURE``.
+        """
+        super().__init__(OrganizationalUnit)
+        self._use_closure = Config.ORG_UNIT_CLOSURE if closure is None else closure
+
+    @contextmanager
+    def _write(self) -> Iterator[Session]:
+        """
+        Yields the session for a write and its closure maintenance.
+
+        Both are committed together on exit (only flushed inside a unit of
+        work) and rolled back together on error, on the same session that
+        owns the returned units.
+        """
+        session = self._session
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+    def add(self, entity: OrganizationalUnit) -> OrganizationalUnit:
+        """Inserts a unit and, if enabled, its closure pairs."""
+        if not self._use_closure:
+            return super().add(entity)
+        with self._write() as session:
+            session.add(entity)
+            session.flush()
+            session.execute(closure_self_statement(entity.id))
+            if entity.parent_id is not None:
+                session.execute(closure_attach_statement(entity.id, entity.parent_id))
+            session.refresh(entity)
+        return entity
+
+    def update(self, entity: OrganizationalUnit) -> OrganizationalUnit:
+        """Updates a unit and, if it was re-parented, moves its closure pairs."""
+        if not self._use_closure:
+            return super().update(entity)
+        with self._write() as session:
+            old_parent = session.scalar(closure_parent_statement(entity.id))
+            merged = session.merge(entity)
+            session.flush()
+            if old_parent != merged.parent_id:
+                session.expire(merged, ["parent"])
+                session.execute(closure_detach_statement(merged.id))
+                if merged.parent_id is not None:
+                    session.execute(
+                        closure_attach_statement(merged.id, merged.parent_id)
+                    )
+        return merged
+
+    def delete(self, id: int) -> bool:
+        """Deletes a unit after removing its closure pairs."""
+        if not self._use_closure:
+            return super().delete(id)
+        with self._write() as session:
+            entity = session.get(OrganizationalUnit, id)
+            if entity is None:
+                return False
+            session.execute(closure_detach_statement(id))
+            session.execute(closure_unlink_statement(id))
+            session.delete(entity)
+        return True
+
+    def _walk(
+        self, unit_id: int, descending: bool, max_depth: Optional[int]
+    ) -> List[HierarchyNode]:
+        check_max_depth(max_depth)
+        statement = hierarchy_statement(
+            OrganizationalUnit, unit_id, descending, max_depth
+        )
+        return self._read(
+            lambda: [
+                HierarchyNode(unit, depth, parse_path(path))
+                for unit, depth, path in self._session.execute(statement)
+            ]
+        )
+
+    def get_subtree(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """Retrieves a unit and its descendants with one recursive CTE."""
+        return self._walk(unit_id, True, max_depth)
+
+    def get_ancestry(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """Retrieves a unit and its ancestors with one recursive CTE."""
+        return self._walk(unit_id, False, max_depth)
+
+    def is_within(self, unit_id: int, ancestor_id: int) -> bool:
+        """One primary-key lookup in the closure table, or a recursive CTE."""
+        if not self._use_closure:
+            return any(
+                node.entity.id == ancestor_id for node in self.get_ancestry(unit_id)
+            )
+        statement = closure_contains_statement(unit_id, ancestor_id)
+        return self._read(lambda: self._session.scalar(statement) is not None)
+
+    def rebuild_closure(self) -> int:
+        """Replaces the closure table in one transaction."""
+        with self._write() as session:
+            units = session.scalar(select(func.count(OrganizationalUnit.id)))
+            session.execute(delete(OrganizationalUnitClosure))
+            session.execute(closure_rebuild_statement(units))
+            count = session.scalar(
+                select(func.count()).select_from(OrganizationalUnitClosure)
+            )
+        return count
@@ -1,16 +1,144 @@
-from eo_lib.domain.entities import Person
+from typing import Any, Dict, Iterable, KeysView, List, Mapping, Sequence, Set
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from eo_lib.domain.entities import Person, PersonEmail
 from eo_lib.domain.repositories import PersonRepositoryInterface
-from libbase.infrastructure.sql_repository import GenericSqlRepository
+from eo_lib.domain.upsert import UpsertResult
 
-from eo_lib.infrastructure.database.postgres_client import PostgresClient
+from eo_lib.infrastructure.batching import chunked
+from eo_lib.infrastructure.repositories.postgres_repository import PostgresRepository
+from eo_lib.infrastructure.repositories.sql_statements import (
+    email_changes,
+    first_person_per_email,
+    person_emails_prune_statement,
+    person_emails_statement,
+    person_emails_upsert_statement,
+    persons_by_email_statement,
+)
 
 
-class PostgresPersonRepository(GenericSqlRepository[Person], PersonRepositoryInterface):
+class PostgresPersonRepository(PostgresRepository[Person], PersonRepositoryInterface):
     """
     PostgreSQL implementation of the Person Repository.
     """
 
     def __init__(self):
-        """Initializes the repository by getting a session from PostgresClient."""
-        client = PostgresClient()
-        super().__init__(client.get_session(), Person)
+        """Initializes the repository; the session is resolved per operation."""
+        super().__init__(Person)
+
+    def add_many(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> List[int]:
+        """
+        Inserts persons and emails with multi-row INSERT ... RETURNING per chunk.
+
+        Bypasses ORM object construction; all chunks are committed together.
+        """
+        session = self._session
+        ids: List[int] = []
+        try:
+            for chunk in chunked(rows, chunk_size):
+                person_ids = session.scalars(
+                    insert(Person).returning(Person.id, sort_by_parameter_order=True),
+                    [
+                        {
+                            "name": row["name"],
+                            "identification_id": row.get("identification_id"),
+                            "birthday": row.get("birthday"),
+                        }
+                        for row in chunk
+                    ],
+                ).all()
+                emails = [
+                    {"person_id": person_id, "email": email}
+                    for person_id, row in zip(person_ids, chunk)
+                    for email in row.get("emails") or []
+                ]
+                if emails:
+                    session.execute(insert(PersonEmail), emails)
+                ids.extend(person_ids)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        return ids
+
+    def upsert_many(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """Upserts persons by identification_id and their emails by address."""
+        return self._upsert_rows(rows, chunk_size)
+
+    def _upsert_children(
+        self, session: Session, chunk: List[Dict[str, Any]], ids: Dict[Any, int]
+    ) -> Set[Any]:
+        """Replaces the email sets that differ, moving addresses between persons."""
+        keys: Dict[int, Any] = {}
+        wanted: Dict[int, List[str]] = {}
+        for row in chunk:
+            person_id = ids[row["identification_id"]]
+            keys[person_id] = row["identification_id"]
+            if row.get("emails") is not None:
+                wanted[person_id] = row["emails"]
+        if not wanted:
+            return set()
+        changed = self._write_emails(session, wanted)
+        return {keys[person_id] for person_id in changed}
+
+    def get_by_emails(self, emails: Sequence[str]) -> Dict[str, Person]:
+        """Resolves the addresses with one query on the ``lower(email)`` index."""
+        if not emails:
+            return {}
+        statement = persons_by_email_statement(emails)
+        return self._read(
+            lambda: first_person_per_email(self._session.execute(statement).unique())
+        )
+
+    def set_emails_many(self, emails: Mapping[int, Sequence[str]]) -> int:
+        """Writes only the email differences: one SELECT, DELETE and upsert."""
+        session = self._session
+        try:
+            changed = self._write_emails(session, emails)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        return len(changed)
+
+    def _write_emails(
+        self, session: Session, wanted: Mapping[int, Sequence[str]]
+    ) -> List[int]:
+        """Replaces the email sets that differ; returns those persons' IDs."""
+        stored = session.execute(person_emails_statement(wanted))
+        changed, owners = email_changes(wanted, stored)
+        if changed:
+            session.execute(person_emails_prune_statement(changed, owners))
+        if owners:
+            dialect_name = session.get_bind().dialect.name
+            session.execute(person_emails_upsert_statement(dialect_name, owners))
+        if changed:
+            self._expire_emails(session, set(changed), owners.keys())
+        return changed
+
+    @staticmethod
+    def _expire_emails(
+        session: Session, person_ids: Set[int], addresses: KeysView[str]
+    ) -> None:
+        """
+        Expires the loaded emails the bulk statements left stale.
+
+        The session keeps objects across commits, so persons whose set changed
+        or lost an address to them would otherwise keep the old collection.
+        """
+        for (model, ident, _), obj in list(session.identity_map.items()):
+            loaded = obj.__dict__
+            if model is PersonEmail:
+                if (
+                    loaded.get("email") in addresses
+                    or loaded.get("person_id") in person_ids
+                ):
+                    session.expire(obj)
+            elif model is Person:
+                emails = loaded.get("emails", ())
+                if ident[0] in person_ids or any(e.email in addresses for e in emails):
+                    session.expire(obj, ["emails"])
@@ -0,0 +1,276 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Type,
+    TypeVar,
+)
+from sqlalchemy.orm import Session
+from libbase.infrastructure.sql_repository import GenericSqlRepository
+
+from eo_lib.domain.query import UNSET, OrderBy, Where
+from eo_lib.domain.upsert import UPSERT_SPECS, UpsertResult
+from eo_lib.infrastructure.batching import chunked
+from eo_lib.infrastructure.database.postgres_client import PostgresClient
+from eo_lib.infrastructure.repositories.listing import (
+    check_listing_args,
+    check_query_args,
+    missing_anchor,
+)
+from eo_lib.infrastructure.repositories.load_profiles import load_options
+from eo_lib.infrastructure.repositories.sql_statements import (
+    anchor_statement,
+    natural_ids_statement,
+    page_statement,
+    project_statement,
+    query_statement,
+    stream_statement,
+    upsert_statement,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+S = TypeVar("S")
+
+
+class PostgresRepository(GenericSqlRepository[T]):
+    """
+    Base class for the PostgreSQL repositories.
+
+    The session is resolved on every access instead of being captured at
+    construction, so a long-lived repository follows the active
+    ``unit_of_work()`` scope or the calling thread's scoped session.
+    Reads outside a unit of work are routed to a read replica when
+    replicas are configured.
+
+    Default entity reads keep the objects already in the session's identity
+    map, including edits not yet flushed, and fill in only what they left
+    unloaded. Reads under an explicit load profile flush pending edits and
+    then run with ``populate_existing``, so an object is reloaded as the
+    profile asks even if an earlier read loaded it differently.
+    """
+
+    def __init__(self, model: Type[T], session: Optional[Session] = None):
+        """
+        Initializes the repository for a model.
+
+        Args:
+            model (Type[T]): The mapped entity class.
+            session (Session, optional): Pins the repository to an explicit
+                session instead of resolving it per operation. Defaults to None.
+        """
+        super().__init__(session, model)
+        self._model_class = model
+
+    @property
+    def _session(self) -> Session:
+        """The session for the current operation."""
+        if self._bound_session is not None:
+            return self._bound_session
+        return PostgresClient().current_session()
+
+    @_session.setter
+    def _session(self, session: Optional[Session]) -> None:
+        self._bound_session = session
+
+    def _read(self, operation: Callable[[], R]) -> R:
+        """Runs a read through the replica router unless the session is pinned."""
+        if self._bound_session is not None:
+            return operation()
+        return PostgresClient().run_read(operation)
+
+    def _profiled(self, statement: S, load_profile: Optional[str]) -> S:
+        """Reloads existing objects for an explicit profile, after a flush."""
+        if load_profile is None:
+            return statement
+        self._session.flush()
+        return statement.execution_options(populate_existing=True)
+
+    def get_by_id(self, id: int, load_profile: Optional[str] = None) -> Optional[T]:
+        """
+        Retrieves an entity by ID, optionally with a named load profile.
+
+        Args:
+            id (int): The entity ID.
+            load_profile (str, optional): See ``load_options``. Defaults to the
+                eager loading declared on the model mappings.
+        """
+        model = self._model_class
+
+        def read() -> Optional[T]:
+            query = self._session.query(model).options(
+                *load_options(model, load_profile)
+            )
+            return self._profiled(query, load_profile).filter(model.id == id).first()
+
+        return self._read(read)
+
+    def get_all(self, load_profile: Optional[str] = None) -> List[T]:
+        """
+        Retrieves all entities, optionally with a named load profile.
+
+        Args:
+            load_profile (str, optional): See ``load_options``.
+        """
+        model = self._model_class
+
+        def read() -> List[T]:
+            options = load_options(model, load_profile)
+            query = self._session.query(model).options(*options)
+            return self._profiled(query, load_profile).all()
+
+        return self._read(read)
+
+    def delete(self, id: int) -> bool:
+        """
+        Deletes an entity by ID, looking it up on the primary.
+        """
+        entity = self._session.get(self._model_class, id)
+        if entity is None:
+            return False
+        try:
+            self._session.delete(entity)
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+        return True
+
+    def list_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        order_by: str = "id",
+        load_profile: Optional[str] = None,
+        after_value: Any = UNSET,
+    ) -> List[T]:
+        """
+        Retrieves one page using a keyset (seek) predicate instead of OFFSET.
+
+        The page start is a row-value comparison on ``(order_by, id)``, so an
+        index on the sort column serves every page at the same cost. Without
+        ``after_value`` the anchor's sort value is read from its row first.
+        """
+        model = self._model_class
+        check_listing_args(model, limit, order_by)
+        options = load_options(model, load_profile)
+
+        def read() -> List[T]:
+            anchor = None if after_value is UNSET else after_value
+            if after_id is not None and order_by != "id" and after_value is UNSET:
+                row = self._session.execute(
+                    anchor_statement(model, order_by, after_id)
+                ).first()
+                if row is None:
+                    raise missing_anchor(after_id)
+                anchor = row[0]
+            statement = page_statement(
+                model, order_by, limit, after_id, anchor, options
+            )
+            statement = self._profiled(statement, load_profile)
+            return list(self._session.scalars(statement).unique())
+
+        return self._read(read)
+
+    def find(
+        self,
+        where: Optional[Where] = None,
+        order_by: OrderBy = "id",
+        limit: Optional[int] = None,
+        offset: int = 0,
+        load_profile: Optional[str] = None,
+    ) -> List[T]:
+        """
+        Translates the conditions, sort and slice into one SELECT.
+        """
+        model = self._model_class
+        conditions, ordering = check_query_args(model, where, order_by, limit, offset)
+        options = load_options(model, load_profile)
+        statement = query_statement(model, conditions, ordering, limit, offset, options)
+
+        def read() -> List[T]:
+            profiled = self._profiled(statement, load_profile)
+            return list(self._session.scalars(profiled).unique())
+
+        return self._read(read)
+
+    def iter_all(
+        self, batch_size: int = 1000, load_profile: Optional[str] = None
+    ) -> Iterator[T]:
+        """
+        Streams the table through a server-side cursor with ``yield_per``.
+        """
+        statement = stream_statement(self._model_class, batch_size, load_profile)
+        yield from self._session.scalars(statement)
+
+    def project(
+        self,
+        fields: Sequence[str],
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Selects only the requested columns in one statement.
+        """
+        statement = project_statement(self._model_class, fields, after_id, limit)
+        return self._read(
+            lambda: [dict(row) for row in self._session.execute(statement).mappings()]
+        )
+
+    def _upsert_rows(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int
+    ) -> UpsertResult:
+        """
+        Upserts by natural key with one ``INSERT ... ON CONFLICT`` per chunk.
+
+        A SELECT of the chunk's keys first tells inserts from updates; the
+        upsert only rewrites and returns the rows whose columns differ. All
+        chunks are committed together.
+        """
+        model = self._model_class
+        key, fields = UPSERT_SPECS[model]
+        session = self._session
+        dialect_name = session.get_bind().dialect.name
+        inserted = updated = unchanged = 0
+        try:
+            for chunk in chunked(rows, chunk_size):
+                keys = [row[key] for row in chunk]
+                existing = dict(
+                    session.execute(natural_ids_statement(model, key, keys)).all()
+                )
+                statement = upsert_statement(dialect_name, model, key, fields, chunk)
+                written = dict(session.execute(statement).all())
+                changed = written.keys() | self._upsert_children(
+                    session, chunk, {**existing, **written}
+                )
+                new = len(written.keys() - existing.keys())
+                inserted += new
+                updated += len(changed) - new
+                unchanged += len(chunk) - len(changed)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        return UpsertResult(inserted, updated, unchanged)
+
+    def _upsert_children(
+        self, session: Session, chunk: List[Dict[str, Any]], ids: Dict[Any, int]
+    ) -> Set[Any]:
+        """
+        Writes the collections carried by upserted rows.
+
+        Args:
+            session (Session): The session of the upsert.
+            chunk (List[dict]): The upserted rows.
+            ids (Dict): Entity ID per natural key of the chunk.
+
+        Returns:
+            Set: Keys of the rows whose collections changed.
+        """
+        return set()
@@ -1,24 +1,33 @@
-from typing import List
+from typing import Any, Dict, Iterable, List, Sequence
+from sqlalchemy import Executable
 from eo_lib.domain.entities import Team, TeamMember
-from eo_lib.domain.repositories import TeamRepositoryInterface
-from libbase.infrastructure.sql_repository import GenericSqlRepository
+from eo_lib.domain.repositories import Membership, TeamRepositoryInterface
+from eo_lib.domain.upsert import UpsertResult
 
-from eo_lib.infrastructure.database.postgres_client import PostgresClient
+from eo_lib.infrastructure.repositories.postgres_repository import PostgresRepository
+from eo_lib.infrastructure.repositories.role_registry import RoleRegistry
+from eo_lib.infrastructure.repositories.sql_statements import (
+    member_rows,
+    members_delete_statement,
+    members_insert_statement,
+    members_move_statement,
+)
 
 
-class PostgresTeamRepository(GenericSqlRepository[Team], TeamRepositoryInterface):
+class PostgresTeamRepository(PostgresRepository[Team], TeamRepositoryInterface):
     """
     PostgreSQL implementation of the Team Repository.
     """
 
     def __init__(self):
-        """Initializes the repository by getting a session from PostgresClient."""
-        client = PostgresClient()
-        super().__init__(client.get_session(), Team)
+        """Initializes the repository; the session is resolved per operation."""
+        super().__init__(Team)
 
     def add_member(self, member: TeamMember) -> TeamMember:
         """Persists a new TeamMember association in the database."""
         try:
+            if member.role_name and member.role is None:
+                member.role_id = self._role_ids([member.role_name])[member.role_name]
             self._session.add(member)
             self._session.commit()
             self._session.refresh(member)
@@ -38,4 +47,60 @@ class PostgresTeamRepository(GenericSqlRepository[Team], TeamRepositoryInterface
 
     def get_members(self, team_id: int) -> List[TeamMember]:
         """Retrieves all membership associations for a specific Team."""
-        return self._session.query(TeamMember).filter_by(team_id=team_id).all()
+        return self._read(
+            lambda: self._session.query(TeamMember).filter_by(team_id=team_id).all()
+        )
+
+    def _role_ids(self, names: Iterable[str]) -> Dict[str, int]:
+        """Resolves role names to IDs through the engine's role registry."""
+        session = self._session
+        return RoleRegistry.for_session(session).resolve(session, names)
+
+    def _execute_write(self, statement: Executable) -> int:
+        """Runs one UPDATE/DELETE and commits; returns the affected row count."""
+        try:
+            count = self._session.execute(statement).rowcount
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+        return count
+
+    def add_members(self, team_id: int, members: Sequence[Membership]) -> List[int]:
+        """Inserts every membership with one multi-row INSERT ... RETURNING."""
+        if not members:
+            return []
+        try:
+            role_ids = self._role_ids(role for _, role, _, _ in members if role)
+            ids = self._session.scalars(
+                members_insert_statement(), member_rows(team_id, members, role_ids)
+            ).all()
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+        return list(ids)
+
+    def remove_members(self, member_ids: Iterable[int]) -> int:
+        """Deletes the associations with one DELETE ... WHERE id IN (...)."""
+        ids = list(member_ids)
+        if not ids:
+            return 0
+        return self._execute_write(members_delete_statement(ids))
+
+    def move_members(
+        self, from_team_id: int, to_team_id: int, person_ids: Iterable[int]
+    ) -> int:
+        """Re-points the memberships with one UPDATE."""
+        ids = list(person_ids)
+        if not ids:
+            return 0
+        return self._execute_write(
+            members_move_statement(from_team_id, to_team_id, ids)
+        )
+
+    def upsert_many(
+        self, rows: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """Upserts teams by name."""
+        return self._upsert_rows(rows, chunk_size)
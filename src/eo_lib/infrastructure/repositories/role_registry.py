@@ -0,0 +1,137 @@
+import threading
+import weakref
+from typing import Dict, Iterable, List, Set, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from eo_lib.infrastructure.repositories.sql_statements import (
+    role_ids_statement,
+    role_upsert_statement,
+)
+
+# session.info key of the role IDs a transaction resolved but has not committed.
+_PENDING = "eo_lib.role_registry.pending"
+
+
+class RoleRegistry:
+    """
+    Process-wide cache of role name to role ID, one per database engine.
+
+    Cached names are resolved without touching the database. The remaining
+    names are looked up with one SELECT, and names that are still missing are
+    created with ``INSERT ... ON CONFLICT (name) DO NOTHING`` followed by a
+    second SELECT, so concurrent writers never fail on the unique name.
+
+    IDs only enter the cache once the transaction that resolved them commits;
+    a rollback discards them, so the cache never holds a role that was undone.
+    """
+
+    _registries: "weakref.WeakKeyDictionary[Engine, RoleRegistry]" = (
+        weakref.WeakKeyDictionary()
+    )
+    _registries_lock = threading.Lock()
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_session(cls, session: Session) -> "RoleRegistry":
+        """Returns the registry of the engine a (sync) session writes to."""
+        engine = session.get_bind()
+        with cls._registries_lock:
+            registry = cls._registries.get(engine)
+            if registry is None:
+                registry = cls._registries[engine] = cls()
+            return registry
+
+    def resolve(self, session: Session, names: Iterable[str]) -> Dict[str, int]:
+        """
+        Resolves role names to IDs, creating the roles that do not exist yet.
+
+        Args:
+            session (Session): The session of the ongoing write.
+            names (Iterable[str]): Role names; duplicates are fine.
+
+        Returns:
+            dict: Role ID per requested name.
+        """
+        found, missing = self._split(names)
+        if missing:
+            statement = role_ids_statement(missing)
+            resolved = dict(session.execute(statement).all())
+            absent = missing - resolved.keys()
+            if absent:
+                session.execute(
+                    role_upsert_statement(session.get_bind().dialect.name),
+                    [{"name": name} for name in sorted(absent)],
+                )
+                resolved.update(session.execute(role_ids_statement(absent)).all())
+            self._stage(session, resolved)
+            found.update(resolved)
+        return found
+
+    async def resolve_async(
+        self, session: AsyncSession, names: Iterable[str]
+    ) -> Dict[str, int]:
+        """Asyncio counterpart of ``resolve``."""
+        found, missing = self._split(names)
+        if missing:
+            statement = role_ids_statement(missing)
+            resolved = dict((await session.execute(statement)).all())
+            absent = missing - resolved.keys()
+            if absent:
+                dialect_name = session.sync_session.get_bind().dialect.name
+                await session.execute(
+                    role_upsert_statement(dialect_name),
+                    [{"name": name} for name in sorted(absent)],
+                )
+                statement = role_ids_statement(absent)
+                resolved.update((await session.execute(statement)).all())
+            self._stage(session.sync_session, resolved)
+            found.update(resolved)
+        return found
+
+    def invalidate(self) -> None:
+        """Forgets every cached role, e.g. after roles were renamed or deleted."""
+        with self._lock:
+            self._ids.clear()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _split(self, names: Iterable[str]) -> Tuple[Dict[str, int], Set[str]]:
+        """Separates the cached names from the ones the database must resolve."""
+        found: Dict[str, int] = {}
+        missing: Set[str] = set()
+        with self._lock:
+            for name in names:
+                role_id = self._ids.get(name)
+                if role_id is None:
+                    missing.add(name)
+                else:
+                    found[name] = role_id
+        return found, missing
+
+    def _stage(self, session: Session, resolved: Dict[str, int]) -> None:
+        """Keeps resolved IDs on the session until its transaction commits."""
+        pending: List[Tuple[RoleRegistry, Dict[str, int]]]
+        pending = session.info.setdefault(_PENDING, [])
+        pending.append((self, resolved))
+
+    def _publish(self, resolved: Dict[str, int]) -> None:
+        with self._lock:
+            self._ids.update(resolved)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending(session: Session) -> None:
+    for registry, resolved in session.info.pop(_PENDING, ()):
+        registry._publish(resolved)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING, None)
@@ -0,0 +1,587 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import (
+    CTE,
+    CompoundSelect,
+    Delete,
+    Insert,
+    Integer,
+    Select,
+    String,
+    Text,
+    Update,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    inspect,
+    literal,
+    null,
+    or_,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from eo_lib.domain.entities import (
+    Initiative,
+    OrganizationalUnit,
+    OrganizationalUnitClosure,
+    Person,
+    PersonEmail,
+    Role,
+    TeamMember,
+)
+from eo_lib.domain.entities.initiative import initiative_persons, initiative_teams
+from eo_lib.domain.query import In, Range
+from eo_lib.infrastructure.repositories.listing import (
+    RANGE_OPERATORS,
+    split_projection,
+)
+from eo_lib.infrastructure.repositories.load_profiles import FULL, load_options
+
+# Statement builders shared by the synchronous and asyncio SQL repositories.
+
+
+def anchor_statement(model: type, order_by: str, after_id: int) -> Select:
+    """Selects the sort value of the row a keyset page starts after."""
+    return select(getattr(model, order_by)).where(model.id == after_id)
+
+
+def page_statement(
+    model: type,
+    order_by: str,
+    limit: int,
+    after_id: Optional[int] = None,
+    anchor: Any = None,
+    options: Sequence[LoaderOption] = (),
+) -> Select:
+    """
+    Builds a keyset page query on ``(order_by, id)`` with NULLs last.
+
+    Args:
+        model (type): The mapped entity class.
+        order_by (str): Sort column, validated by ``check_listing_args``.
+        limit (int): Maximum page size.
+        after_id (int, optional): ID of the last row of the previous page.
+        anchor: The ``order_by`` value of that row (ignored when sorting by id).
+        options (Sequence[LoaderOption]): Loader options for the entities.
+    """
+    column = getattr(model, order_by)
+    nullable = order_by != "id" and model.__table__.columns[order_by].nullable
+
+    statement = select(model).options(*options)
+    if after_id is not None:
+        if order_by == "id":
+            statement = statement.where(model.id > after_id)
+        elif anchor is None:
+            statement = statement.where(column.is_(None), model.id > after_id)
+        else:
+            seek = tuple_(column, model.id) > tuple_(anchor, after_id)
+            if nullable:
+                seek = or_(seek, column.is_(None))
+            statement = statement.where(seek)
+
+    ordering = column.asc().nulls_last() if nullable else column
+    return statement.order_by(ordering, model.id).limit(limit)
+
+
+def query_statement(
+    model: type,
+    conditions: Dict[str, Any],
+    ordering: Sequence[Tuple[str, bool]],
+    limit: Optional[int],
+    offset: int,
+    options: Sequence[LoaderOption] = (),
+) -> Select:
+    """
+    Translates the arguments of a ``find`` into one SELECT.
+
+    Arguments are the ones returned by ``check_query_args``; the rows come
+    back in the order ``query_entities`` produces in process.
+    """
+    statement = select(model).options(*options)
+    for field, condition in conditions.items():
+        column = getattr(model, field)
+        if isinstance(condition, In):
+            statement = statement.where(column.in_(condition.values))
+        elif isinstance(condition, Range):
+            bounds = [
+                compare(column, bound)
+                for compare, bound in zip(RANGE_OPERATORS, condition)
+                if bound is not None
+            ]
+            statement = statement.where(*bounds or [column.is_not(None)])
+        elif condition is None:
+            statement = statement.where(column.is_(None))
+        else:
+            statement = statement.where(column == condition)
+
+    order = []
+    for field, descending in ordering:
+        column = getattr(model, field)
+        term = column.desc() if descending else column.asc()
+        nullable = model.__table__.columns[field].nullable
+        order.append(term.nulls_last() if nullable else term)
+    statement = statement.order_by(*order, model.id)
+    if offset:
+        statement = statement.offset(offset)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return statement
+
+
+def stream_statement(
+    model: type,
+    batch_size: int,
+    load_profile: Optional[str] = None,
+    preload: Sequence[str] = (),
+) -> Select:
+    """
+    Builds a full-table scan fetched in ``batch_size`` rows with ``yield_per``.
+
+    Joined-eager collections cannot be combined with ``yield_per``, so under
+    the default profile they (and ``preload``) are loaded per batch with
+    ``selectinload`` instead.
+    """
+    options = load_options(model, load_profile)
+    if load_profile in (None, FULL):
+        options = [
+            selectinload(getattr(model, rel.key))
+            for rel in inspect(model).relationships
+            if (rel.uselist and rel.lazy == "joined") or rel.key in preload
+        ]
+    return (
+        select(model)
+        .options(*options)
+        .order_by(model.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+
+def project_statement(
+    model: type,
+    fields: Sequence[str],
+    after_id: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> Select:
+    """
+    Selects only the requested columns in one statement.
+
+    Relationship fields are LEFT OUTER JOINed through an alias per
+    relationship, so no entity or related object is loaded.
+    """
+    aliases: Dict[str, Any] = {}
+    columns: List[Any] = []
+    for field, relation, column in split_projection(model, fields):
+        source = model
+        if relation is not None:
+            if relation not in aliases:
+                target = inspect(model).relationships[relation].mapper.class_
+                aliases[relation] = aliased(target)
+            source = aliases[relation]
+        columns.append(getattr(source, column).label(field))
+
+    statement = select(*columns).select_from(model)
+    for relation, alias in aliases.items():
+        statement = statement.outerjoin(getattr(model, relation).of_type(alias))
+    if after_id is not None:
+        statement = statement.where(model.id > after_id)
+    statement = statement.order_by(model.id)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return statement
+
+
+def tree_cte(
+    model: type,
+    start_ids: Sequence[int],
+    descending: bool = True,
+    max_depth: Optional[int] = None,
+) -> CTE:
+    """
+    Builds the recursive CTE behind the hierarchy queries.
+
+    Columns: ``root_id`` (the start row the walk began at), ``id``,
+    ``parent_id``, ``depth`` and ``path``, the slash-delimited chain of IDs
+    from the start row (``"/1/4/9/"``, see ``parse_path``). A row already on
+    the path is not visited again, so a corrupt cyclic hierarchy still
+    terminates.
+    """
+
+    def segment(id_column: Any) -> Any:
+        return cast(id_column, Text) + literal("/", Text)
+
+    tree = (
+        select(
+            model.id.label("root_id"),
+            model.id.label("id"),
+            model.parent_id.label("parent_id"),
+            literal(0).label("depth"),
+            (literal("/", Text) + segment(model.id)).label("path"),
+        )
+        .where(model.id.in_(start_ids))
+        .cte("tree", recursive=True)
+    )
+    step = model.parent_id == tree.c.id if descending else model.id == tree.c.parent_id
+    recursive = select(
+        tree.c.root_id,
+        model.id,
+        model.parent_id,
+        tree.c.depth + 1,
+        tree.c.path + segment(model.id),
+    ).where(
+        step,
+        ~tree.c.path.contains(literal("/", Text) + segment(model.id)),
+    )
+    if max_depth is not None:
+        recursive = recursive.where(tree.c.depth < max_depth)
+    return tree.union_all(recursive)
+
+
+def hierarchy_statement(
+    model: type,
+    start_id: int,
+    descending: bool = True,
+    max_depth: Optional[int] = None,
+) -> Select:
+    """
+    Walks a ``parent_id`` hierarchy with one recursive CTE.
+
+    Selects ``(entity, depth, path)`` for the start row and every row below
+    it (``descending``) or above it, ordered by depth, then ID.
+    """
+    tree = tree_cte(model, [start_id], descending, max_depth)
+    return (
+        select(model, tree.c.depth, tree.c.path)
+        .join(tree, model.id == tree.c.id)
+        .order_by(tree.c.depth, model.id)
+    )
+
+
+def rollup_statement(root_ids: Sequence[int]) -> CompoundSelect:
+    """
+    Aggregates the initiative subtrees of ``root_ids`` in one statement.
+
+    One recursive CTE feeds three branches combined with UNION ALL, each
+    row being ``(root_id, status, team_id, person_id, total)``:
+
+    * descendants per status: ``status`` and ``total`` are set;
+    * distinct teams of the root or any descendant: ``team_id`` is set;
+    * distinct persons of the root or any descendant: ``person_id`` is set.
+
+    The root is grouped with its descendants but not counted, so an existing
+    root without descendants still yields a status row with ``total`` 0.
+    """
+    tree = tree_cte(Initiative, root_ids)
+    no_int = cast(null(), Integer)
+    no_str = cast(null(), String)
+    statuses = (
+        select(
+            tree.c.root_id,
+            Initiative.status.label("status"),
+            no_int.label("team_id"),
+            no_int.label("person_id"),
+            func.count(case((tree.c.depth > 0, 1))).label("total"),
+        )
+        .join(Initiative, Initiative.id == tree.c.id)
+        .group_by(tree.c.root_id, Initiative.status)
+    )
+    teams = (
+        select(
+            tree.c.root_id,
+            no_str.label("status"),
+            initiative_teams.c.team_id,
+            no_int.label("person_id"),
+            no_int.label("total"),
+        )
+        .join(initiative_teams, initiative_teams.c.initiative_id == tree.c.id)
+        .distinct()
+    )
+    persons = (
+        select(
+            tree.c.root_id,
+            no_str.label("status"),
+            no_int.label("team_id"),
+            initiative_persons.c.person_id,
+            no_int.label("total"),
+        )
+        .join(initiative_persons, initiative_persons.c.initiative_id == tree.c.id)
+        .distinct()
+    )
+    return union_all(statuses, teams, persons)
+
+
+def parse_path(path: str) -> List[int]:
+    """Converts a ``hierarchy_statement`` path into the list of IDs."""
+    return [int(part) for part in path.strip("/").split("/")]
+
+
+# Closure table maintenance. Each builder is one set-based statement over
+# organizational_unit_closure; see ClosureIndex for the in-process version.
+
+_Closure = OrganizationalUnitClosure
+
+
+def closure_self_statement(unit_id: int) -> Insert:
+    """Inserts the depth-0 pair of a new unit."""
+    return insert(_Closure).values(ancestor_id=unit_id, descendant_id=unit_id, depth=0)
+
+
+def closure_attach_statement(unit_id: int, parent_id: int) -> Insert:
+    """Pairs every ancestor of ``parent_id`` with every unit of the subtree."""
+    above = aliased(_Closure)
+    below = aliased(_Closure)
+    pairs = (
+        select(above.ancestor_id, below.descendant_id, above.depth + below.depth + 1)
+        .join(below, below.ancestor_id == unit_id)
+        .where(above.descendant_id == parent_id)
+    )
+    return insert(_Closure).from_select(
+        ["ancestor_id", "descendant_id", "depth"], pairs
+    )
+
+
+def closure_detach_statement(unit_id: int) -> Delete:
+    """Deletes the pairs linking a unit's subtree to the units above it."""
+    subtree = select(_Closure.descendant_id).where(_Closure.ancestor_id == unit_id)
+    return delete(_Closure).where(
+        _Closure.descendant_id.in_(subtree),
+        _Closure.ancestor_id.not_in(subtree),
+    )
+
+
+def closure_unlink_statement(unit_id: int) -> Delete:
+    """Deletes the pairs a unit takes part in (after detaching it)."""
+    return delete(_Closure).where(
+        or_(_Closure.ancestor_id == unit_id, _Closure.descendant_id == unit_id)
+    )
+
+
+def closure_parent_statement(unit_id: int) -> Select:
+    """Selects a unit's parent as recorded in the closure table."""
+    return select(_Closure.ancestor_id).where(
+        _Closure.descendant_id == unit_id, _Closure.depth == 1
+    )
+
+
+def closure_contains_statement(unit_id: int, ancestor_id: int) -> Select:
+    """Primary-key lookup of one (ancestor, descendant) pair."""
+    return select(_Closure.depth).where(
+        _Closure.ancestor_id == ancestor_id, _Closure.descendant_id == unit_id
+    )
+
+
+def closure_rebuild_statement(max_depth: int) -> Insert:
+    """
+    Recomputes every pair from parent_id links with one recursive CTE.
+
+    ``max_depth`` (the number of units) bounds the recursion, and pairs are
+    grouped to their shortest depth, so a cyclic hierarchy cannot loop
+    forever or produce duplicate pairs.
+    """
+    unit = OrganizationalUnit
+    pairs = select(
+        unit.id.label("ancestor_id"),
+        unit.id.label("descendant_id"),
+        literal(0).label("depth"),
+    ).cte("pairs", recursive=True)
+    pairs = pairs.union_all(
+        select(pairs.c.ancestor_id, unit.id, pairs.c.depth + 1).where(
+            unit.parent_id == pairs.c.descendant_id, pairs.c.depth < max_depth
+        )
+    )
+    return insert(_Closure).from_select(
+        ["ancestor_id", "descendant_id", "depth"],
+        select(
+            pairs.c.ancestor_id, pairs.c.descendant_id, func.min(pairs.c.depth)
+        ).group_by(pairs.c.ancestor_id, pairs.c.descendant_id),
+    )
+
+
+# Set-based team membership changes.
+
+
+def role_ids_statement(names: Iterable[str]) -> Select:
+    """Selects ``(name, id)`` of the roles with the given names."""
+    return select(Role.name, Role.id).where(Role.name.in_(list(names)))
+
+
+def upsert_insert(dialect_name: str, model: type) -> Insert:
+    """
+    Starts an INSERT that supports ``ON CONFLICT`` on the given dialect.
+
+    Raises:
+        ValueError: If the dialect has no ``ON CONFLICT`` clause.
+    """
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise ValueError(f"Upserts are not supported on {dialect_name}")
+    return dialect_insert(model)
+
+
+def role_upsert_statement(dialect_name: str) -> Insert:
+    """Inserts roles by name, skipping names another transaction already added."""
+    return upsert_insert(dialect_name, Role).on_conflict_do_nothing(
+        index_elements=[Role.name]
+    )
+
+
+def natural_ids_statement(model: type, key: str, values: Sequence[Any]) -> Select:
+    """Selects ``(key, id)`` of the stored rows with the given key values."""
+    column = getattr(model, key)
+    return select(column, model.id).where(column.in_(list(values)))
+
+
+def upsert_statement(
+    dialect_name: str,
+    model: type,
+    key: str,
+    fields: Sequence[str],
+    rows: Sequence[Dict[str, Any]],
+) -> Insert:
+    """
+    Builds ``INSERT ... ON CONFLICT (key) DO UPDATE`` for a batch of rows.
+
+    Rows whose fields already match are left alone, so ``RETURNING (key, id)``
+    yields only the rows that were inserted or changed.
+    """
+    statement = upsert_insert(dialect_name, model).values(
+        [{column: row[column] for column in (key, *fields)} for row in rows]
+    )
+    table = model.__table__
+    return statement.on_conflict_do_update(
+        index_elements=[table.c[key]],
+        set_={field: statement.excluded[field] for field in fields},
+        where=or_(
+            *(
+                table.c[field].is_distinct_from(statement.excluded[field])
+                for field in fields
+            )
+        ),
+    ).returning(table.c[key], table.c.id)
+
+
+def person_emails_statement(person_ids: Iterable[int]) -> Select:
+    """Selects ``(person_id, email)`` of the given persons; email is None if none."""
+    return (
+        select(Person.id, PersonEmail.email)
+        .outerjoin(PersonEmail, PersonEmail.person_id == Person.id)
+        .where(Person.id.in_(list(person_ids)))
+    )
+
+
+def persons_by_email_statement(addresses: Iterable[str]) -> Select:
+    """
+    Selects ``(lower(email), Person)`` for normalized addresses.
+
+    Matches through the ``lower(email)`` index, so any number of addresses is
+    resolved in one query.
+    """
+    normalized = func.lower(PersonEmail.email)
+    return (
+        select(normalized, Person)
+        .join(PersonEmail, PersonEmail.person_id == Person.id)
+        .where(normalized.in_(list(addresses)))
+        .order_by(PersonEmail.id)
+    )
+
+
+def first_person_per_email(rows: Iterable[Tuple[str, Person]]) -> Dict[str, Person]:
+    """Maps each address to its Person, the oldest row winning on case clashes."""
+    found: Dict[str, Person] = {}
+    for address, person in rows:
+        found.setdefault(address, person)
+    return found
+
+
+def email_changes(
+    wanted: Dict[int, Sequence[str]], stored: Iterable[Tuple[int, str]]
+) -> Tuple[List[int], Dict[str, int]]:
+    """
+    Compares wanted email sets with the stored ``(person_id, email)`` rows.
+
+    Returns:
+        tuple: IDs of the persons whose set differs, and the owning person per
+            address those persons should have.
+
+    Raises:
+        ValueError: If a wanted person has no row in ``stored``.
+    """
+    current: Dict[int, set] = {}
+    for person_id, email in stored:
+        emails = current.setdefault(person_id, set())
+        if email is not None:
+            emails.add(email)
+    for person_id in wanted:
+        if person_id not in current:
+            raise ValueError(f"Person {person_id} not found")
+    changed = [
+        person_id
+        for person_id, emails in wanted.items()
+        if set(emails) != current[person_id]
+    ]
+    owners = {email: person_id for person_id in changed for email in wanted[person_id]}
+    return changed, owners
+
+
+def person_emails_upsert_statement(dialect_name: str, owners: Dict[str, int]) -> Insert:
+    """Inserts the addresses, moving those already stored to their new owner."""
+    rows = [{"email": email, "person_id": owner} for email, owner in owners.items()]
+    return upsert_statement(dialect_name, PersonEmail, "email", ("person_id",), rows)
+
+
+def person_emails_prune_statement(
+    person_ids: Iterable[int], keep: Iterable[str]
+) -> Delete:
+    """Deletes the emails of the given persons that are not in ``keep``."""
+    return delete(PersonEmail).where(
+        PersonEmail.person_id.in_(list(person_ids)),
+        PersonEmail.email.not_in(list(keep)),
+    )
+
+
+def member_rows(
+    team_id: int, members: Sequence[Sequence[Any]], role_ids: Dict[str, int]
+) -> List[Dict[str, Any]]:
+    """Builds the INSERT parameters of ``(person_id, role, start, end)`` tuples."""
+    return [
+        {
+            "team_id": team_id,
+            "person_id": person_id,
+            "role_id": role_ids[role] if role else None,
+            "start_date": start_date,
+            "end_date": end_date,
+        }
+        for person_id, role, start_date, end_date in members
+    ]
+
+
+def members_insert_statement() -> Insert:
+    """Multi-row TeamMember INSERT returning IDs in parameter order."""
+    return insert(TeamMember).returning(TeamMember.id, sort_by_parameter_order=True)
+
+
+def members_delete_statement(member_ids: Sequence[int]) -> Delete:
+    """Deletes the TeamMember associations with the given IDs."""
+    return delete(TeamMember).where(TeamMember.id.in_(member_ids))
+
+
+def members_move_statement(
+    from_team_id: int, to_team_id: int, person_ids: Sequence[int]
+) -> Update:
+    """Re-points the memberships of ``person_ids`` to another team."""
+    return (
+        update(TeamMember)
+        .where(
+            TeamMember.team_id == from_team_id,
+            TeamMember.person_id.in_(person_ids),
+        )
+        .values(team_id=to_team_id)
+    )
@@ -3,6 +3,14 @@ from .initiative_service import InitiativeService
 from .team_service import TeamService
 from .organization_service import OrganizationService
 from .organizational_unit_service import OrganizationalUnitService
+from .async_services import (
+    AsyncGenericService,
+    AsyncPersonService,
+    AsyncTeamService,
+    AsyncInitiativeService,
+    AsyncOrganizationService,
+    AsyncOrganizationalUnitService,
+)
 
 __all__ = [
     "PersonService",
@@ -10,4 +18,10 @@ __all__ = [
     "TeamService",
     "OrganizationService",
     "OrganizationalUnitService",
+    "AsyncGenericService",
+    "AsyncPersonService",
+    "AsyncTeamService",
+    "AsyncInitiativeService",
+    "AsyncOrganizationService",
+    "AsyncOrganizationalUnitService",
 ]
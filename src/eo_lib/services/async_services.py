@@ -0,0 +1,513 @@
+from datetime import date, datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+from eo_lib.domain.entities import (
+    Initiative,
+    InitiativeType,
+    Organization,
+    OrganizationalUnit,
+    Person,
+    PersonEmail,
+    Team,
+    TeamMember,
+)
+from eo_lib.domain.hierarchy import HierarchyNode, InitiativeRollup
+from eo_lib.domain.query import UNSET, OrderBy, Where
+from eo_lib.domain.upsert import UpsertResult
+from eo_lib.services.initiative_service import (
+    SUMMARY_FIELDS,
+    apply_initiative_details,
+    fill_type_names,
+    is_assigned,
+    missing_type_ids,
+)
+from eo_lib.services.organization_service import apply_organization_details
+from eo_lib.services.organizational_unit_service import (
+    apply_unit_details,
+    check_move,
+    parent_change,
+)
+from eo_lib.services.person_service import (
+    apply_person_details,
+    email_addresses,
+    email_sets,
+    person_rows,
+)
+from eo_lib.services.team_service import apply_team_details, membership_rows
+from eo_lib.services.upserts import upsert_rows
+
+T = TypeVar("T")
+
+
+class AsyncGenericService(Generic[T]):
+    """
+    Asyncio counterpart of GenericService plus the listing operations.
+
+    Awaits an asyncio repository (AsyncPostgres* or an AsyncRepositoryAdapter
+    around an in-process one). Validation and field updates are the helpers
+    of the synchronous service modules, so both flavours apply the same rules.
+    """
+
+    def __init__(self, repository: Any):
+        self._repository = repository
+
+    async def create(self, entity: T) -> T:
+        """Persists a new entity."""
+        return await self._repository.add(entity)
+
+    async def get_by_id(
+        self, id: int, load_profile: Optional[str] = None
+    ) -> Optional[T]:
+        """Retrieves an entity by ID, optionally with a named load profile."""
+        return await self._repository.get_by_id(id, load_profile=load_profile)
+
+    async def get_all(self, load_profile: Optional[str] = None) -> List[T]:
+        """Retrieves all entities, optionally with a named load profile."""
+        return await self._repository.get_all(load_profile=load_profile)
+
+    async def update(self, entity: T) -> T:
+        """Persists changes to an existing entity."""
+        return await self._repository.update(entity)
+
+    async def delete(self, id: int) -> bool:
+        """Deletes an entity by ID."""
+        return await self._repository.delete(id)
+
+    async def list_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        order_by: str = "id",
+        load_profile: Optional[str] = None,
+        after_value: Any = UNSET,
+    ) -> List[T]:
+        """Retrieves one page of entities using keyset pagination."""
+        return await self._repository.list_page(
+            after_id=after_id,
+            limit=limit,
+            order_by=order_by,
+            load_profile=load_profile,
+            after_value=after_value,
+        )
+
+    async def find(
+        self,
+        where: Optional[Where] = None,
+        order_by: OrderBy = "id",
+        limit: Optional[int] = None,
+        offset: int = 0,
+        load_profile: Optional[str] = None,
+    ) -> List[T]:
+        """Retrieves the entities matching ``where``, sorted and sliced."""
+        return await self._repository.find(
+            where,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
+            load_profile=load_profile,
+        )
+
+    def iter_all(
+        self, batch_size: int = 1000, load_profile: Optional[str] = None
+    ) -> AsyncIterator[T]:
+        """Streams every entity in bounded memory (``async for``)."""
+        return self._repository.iter_all(
+            batch_size=batch_size, load_profile=load_profile
+        )
+
+    async def project(
+        self,
+        fields: Sequence[str],
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Retrieves only the given fields of each entity, for list views."""
+        return await self._repository.project(fields, after_id=after_id, limit=limit)
+
+
+class AsyncPersonService(AsyncGenericService[Person]):
+    """
+    Asyncio service for Person-related business logic.
+    """
+
+    async def create_with_details(
+        self,
+        name: str,
+        emails: List[str] = None,
+        identification_id: str = None,
+        birthday: date = None,
+    ) -> Person:
+        """Creates and stores a new Person using detail arguments."""
+        person = Person(
+            name=name,
+            emails=emails,
+            identification_id=identification_id,
+            birthday=birthday,
+        )
+        return await self.create(person)
+
+    async def create_many(
+        self, persons: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> List[int]:
+        """Creates many Persons with their emails using batched inserts."""
+        return await self._repository.add_many(
+            person_rows(persons), chunk_size=chunk_size
+        )
+
+    async def upsert_many(
+        self, persons: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """Creates or updates Persons by identification_id; see PersonService."""
+        rows = upsert_rows(Person, persons, collections=("emails",))
+        return await self._repository.upsert_many(rows, chunk_size=chunk_size)
+
+    async def get_by_email(self, email: str) -> Optional[Person]:
+        """Finds the Person owning an email address, ignoring case."""
+        address = PersonEmail.normalize(email)
+        return (await self._repository.get_by_emails([address])).get(address)
+
+    async def get_by_emails(self, emails: Iterable[str]) -> Dict[str, Person]:
+        """Resolves many email addresses to their Persons; see PersonService."""
+        addresses = email_addresses(emails)
+        if not addresses:
+            return {}
+        return await self._repository.get_by_emails(addresses)
+
+    async def update_details(
+        self,
+        id: int,
+        name: str = None,
+        emails: List[str] = None,
+        identification_id: str = None,
+        birthday: date = None,
+    ) -> Person:
+        """Updates an existing Person's information finding it by ID first."""
+        p = await self.get_by_id(id)
+        if not p:
+            raise ValueError(f"Person {id} not found")
+
+        apply_person_details(p, name, emails, identification_id, birthday)
+        return await self.update(p)
+
+    async def update_emails_many(self, emails: Mapping[int, Iterable[str]]) -> int:
+        """Replaces the emails of many Persons; see PersonService."""
+        wanted = email_sets(emails)
+        if not wanted:
+            return 0
+        return await self._repository.set_emails_many(wanted)
+
+
+class AsyncTeamService(AsyncGenericService[Team]):
+    """
+    Asyncio service for Team-related business logic.
+    """
+
+    async def create_team(self, name: str, description: str) -> Team:
+        """Creates and stores a new Team."""
+        return await self.create(Team(name=name, description=description))
+
+    async def update_team_details(
+        self, id: int, name: str = None, description: str = None
+    ) -> Team:
+        """Updates an existing Team's information."""
+        t = await self.get_by_id(id)
+        if not t:
+            raise ValueError(f"Team {id} not found")
+
+        apply_team_details(t, name, description)
+        return await self.update(t)
+
+    async def upsert_many(
+        self, teams: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """Creates or updates Teams by name in batches."""
+        rows = upsert_rows(Team, teams)
+        return await self._repository.upsert_many(rows, chunk_size=chunk_size)
+
+    async def add_member(
+        self,
+        team_id: int,
+        person_id: int,
+        role: object = None,
+        role_id: int = None,
+        start_date=None,
+        end_date=None,
+    ) -> TeamMember:
+        """Adds a Person to a Team."""
+        return await self._repository.add_member(
+            TeamMember(
+                person_id=person_id,
+                team_id=team_id,
+                role=role,
+                role_id=role_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        )
+
+    async def remove_member(self, member_id: int) -> None:
+        """Removes a membership association by ID."""
+        if not await self._repository.remove_member(member_id):
+            raise ValueError(f"Member {member_id} not found")
+
+    async def get_members(self, team_id: int) -> List[TeamMember]:
+        """Retrieves all members of a specific Team."""
+        return await self._repository.get_members(team_id)
+
+    async def add_members(self, team_id: int, members: Iterable[Sequence]) -> List[int]:
+        """Enrolls many Persons from (person_id, role, start, end) tuples."""
+        return await self._repository.add_members(team_id, membership_rows(members))
+
+    async def remove_members(self, member_ids: Iterable[int]) -> int:
+        """Removes many memberships by ID; unknown IDs are ignored."""
+        return await self._repository.remove_members(list(member_ids))
+
+    async def move_members(
+        self, from_team_id: int, to_team_id: int, person_ids: Iterable[int]
+    ) -> int:
+        """Moves Persons from one Team to another, keeping role and dates."""
+        return await self._repository.move_members(
+            from_team_id, to_team_id, list(person_ids)
+        )
+
+
+class AsyncInitiativeService(AsyncGenericService[Initiative]):
+    """
+    Asyncio service for Initiative-related business logic.
+    """
+
+    def __init__(self, initiative_repo: Any, initiative_type_repo: Any, team_repo: Any):
+        super().__init__(initiative_repo)
+        self.initiative_type_repo = initiative_type_repo
+        self.team_repo = team_repo
+
+    async def _resolve_type(self, name: str) -> InitiativeType:
+        itype = await self.initiative_type_repo.get_by_name(name)
+        if not itype:
+            raise ValueError(f"InitiativeType '{name}' not found")
+        return itype
+
+    async def create_initiative_with_details(
+        self,
+        name: str,
+        description: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        initiative_type_name: Optional[str] = None,
+    ) -> Initiative:
+        """Creates an initiative, resolving its type by name."""
+        initiative = Initiative(
+            name=name,
+            description=description,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        if initiative_type_name:
+            itype = await self._resolve_type(initiative_type_name)
+            initiative.initiative_type_id = itype.id
+        return await self.create(initiative)
+
+    async def create_initiative_type(
+        self, name: str, description: Optional[str] = None
+    ) -> InitiativeType:
+        """Creates a new initiative type with a unique name."""
+        if await self.initiative_type_repo.get_by_name(name):
+            raise ValueError(f"InitiativeType '{name}' already exists")
+        return await self.initiative_type_repo.add(
+            InitiativeType(name=name, description=description)
+        )
+
+    async def list_initiative_types(self) -> List[InitiativeType]:
+        """Lists all initiative types."""
+        return await self.initiative_type_repo.get_all()
+
+    async def list_summaries(
+        self, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Lists initiatives as SUMMARY_FIELDS rows, including the type name."""
+        rows = await self.project(SUMMARY_FIELDS, after_id=after_id, limit=limit)
+        missing = missing_type_ids(rows)
+        if missing:
+            types = await self.initiative_type_repo.get_all()
+            fill_type_names(rows, missing, types)
+        return rows
+
+    async def update_initiative_details(
+        self,
+        initiative_id: int,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        initiative_type_name: Optional[str] = None,
+    ) -> Initiative:
+        """Updates an existing initiative."""
+        initiative = await self.get_by_id(initiative_id)
+        if not initiative:
+            raise ValueError(f"Initiative {initiative_id} not found")
+
+        apply_initiative_details(
+            initiative, name, description, status, start_date, end_date
+        )
+        if initiative_type_name:
+            itype = await self._resolve_type(initiative_type_name)
+            initiative.initiative_type_id = itype.id
+
+        return await self.update(initiative)
+
+    async def assign_team(self, initiative_id: int, team_id: int) -> None:
+        """Assigns a team to an initiative; assigning twice is a no-op."""
+        initiative = await self.get_by_id(initiative_id)
+        if not initiative:
+            raise ValueError(f"Initiative {initiative_id} not found")
+
+        team = await self.team_repo.get_by_id(team_id)
+        if not team:
+            raise ValueError(f"Team {team_id} not found")
+
+        if is_assigned(initiative, team):
+            return
+
+        initiative.teams.append(team)
+        await self.update(initiative)
+
+    async def get_teams(self, initiative_id: int) -> List[Team]:
+        """Lists the teams assigned to an initiative."""
+        initiative = await self.get_by_id(initiative_id)
+        if not initiative:
+            raise ValueError(f"Initiative {initiative_id} not found")
+        return initiative.teams
+
+    async def get_rollup(self, initiative_id: int) -> InitiativeRollup:
+        """Totals an initiative's whole subtree of sub-initiatives."""
+        rollups = await self._repository.get_rollups([initiative_id])
+        if initiative_id not in rollups:
+            raise ValueError(f"Initiative {initiative_id} not found")
+        return rollups[initiative_id]
+
+    async def get_rollups(
+        self, initiative_ids: Sequence[int]
+    ) -> Dict[int, InitiativeRollup]:
+        """Totals several subtrees at once; unknown IDs are left out."""
+        return await self._repository.get_rollups(initiative_ids)
+
+
+class AsyncOrganizationService(AsyncGenericService[Organization]):
+    """
+    Asyncio service for Organization-related business logic.
+    """
+
+    async def create_organization(
+        self, name: str, description: str = None, short_name: str = None
+    ) -> Organization:
+        """Creates a new Organization."""
+        return await self.create(
+            Organization(name=name, description=description, short_name=short_name)
+        )
+
+    async def update_organization_details(
+        self, id: int, name: str = None, description: str = None, short_name: str = None
+    ) -> Organization:
+        """Updates organization metadata."""
+        org = await self.get_by_id(id)
+        if not org:
+            raise ValueError(f"Organization {id} not found")
+
+        apply_organization_details(org, name, description, short_name)
+        return await self.update(org)
+
+    async def upsert_many(
+        self, organizations: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """Creates or updates Organizations by name in batches."""
+        rows = upsert_rows(Organization, organizations)
+        return await self._repository.upsert_many(rows, chunk_size=chunk_size)
+
+
+class AsyncOrganizationalUnitService(AsyncGenericService[OrganizationalUnit]):
+    """
+    Asyncio service for Organizational Unit-related business logic.
+    """
+
+    async def create_unit(
+        self,
+        name: str,
+        organization_id: int,
+        description: str = None,
+        short_name: str = None,
+        parent_id: int = None,
+    ) -> OrganizationalUnit:
+        """Creates a new Organizational Unit."""
+        return await self.create(
+            OrganizationalUnit(
+                name=name,
+                organization_id=organization_id,
+                description=description,
+                short_name=short_name,
+                parent_id=parent_id,
+            )
+        )
+
+    async def update_unit_details(
+        self,
+        id: int,
+        name: str = None,
+        description: str = None,
+        short_name: str = None,
+        parent_id: int = None,
+    ) -> OrganizationalUnit:
+        """Updates unit metadata."""
+        unit = await self.get_by_id(id)
+        if not unit:
+            raise ValueError(f"Organizational Unit {id} not found")
+
+        apply_unit_details(unit, name, description, short_name)
+        new_parent = parent_change(unit, parent_id)
+        if new_parent is not None:
+            check_move(id, await self._repository.is_within(new_parent, id))
+            unit.parent_id = new_parent
+
+        return await self.update(unit)
+
+    async def get_subtree(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """Retrieves a unit and every unit below it, with depth and path."""
+        nodes = await self._repository.get_subtree(unit_id, max_depth)
+        if not nodes:
+            raise ValueError(f"Organizational Unit {unit_id} not found")
+        return nodes
+
+    async def get_descendants(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """Retrieves every unit below a unit, without the unit itself."""
+        return (await self.get_subtree(unit_id, max_depth))[1:]
+
+    async def get_ancestors(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """Retrieves a unit's parents, nearest first, up to the root."""
+        nodes = await self._repository.get_ancestry(unit_id, max_depth)
+        if not nodes:
+            raise ValueError(f"Organizational Unit {unit_id} not found")
+        return nodes[1:]
+
+    async def is_within(self, unit_id: int, ancestor_id: int) -> bool:
+        """Checks whether a unit is ``ancestor_id`` itself or below it."""
+        return await self._repository.is_within(unit_id, ancestor_id)
+
+    async def rebuild_closure(self) -> int:
+        """Recomputes the closure table from the units' parent links."""
+        return await self._repository.rebuild_closure()
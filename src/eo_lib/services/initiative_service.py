@@ -1,15 +1,76 @@
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
 from datetime import datetime
 from eo_lib.domain.entities import Initiative, InitiativeType, Team
+from eo_lib.domain.hierarchy import InitiativeRollup
 from eo_lib.domain.repositories import (
     InitiativeRepository,
     InitiativeTypeRepository,
     TeamRepositoryInterface,
 )
 from libbase.services.generic_service import GenericService
+from eo_lib.services.listing import ListingServiceMixin
+from eo_lib.transactions import primary_reads
+
+
+# Fields of the initiative list view, fetched in one projection query.
+SUMMARY_FIELDS = (
+    "id",
+    "name",
+    "status",
+    "description",
+    "start_date",
+    "end_date",
+    "initiative_type_id",
+    "initiative_type.name",
+)
 
 
-class InitiativeService(GenericService[Initiative]):
+def missing_type_ids(rows: List[Dict[str, Any]]) -> Set[int]:
+    """Type IDs of SUMMARY_FIELDS rows whose type name the store left out."""
+    return {
+        row["initiative_type_id"]
+        for row in rows
+        if row["initiative_type_id"] is not None and row["initiative_type.name"] is None
+    }
+
+
+def fill_type_names(
+    rows: List[Dict[str, Any]], missing: Set[int], types: Iterable[InitiativeType]
+) -> None:
+    """Fills in the type names of the ``missing`` type IDs from ``types``."""
+    names = {t.id: t.name for t in types if t.id in missing}
+    for row in rows:
+        if row["initiative_type_id"] in missing:
+            row["initiative_type.name"] = names.get(row["initiative_type_id"])
+
+
+def apply_initiative_details(
+    initiative: Initiative,
+    name: Optional[str] = None,
+    description: Optional[str] = None,
+    status: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+) -> None:
+    """Applies the field arguments of update_initiative_details."""
+    if name:
+        initiative.name = name
+    if description:
+        initiative.description = description
+    if status:
+        initiative.status = status
+    if start_date:
+        initiative.start_date = start_date
+    if end_date:
+        initiative.end_date = end_date
+
+
+def is_assigned(initiative: Initiative, team: Team) -> bool:
+    """Whether a team is already assigned to an initiative."""
+    return any(t.id == team.id for t in initiative.teams)
+
+
+class InitiativeService(ListingServiceMixin[Initiative], GenericService[Initiative]):
     def __init__(
         self,
         initiative_repo: InitiativeRepository,
@@ -60,6 +121,22 @@ class InitiativeService(GenericService[Initiative]):
         self.initiative_type_repo.add(new_type)
         return new_type
 
+    def list_summaries(
+        self, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Lists initiatives as SUMMARY_FIELDS rows, including the type name.
+
+        Database backends join the type in the projection query. Stores that
+        do not attach related objects resolve the missing names with a single
+        read of the initiative types.
+        """
+        rows = self._repository.project(SUMMARY_FIELDS, after_id=after_id, limit=limit)
+        missing = missing_type_ids(rows)
+        if missing:
+            fill_type_names(rows, missing, self.initiative_type_repo.get_all())
+        return rows
+
     def list_initiative_types(self) -> List[InitiativeType]:
         return self.initiative_type_repo.get_all()
 
@@ -73,21 +150,14 @@ class InitiativeService(GenericService[Initiative]):
         end_date: Optional[datetime] = None,
         initiative_type_name: Optional[str] = None,
     ) -> Initiative:
-        initiative = self.get_by_id(initiative_id)
+        with primary_reads():
+            initiative = self.get_by_id(initiative_id)
         if not initiative:
             raise ValueError(f"Initiative {initiative_id} not found")
 
-        if name:
-            initiative.name = name
-        if description:
-            initiative.description = description
-        if status:
-            initiative.status = status
-        if start_date:
-            initiative.start_date = start_date
-        if end_date:
-            initiative.end_date = end_date
-
+        apply_initiative_details(
+            initiative, name, description, status, start_date, end_date
+        )
         if initiative_type_name:
             itype = self.initiative_type_repo.get_by_name(initiative_type_name)
             if itype:
@@ -99,16 +169,17 @@ class InitiativeService(GenericService[Initiative]):
         return initiative
 
     def assign_team(self, initiative_id: int, team_id: int) -> None:
-        initiative = self.get_by_id(initiative_id)
+        with primary_reads():
+            initiative = self.get_by_id(initiative_id)
+            team = self.team_repo.get_by_id(team_id)
         if not initiative:
             raise ValueError(f"Initiative {initiative_id} not found")
 
-        team = self.team_repo.get_by_id(team_id)
         if not team:
             raise ValueError(f"Team {team_id} not found")
 
         # Check if already assigned to avoid duplicates
-        if any(t.id == team.id for t in initiative.teams):
+        if is_assigned(initiative, team):
             return  # Already assigned
 
         initiative.teams.append(team)
@@ -119,3 +190,26 @@ class InitiativeService(GenericService[Initiative]):
         if not initiative:
             raise ValueError(f"Initiative {initiative_id} not found")
         return initiative.teams
+
+    def get_rollup(self, initiative_id: int) -> InitiativeRollup:
+        """
+        Totals an initiative's whole subtree of sub-initiatives.
+
+        Counts the descendants per status and collects every team and person
+        assigned to the initiative or any descendant, in one query.
+
+        Raises:
+            ValueError: If the initiative does not exist.
+        """
+        rollup = self._repository.get_rollups([initiative_id]).get(initiative_id)
+        if rollup is None:
+            raise ValueError(f"Initiative {initiative_id} not found")
+        return rollup
+
+    def get_rollups(self, initiative_ids: Sequence[int]) -> Dict[int, InitiativeRollup]:
+        """
+        Totals several subtrees at once (e.g. every program of a portfolio).
+
+        Unknown IDs are left out of the result.
+        """
+        return self._repository.get_rollups(initiative_ids)
@@ -0,0 +1,98 @@
+from typing import Any, Dict, Generic, Iterator, List, Optional, Sequence, TypeVar
+from eo_lib.domain.query import UNSET, OrderBy, Where
+
+T = TypeVar("T")
+
+
+class ListingServiceMixin(Generic[T]):
+    """
+    Adds scalable list operations to a GenericService.
+
+    Delegates to the ListingRepositoryInterface methods of the service's
+    repository. Reads also accept a named ``load_profile`` (``summary``,
+    ``full`` or a model-specific one such as ``with_members``) that controls
+    how much of the object graph the repository loads.
+    """
+
+    def get_by_id(self, id: int, load_profile: Optional[str] = None) -> Optional[T]:
+        """
+        Retrieves an entity by ID, optionally with a named load profile.
+        """
+        if load_profile is None:
+            return super().get_by_id(id)
+        return self._repository.get_by_id(id, load_profile=load_profile)
+
+    def get_all(self, load_profile: Optional[str] = None) -> List[T]:
+        """
+        Retrieves all entities, optionally with a named load profile.
+        """
+        if load_profile is None:
+            return super().get_all()
+        return self._repository.get_all(load_profile=load_profile)
+
+    def list_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        order_by: str = "id",
+        load_profile: Optional[str] = None,
+        after_value: Any = UNSET,
+    ) -> List[T]:
+        """
+        Retrieves one page of entities using keyset pagination.
+
+        Pass the ID of the last entity of a page as ``after_id`` to get the
+        next one; an empty list means the listing is exhausted. Passing its
+        ``order_by`` value as ``after_value`` too keeps paging correct when
+        that entity is deleted before the next page is read.
+        """
+        return self._repository.list_page(
+            after_id=after_id,
+            limit=limit,
+            order_by=order_by,
+            load_profile=load_profile,
+            after_value=after_value,
+        )
+
+    def iter_all(
+        self, batch_size: int = 1000, load_profile: Optional[str] = None
+    ) -> Iterator[T]:
+        """
+        Streams every entity in bounded memory, for exports and batch jobs.
+        """
+        return self._repository.iter_all(
+            batch_size=batch_size, load_profile=load_profile
+        )
+
+    def project(
+        self,
+        fields: Sequence[str],
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves only the given fields of each entity, for list views.
+        """
+        return self._repository.project(fields, after_id=after_id, limit=limit)
+
+    def find(
+        self,
+        where: Optional[Where] = None,
+        order_by: OrderBy = "id",
+        limit: Optional[int] = None,
+        offset: int = 0,
+        load_profile: Optional[str] = None,
+    ) -> List[T]:
+        """
+        Retrieves the entities matching ``where``, sorted and sliced.
+
+        Conditions are a value (equality), ``In(values)`` or ``Range(...)``
+        per column; ``order_by`` takes "-column" for descending.
+        """
+        return self._repository.find(
+            where,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
+            load_profile=load_profile,
+        )
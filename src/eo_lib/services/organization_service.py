@@ -1,10 +1,31 @@
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from eo_lib.domain.entities import Organization
 from eo_lib.domain.repositories import OrganizationRepositoryInterface
+from eo_lib.domain.upsert import UpsertResult
 from libbase.services.generic_service import GenericService
+from eo_lib.services.listing import ListingServiceMixin
+from eo_lib.transactions import primary_reads
+from eo_lib.services.upserts import upsert_rows
 
 
-class OrganizationService(GenericService[Organization]):
+def apply_organization_details(
+    org: Organization,
+    name: str = None,
+    description: str = None,
+    short_name: str = None,
+) -> None:
+    """Applies the given update_organization_details arguments."""
+    if name:
+        org.name = name
+    if description:
+        org.description = description
+    if short_name:
+        org.short_name = short_name
+
+
+class OrganizationService(
+    ListingServiceMixin[Organization], GenericService[Organization]
+):
     """
     Service for Organization-related business logic.
     """
@@ -28,16 +49,24 @@ class OrganizationService(GenericService[Organization]):
         """
         Updates organization metadata.
         """
-        org = self.get_by_id(id)
+        with primary_reads():
+            org = self.get_by_id(id)
         if not org:
             raise ValueError(f"Organization {id} not found")
 
-        if name:
-            org.name = name
-        if description:
-            org.description = description
-        if short_name:
-            org.short_name = short_name
-
+        apply_organization_details(org, name, description, short_name)
         self.update(org)
         return org
+
+    def upsert_many(
+        self, organizations: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """
+        Creates or updates Organizations by ``name`` in batches.
+
+        Each item is the full record (``name``, ``description``,
+        ``short_name``); missing fields are cleared.
+        Returns how many organizations were inserted, updated and unchanged.
+        """
+        rows = upsert_rows(Organization, organizations)
+        return self._repository.upsert_many(rows, chunk_size=chunk_size)
@@ -1,10 +1,50 @@
 from typing import List, Optional
 from eo_lib.domain.entities import OrganizationalUnit
+from eo_lib.domain.hierarchy import HierarchyNode
 from eo_lib.domain.repositories import OrganizationalUnitRepositoryInterface
 from libbase.services.generic_service import GenericService
+from eo_lib.services.listing import ListingServiceMixin
+from eo_lib.transactions import primary_reads
 
 
-class OrganizationalUnitService(GenericService[OrganizationalUnit]):
+def apply_unit_details(
+    unit: OrganizationalUnit,
+    name: str = None,
+    description: str = None,
+    short_name: str = None,
+) -> None:
+    """Applies the metadata arguments of update_unit_details to a unit."""
+    if name:
+        unit.name = name
+    if description:
+        unit.description = description
+    if short_name:
+        unit.short_name = short_name
+
+
+def parent_change(unit: OrganizationalUnit, parent_id: Optional[int]) -> Optional[int]:
+    """The parent a unit is moved to, or None if it stays where it is."""
+    if parent_id is not None and parent_id != unit.parent_id:
+        return parent_id
+    return None
+
+
+def check_move(unit_id: int, into_own_subtree: bool) -> None:
+    """
+    Rejects moving a unit under itself or one of its descendants.
+
+    Raises:
+        ValueError: If ``into_own_subtree`` is true.
+    """
+    if into_own_subtree:
+        raise ValueError(
+            f"Organizational Unit {unit_id} cannot be moved under its own subtree"
+        )
+
+
+class OrganizationalUnitService(
+    ListingServiceMixin[OrganizationalUnit], GenericService[OrganizationalUnit]
+):
     """
     Service for Organizational Unit-related business logic.
     Supports hierarchical structures.
@@ -45,18 +85,74 @@ class OrganizationalUnitService(GenericService[OrganizationalUnit]):
         """
         Updates unit metadata.
         """
-        unit = self.get_by_id(id)
+        with primary_reads():
+            unit = self.get_by_id(id)
         if not unit:
             raise ValueError(f"Organizational Unit {id} not found")
 
-        if name:
-            unit.name = name
-        if description:
-            unit.description = description
-        if short_name:
-            unit.short_name = short_name
-        if parent_id is not None:
-            unit.parent_id = parent_id
+        apply_unit_details(unit, name, description, short_name)
+        new_parent = parent_change(unit, parent_id)
+        if new_parent is not None:
+            with primary_reads():
+                check_move(id, self._repository.is_within(new_parent, id))
+            unit.parent_id = new_parent
 
         self.update(unit)
         return unit
+
+    def get_subtree(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """
+        Retrieves a unit and every unit below it.
+
+        Args:
+            unit_id (int): The root of the subtree (returned at depth 0).
+            max_depth (int, optional): Deepest level to include.
+
+        Returns:
+            List[HierarchyNode]: Each unit with its depth and the path of IDs
+            from ``unit_id``, ordered by depth, then ID.
+        """
+        nodes = self._repository.get_subtree(unit_id, max_depth)
+        if not nodes:
+            raise ValueError(f"Organizational Unit {unit_id} not found")
+        return nodes
+
+    def get_descendants(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """
+        Retrieves every unit below a unit, without the unit itself.
+        """
+        return self.get_subtree(unit_id, max_depth)[1:]
+
+    def get_ancestors(
+        self, unit_id: int, max_depth: Optional[int] = None
+    ) -> List[HierarchyNode]:
+        """
+        Retrieves a unit's parents, nearest first, up to the root.
+        """
+        nodes = self._repository.get_ancestry(unit_id, max_depth)
+        if not nodes:
+            raise ValueError(f"Organizational Unit {unit_id} not found")
+        return nodes[1:]
+
+    def is_within(self, unit_id: int, ancestor_id: int) -> bool:
+        """
+        Checks whether a unit is ``ancestor_id`` itself or below it.
+
+        A single indexed lookup when the closure table is enabled.
+        """
+        return self._repository.is_within(unit_id, ancestor_id)
+
+    def rebuild_closure(self) -> int:
+        """
+        Recomputes the closure table from the units' parent links.
+
+        Run it once after enabling ``ORG_UNIT_CLOSURE`` on existing data.
+
+        Returns:
+            int: Number of (ancestor, descendant) pairs stored.
+        """
+        return self._repository.rebuild_closure()
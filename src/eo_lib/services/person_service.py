@@ -1,11 +1,64 @@
-from typing import List
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
 from eo_lib.domain.repositories import PersonRepositoryInterface
 from eo_lib.domain.entities import Person, PersonEmail
+from eo_lib.domain.upsert import UpsertResult
 from libbase.services.generic_service import GenericService
+from eo_lib.services.listing import ListingServiceMixin
+from eo_lib.transactions import primary_reads
+from eo_lib.services.upserts import upsert_rows
 from datetime import date
 
 
-class PersonService(GenericService[Person]):
+def person_rows(persons: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Validates create_many input lazily into add_many rows.
+
+    Raises:
+        ValueError: If an item has no name.
+    """
+    for data in persons:
+        if not data.get("name"):
+            raise ValueError("Person name is required")
+        yield {
+            "name": data["name"],
+            "emails": list(data.get("emails") or []),
+            "identification_id": data.get("identification_id"),
+            "birthday": data.get("birthday"),
+        }
+
+
+def email_addresses(emails: Iterable[str]) -> List[str]:
+    """Normalizes email addresses for a lookup, dropping duplicates."""
+    return list(dict.fromkeys(PersonEmail.normalize(e) for e in emails))
+
+
+def email_sets(emails: Mapping[int, Iterable[str]]) -> Dict[int, List[str]]:
+    """Deduplicates the wanted addresses of each person for set_emails_many."""
+    return {
+        person_id: list(dict.fromkeys(addresses))
+        for person_id, addresses in emails.items()
+    }
+
+
+def apply_person_details(
+    person: Person,
+    name: str = None,
+    emails: List[str] = None,
+    identification_id: str = None,
+    birthday: date = None,
+) -> None:
+    """Applies the given update_details arguments to a Person."""
+    if name:
+        person.name = name
+    if identification_id:
+        person.identification_id = identification_id
+    if birthday:
+        person.birthday = birthday
+    if emails is not None:
+        person.set_emails(emails)
+
+
+class PersonService(ListingServiceMixin[Person], GenericService[Person]):
     """
     Service for managing Person-related business logic.
     Inherits generic CRUD operations from GenericService.
@@ -38,6 +91,51 @@ class PersonService(GenericService[Person]):
         self.create(person)
         return person
 
+    def create_many(
+        self, persons: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> List[int]:
+        """
+        Creates many Persons with their emails using batched inserts.
+
+        Each item accepts the create_with_details arguments as keys
+        (``name`` is required). Input is consumed lazily in chunks.
+        Returns the new IDs in input order.
+        """
+        return self.repo.add_many(person_rows(persons), chunk_size=chunk_size)
+
+    def upsert_many(
+        self, persons: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """
+        Creates or updates Persons by ``identification_id`` in batches.
+
+        Each item is the full record (``name``, ``identification_id``,
+        ``birthday``; missing fields are cleared). An ``emails`` list becomes
+        the person's exact set of emails, taking addresses over from other
+        persons; without it, emails are left as they are.
+        Returns how many persons were inserted, updated and unchanged.
+        """
+        rows = upsert_rows(Person, persons, collections=("emails",))
+        return self.repo.upsert_many(rows, chunk_size=chunk_size)
+
+    def get_by_email(self, email: str) -> Optional[Person]:
+        """Finds the Person owning an email address, ignoring case."""
+        address = PersonEmail.normalize(email)
+        return self.repo.get_by_emails([address]).get(address)
+
+    def get_by_emails(self, emails: Iterable[str]) -> Dict[str, Person]:
+        """
+        Resolves many email addresses to their Persons in one lookup.
+
+        Addresses match ignoring case and surrounding blanks. Returns the
+        found Persons keyed by normalized (lower-cased) address; unknown
+        addresses are left out.
+        """
+        addresses = email_addresses(emails)
+        if not addresses:
+            return {}
+        return self.repo.get_by_emails(addresses)
+
     def update_details(
         self,
         id: int,
@@ -49,18 +147,24 @@ class PersonService(GenericService[Person]):
         """
         Updates an existing Person's information finding it by ID first.
         """
-        p = self.get_by_id(id)
+        with primary_reads():
+            p = self.get_by_id(id)
         if not p:
             raise ValueError(f"Person {id} not found")
-            
-        if name:
-            p.name = name
-        if identification_id:
-            p.identification_id = identification_id
-        if birthday:
-            p.birthday = birthday
-        if emails is not None:
-            p.emails = [PersonEmail(email=e) for e in emails]
-            
+
+        apply_person_details(p, name, emails, identification_id, birthday)
         self.update(p)
         return p
+
+    def update_emails_many(self, emails: Mapping[int, Iterable[str]]) -> int:
+        """
+        Replaces the emails of many Persons, writing only what differs.
+
+        Each person's list becomes their exact set of emails, taking addresses
+        over from other persons. Unchanged addresses are not touched.
+        Returns how many of the given persons had their set changed.
+        """
+        wanted = email_sets(emails)
+        if not wanted:
+            return 0
+        return self.repo.set_emails_many(wanted)
@@ -1,10 +1,40 @@
-from typing import List
-from eo_lib.domain.repositories import TeamRepositoryInterface
+from typing import Any, Dict, Iterable, List, Sequence
+from eo_lib.domain.repositories import Membership, TeamRepositoryInterface
 from eo_lib.domain.entities import Team, TeamMember
+from eo_lib.domain.upsert import UpsertResult
 from libbase.services.generic_service import GenericService
+from eo_lib.services.listing import ListingServiceMixin
+from eo_lib.transactions import primary_reads
+from eo_lib.services.upserts import upsert_rows
 
 
-class TeamService(GenericService[Team]):
+def membership_rows(members: Iterable[Sequence]) -> List[Membership]:
+    """
+    Pads ``(person_id[, role[, start_date[, end_date]]])`` tuples to Memberships.
+
+    Raises:
+        ValueError: If a tuple is empty or has more than four items.
+    """
+    rows: List[Membership] = []
+    for member in members:
+        if not 1 <= len(member) <= 4:
+            raise ValueError(
+                "Members must be (person_id, role, start_date, end_date) tuples"
+            )
+        person_id, role, start_date, end_date = (*member, None, None, None)[:4]
+        rows.append((person_id, role, start_date, end_date))
+    return rows
+
+
+def apply_team_details(team: Team, name: str = None, description: str = None) -> None:
+    """Applies the given update_team_details arguments to a Team."""
+    if name:
+        team.name = name
+    if description:
+        team.description = description
+
+
+class TeamService(ListingServiceMixin[Team], GenericService[Team]):
     """
     Service for managing Team-related business logic.
     Inherits generic CRUD from GenericService.
@@ -26,18 +56,27 @@ class TeamService(GenericService[Team]):
         """
         Updates an existing Team's information.
         """
-        t = self.get_by_id(id)
+        with primary_reads():
+            t = self.get_by_id(id)
         if not t:
             raise ValueError(f"Team {id} not found")
-            
-        if name:
-            t.name = name
-        if description:
-            t.description = description
-            
+
+        apply_team_details(t, name, description)
         self.update(t)
         return t
 
+    def upsert_many(
+        self, teams: Iterable[Dict[str, Any]], chunk_size: int = 1000
+    ) -> UpsertResult:
+        """
+        Creates or updates Teams by ``name`` in batches.
+
+        Each item is the full record (``name``, ``description``, ``short_name``,
+        ``organization_id``); missing fields are cleared.
+        Returns how many teams were inserted, updated and unchanged.
+        """
+        return self.repo.upsert_many(upsert_rows(Team, teams), chunk_size=chunk_size)
+
     def add_member(
         self,
         team_id: int,
@@ -73,3 +112,39 @@ class TeamService(GenericService[Team]):
         Retrieves all members of a specific Team.
         """
         return self.repo.get_members(team_id)
+
+    def add_members(self, team_id: int, members: Iterable[Sequence]) -> List[int]:
+        """
+        Enrolls many Persons into a Team in one transaction.
+
+        Args:
+            team_id (int): ID of the Team.
+            members (Iterable[Sequence]): ``(person_id, role, start_date,
+                end_date)`` tuples; trailing items may be omitted.
+
+        Returns:
+            List[int]: IDs of the new memberships, in input order.
+        """
+        return self.repo.add_members(team_id, membership_rows(members))
+
+    def remove_members(self, member_ids: Iterable[int]) -> int:
+        """
+        Removes many membership associations by ID in one transaction.
+
+        Returns:
+            int: Number of memberships removed; unknown IDs are ignored.
+        """
+        return self.repo.remove_members(list(member_ids))
+
+    def move_members(
+        self, from_team_id: int, to_team_id: int, person_ids: Iterable[int]
+    ) -> int:
+        """
+        Moves Persons from one Team to another in one transaction.
+
+        Memberships keep their role and dates.
+
+        Returns:
+            int: Number of memberships moved.
+        """
+        return self.repo.move_members(from_team_id, to_team_id, list(person_ids))
@@ -0,0 +1,30 @@
+from typing import Any, Dict, Iterable, List, Sequence
+from eo_lib.domain.upsert import UPSERT_SPECS
+
+
+def upsert_rows(
+    model: type, rows: Iterable[Dict[str, Any]], collections: Sequence[str] = ()
+) -> List[Dict[str, Any]]:
+    """
+    Normalizes upsert input to one full record per natural key.
+
+    Every written column is present (missing ones become None) and each
+    collection is a list or None (left untouched). When a key repeats, the
+    last row wins.
+
+    Raises:
+        ValueError: If a row has no natural key or no name.
+    """
+    key, fields = UPSERT_SPECS[model]
+    records: Dict[Any, Dict[str, Any]] = {}
+    for data in rows:
+        if not data.get(key):
+            raise ValueError(f"{model.__name__} {key} is required for upserts")
+        if not data.get("name"):
+            raise ValueError(f"{model.__name__} name is required")
+        record = {key: data[key], **{field: data.get(field) for field in fields}}
+        for name in collections:
+            values = data.get(name)
+            record[name] = None if values is None else list(values)
+        records[data[key]] = record
+    return list(records.values())
@@ -0,0 +1,54 @@
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from sqlalchemy.orm import Session
+from eo_lib.config import Config
+
+
+@contextmanager
+def unit_of_work() -> Iterator[Optional[Session]]:
+    """
+    Runs a block of controller/service calls as one database transaction.
+
+    Every Postgres repository used inside the block, regardless of which
+    service or controller owns it, resolves the same Session. Writes are
+    flushed as they happen and committed once when the block exits; an
+    exception rolls back the whole batch. The Session is closed on exit, so
+    its identity map does not outlive the unit of work, and each thread or
+    asyncio task gets its own Session.
+
+    The memory and JSON storage strategies are not transactional; the block
+    simply runs and None is yielded.
+
+    Yields:
+        Session: The scoped Session, or None for non-database storage.
+    """
+    if Config.get_storage_type().lower() in ("memory", "json"):
+        yield None
+        return
+
+    from eo_lib.infrastructure.database.postgres_client import PostgresClient
+
+    with PostgresClient().session_scope() as session:
+        yield session
+
+
+@contextmanager
+def primary_reads() -> Iterator[None]:
+    """
+    Reads from the primary database for the duration of the block.
+
+    Services wrap the reads of a read-modify-write in it, so the objects they
+    change and write back never come from a lagging read replica. Reads
+    inside a unit_of_work() already use the primary.
+
+    The memory and JSON storage strategies have no replicas; the block
+    simply runs.
+    """
+    if Config.get_storage_type().lower() in ("memory", "json"):
+        yield
+        return
+
+    from eo_lib.infrastructure.database.postgres_client import PostgresClient
+
+    with PostgresClient.primary_reads():
+        yield
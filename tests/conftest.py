@@ -1,5 +1,77 @@
 import sys
 import os
+import pytest
 
 # Put src in path so tests can import eo_lib
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "postgres: needs a PostgreSQL server at EO_LIB_TEST_POSTGRES_URL"
+    )
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """PostgresClient singleton bound to a throwaway SQLite database."""
+    from eo_lib.config import Config
+    from eo_lib.domain.base import Base
+    from eo_lib.infrastructure.database.postgres_client import PostgresClient
+
+    monkeypatch.setattr(Config, "DATABASE_URL", f"sqlite:///{tmp_path / 'eo_lib.db'}")
+    monkeypatch.setattr(Config, "STORAGE_TYPE", "db")
+    monkeypatch.setattr(PostgresClient, "_instance", None)
+    client = PostgresClient()
+    Base.metadata.create_all(client._engine)
+    yield client
+    client._SessionLocal.remove()
+    client._engine.dispose()
+
+
+@pytest.fixture
+def postgres_client(monkeypatch):
+    """PostgresClient singleton bound to EO_LIB_TEST_POSTGRES_URL, with fresh tables."""
+    url = os.getenv("EO_LIB_TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("EO_LIB_TEST_POSTGRES_URL is not set")
+    from eo_lib.config import Config
+    from eo_lib.domain.base import Base
+    from eo_lib.infrastructure.database.postgres_client import PostgresClient
+
+    monkeypatch.setattr(Config, "DATABASE_URL", url)
+    monkeypatch.setattr(Config, "STORAGE_TYPE", "db")
+    monkeypatch.setattr(PostgresClient, "_instance", None)
+    client = PostgresClient()
+    Base.metadata.drop_all(client._engine)
+    Base.metadata.create_all(client._engine)
+    yield client
+    client._SessionLocal.remove()
+    Base.metadata.drop_all(client._engine)
+    client._engine.dispose()
+
+
+@pytest.fixture
+def async_client(tmp_path, monkeypatch):
+    """AsyncPostgresClient singleton bound to a throwaway aiosqlite database."""
+    from eo_lib.config import Config
+    from eo_lib.infrastructure.database.async_client import AsyncPostgresClient
+
+    monkeypatch.setattr(Config, "DATABASE_URL", f"sqlite:///{tmp_path / 'eo_lib.db'}")
+    monkeypatch.setattr(Config, "ASYNC_DATABASE_URL", None)
+    monkeypatch.setattr(Config, "STORAGE_TYPE", "db")
+    monkeypatch.setattr(AsyncPostgresClient, "_instance", None)
+    return AsyncPostgresClient()
+
+
+@pytest.fixture
+def memory_store(monkeypatch, request):
+    """Memory storage backed by a MemoryStore private to the test."""
+    from eo_lib.config import Config
+    from eo_lib.infrastructure.repositories import MemoryStore
+
+    name = f"test-{request.node.name}"
+    monkeypatch.setattr(Config, "STORAGE_TYPE", "memory")
+    monkeypatch.setattr(Config, "MEMORY_STORE", name)
+    yield MemoryStore.named(name)
+    MemoryStore.drop(name)
@@ -0,0 +1,188 @@
+import asyncio
+import pytest
+from eo_lib import (
+    AsyncInitiativeController,
+    AsyncPersonController,
+    AsyncTeamController,
+)
+from eo_lib.config import Config
+from eo_lib.domain.entities import InitiativeType, Person
+from eo_lib.infrastructure.repositories import AsyncPostgresPersonRepository
+
+
+def run(client, scenario):
+    async def main():
+        await client.create_tables()
+        try:
+            return await scenario()
+        finally:
+            await client.dispose()
+
+    return asyncio.run(main())
+
+
+def test_async_url_is_derived_from_database_url(monkeypatch):
+    monkeypatch.setattr(Config, "ASYNC_DATABASE_URL", None)
+    monkeypatch.setattr(Config, "DATABASE_URL", "postgresql://u:p@db:5432/eo")
+    assert Config.get_async_database_url() == "postgresql+asyncpg://u:p@db:5432/eo"
+
+
+def test_person_crud(async_client):
+    async def scenario():
+        ctrl = AsyncPersonController()
+        alice = await ctrl.create_person("Alice", emails=["a@x.com"])
+        await ctrl.update_person(alice.id, name="Alice B", emails=["b@x.com"])
+        loaded = await ctrl.get_by_id(alice.id)
+        assert loaded.name == "Alice B"
+        assert [e.email for e in loaded.emails] == ["b@x.com"]
+        assert await ctrl.delete(alice.id)
+        return await ctrl.get_all()
+
+    assert run(async_client, scenario) == []
+
+
+def test_concurrent_requests_share_pool(async_client):
+    async def scenario():
+        ctrl = AsyncPersonController()
+        await ctrl.create_persons({"name": f"P{i}"} for i in range(20))
+        pages = await asyncio.gather(
+            *(ctrl.list_page(after_id=i, limit=5) for i in range(0, 20, 5))
+        )
+        return [p.name for page in pages for p in page]
+
+    assert run(async_client, scenario) == [f"P{i}" for i in range(20)]
+
+
+def test_iter_all_streams(async_client):
+    async def scenario():
+        repo = AsyncPostgresPersonRepository()
+        await repo.add_many(
+            {"name": f"P{i}", "emails": [f"p{i}@x.com"]} for i in range(7)
+        )
+        return [p async for p in repo.iter_all(batch_size=3)]
+
+    persons = run(async_client, scenario)
+    assert [p.name for p in persons] == [f"P{i}" for i in range(7)]
+    assert [e.email for e in persons[6].emails] == ["p6@x.com"]
+
+
+def test_initiatives_and_teams(async_client):
+    async def scenario():
+        initiatives = AsyncInitiativeController()
+        teams = AsyncTeamController()
+        await initiatives.create_initiative_type("Research")
+        created = await initiatives.create_initiative(
+            "Mars", initiative_type_name="Research"
+        )
+        team = await teams.create_team("Alpha", "Rovers")
+        await initiatives.assign_team(created["id"], team.id)
+        person = await AsyncPersonController().create_person("Alice")
+        await teams.add_member(team.id, person.id, role="Dev")
+        listed = await initiatives.list_initiatives()
+        assigned = await initiatives.get_teams(created["id"])
+        return created, listed, assigned, await teams.get_members(team.id)
+
+    created, listed, assigned, members = run(async_client, scenario)
+    assert created["initiative_type"] == "Research"
+    assert listed[0]["initiative_type"] == "Research"
+    assert assigned == [{"id": 1, "name": "Alpha"}]
+    assert [(m.person.name, m.role.name) for m in members] == [("Alice", "Dev")]
+
+
+def test_session_scope_rolls_back_batch(async_client):
+    async def scenario():
+        repo = AsyncPostgresPersonRepository()
+        with pytest.raises(ValueError):
+            async with async_client.session_scope():
+                await repo.add(Person(name="Alice"))
+                raise ValueError("boom")
+        return await repo.get_all()
+
+    assert run(async_client, scenario) == []
+
+
+def test_session_scope_refuses_child_tasks(async_client):
+    async def scenario():
+        repo = AsyncPostgresPersonRepository()
+        await repo.add(Person(name="Alice"))
+        async with async_client.session_scope():
+            with pytest.raises(RuntimeError, match="belongs to the task"):
+                await asyncio.gather(repo.get_by_id(1), repo.get_by_id(1))
+            alice = await repo.get_by_id(1)
+
+        async def own_scope():
+            async with async_client.session_scope():
+                return (await repo.get_by_id(1)).name
+
+        return alice.name, await asyncio.gather(own_scope(), own_scope())
+
+    assert run(async_client, scenario) == ("Alice", ["Alice", "Alice"])
+
+
+def test_session_scope_rereads_keep_unflushed_edits(async_client):
+    async def scenario():
+        repo = AsyncPostgresPersonRepository()
+        await repo.add(Person(name="Alice"))
+        async with async_client.session_scope():
+            person = await repo.get_by_id(1)
+            person.name = "Alicia"
+            names = [(await repo.get_by_id(1)).name]
+            person.name = "Ali"
+            names.append((await repo.get_by_id(1, load_profile="summary")).name)
+        names.append((await repo.get_by_id(1)).name)
+        return names
+
+    assert run(async_client, scenario) == ["Alicia", "Ali", "Ali"]
+
+
+def test_rolled_back_initiative_type_is_not_cached(async_client):
+    from eo_lib.infrastructure.repositories import (
+        AsyncPostgresInitiativeTypeRepository,
+    )
+    from eo_lib.infrastructure.repositories.initiative_type_cache import (
+        AsyncCachedInitiativeTypeRepository,
+    )
+
+    async def scenario():
+        repo = AsyncCachedInitiativeTypeRepository(
+            AsyncPostgresInitiativeTypeRepository()
+        )
+        await repo.get_by_name("Space")  # loads the cache
+        with pytest.raises(ValueError):
+            async with async_client.session_scope():
+                await repo.add(InitiativeType(name="Research"))
+                raise ValueError("boom")
+        missing = await repo.get_by_name("Research")
+        created = await repo.add(InitiativeType(name="Research"))
+        return missing, created.id, (await repo.get_by_name("Research")).id
+
+    missing, created_id, cached_id = run(async_client, scenario)
+    assert missing is None
+    assert cached_id == created_id
+
+
+def test_upsert_persons(async_client):
+    async def scenario():
+        ctrl = AsyncPersonController()
+        rows = [{"name": "Ann", "identification_id": "A", "emails": ["a@x.com"]}]
+        first = await ctrl.upsert_persons(rows)
+        rows[0]["name"] = "Anne"
+        second = await ctrl.upsert_persons(rows)
+        third = await ctrl.upsert_persons(rows)
+        [ann] = await ctrl.get_all()
+        return first, second, third, ann
+
+    first, second, third, ann = run(async_client, scenario)
+    assert (first, second, third) == ((1, 0, 0), (0, 1, 0), (0, 0, 1))
+    assert (ann.name, [e.email for e in ann.emails]) == ("Anne", ["a@x.com"])
+
+
+def test_memory_storage_uses_adapter(monkeypatch):
+    monkeypatch.setattr(Config, "STORAGE_TYPE", "memory")
+
+    async def scenario():
+        ctrl = AsyncPersonController()
+        alice = await ctrl.create_person("Alice")
+        return await ctrl.get_by_id(alice.id)
+
+    assert asyncio.run(scenario()).name == "Alice"
@@ -0,0 +1,154 @@
+import csv
+import io
+import json
+from datetime import date
+from unittest.mock import MagicMock
+import pytest
+from eo_lib.domain.entities import Initiative, Person, Team
+from eo_lib.infrastructure.database.bulk_import import (
+    PostgresBulkImporter,
+    _CsvCopyStream,
+    read_csv,
+    read_ndjson,
+)
+
+
+def test_readers_stream_rows(tmp_path):
+    csv_path = tmp_path / "persons.csv"
+    csv_path.write_text("identification_id,name\nID1,Alice\nID2,Bob\n")
+    ndjson_path = tmp_path / "persons.ndjson"
+    ndjson_path.write_text(
+        json.dumps({"identification_id": "ID1", "name": "Alice"}) + "\n\n"
+    )
+
+    assert [r["name"] for r in read_csv(str(csv_path))] == ["Alice", "Bob"]
+    assert list(read_ndjson(str(ndjson_path))) == [
+        {"identification_id": "ID1", "name": "Alice"}
+    ]
+
+
+def test_copy_stream_encodes_rows_in_blocks():
+    progress = []
+    rows = [
+        {"name": "Alice, Jr.", "birthday": date(1990, 1, 2)},
+        {"name": "Bob", "birthday": None},
+    ]
+    stream = _CsvCopyStream(rows, ["name", "birthday"], progress.append)
+
+    blocks = []
+    while True:
+        block = stream.read(8)
+        if not block:
+            break
+        assert len(block) <= 8
+        blocks.append(block)
+
+    parsed = list(csv.reader(io.StringIO("".join(blocks))))
+    assert parsed == [["Alice, Jr.", "1990-01-02"], ["Bob", ""]]
+    assert stream.count == 2
+    assert progress == [1, 2]
+
+
+def test_unknown_target_is_rejected():
+    importer = PostgresBulkImporter(client=MagicMock())
+    with pytest.raises(ValueError):
+        importer.import_rows("projects", [])
+
+
+@pytest.mark.postgres
+def test_merge_keeps_the_last_row_per_key(postgres_client):
+    importer = PostgresBulkImporter()
+
+    persons = importer.import_rows(
+        "persons",
+        [
+            {"identification_id": "ID1", "name": "Alice", "birthday": "1990-01-02"},
+            {"identification_id": "ID2", "name": "Bob"},
+            {"identification_id": "ID1", "name": "Alicia", "birthday": "1991-03-04"},
+            {"name": "Nobody"},
+        ],
+    )
+    importer.import_rows(
+        "person_emails",
+        [
+            {"identification_id": "ID1", "email": "shared@x.com"},
+            {"identification_id": "ID2", "email": "shared@x.com"},
+            {"identification_id": "ID3", "email": "ghost@x.com"},
+        ],
+    )
+    importer.import_rows(
+        "teams",
+        [
+            {"name": "Core", "description": "first", "short_name": "C1"},
+            {"name": "Core", "description": "second", "short_name": "C2"},
+        ],
+    )
+    members = importer.import_rows(
+        "team_members",
+        [
+            {
+                "team_name": "Core",
+                "identification_id": "ID1",
+                "role": "Lead",
+                "start_date": "2024-01-01",
+            },
+            {
+                "team_name": "Core",
+                "email": "shared@x.com",
+                "role": "Lead",
+                "start_date": "2024-06-01",
+            },
+            {
+                "team_name": "Core",
+                "identification_id": "ID2",
+                "role": "Lead",
+                "start_date": "2024-09-01",
+            },
+        ],
+    )
+
+    session = postgres_client.get_session()
+    alicia = session.query(Person).filter_by(identification_id="ID1").one()
+    bob = session.query(Person).filter_by(identification_id="ID2").one()
+    core = session.query(Team).filter_by(name="Core").one()
+    assert persons == {"staged": 4, "merged": 2}
+    assert (alicia.name, str(alicia.birthday)) == ("Alicia", "1991-03-04")
+    assert [e.email for e in alicia.emails] == []
+    assert [e.email for e in bob.emails] == ["shared@x.com"]
+    assert (core.description, core.short_name) == ("second", "C2")
+    assert members == {"staged": 3, "merged": 2}
+    assert sorted(
+        (m.person_id, m.role.name, m.start_date.month) for m in core.members
+    ) == [(alicia.id, "Lead", 1), (bob.id, "Lead", 9)]
+
+
+@pytest.mark.postgres
+def test_link_targets_resolve_persons_and_skip_duplicates(postgres_client):
+    session = postgres_client.get_session()
+    session.add_all([Initiative("Apollo"), Team("Core")])
+    session.commit()
+    importer = PostgresBulkImporter()
+    importer.import_rows("persons", [{"identification_id": "ID1", "name": "Alice"}])
+    importer.import_rows(
+        "person_emails", [{"identification_id": "ID1", "email": "alice@x.com"}]
+    )
+
+    teams = importer.import_rows(
+        "initiative_teams",
+        [{"initiative_name": "Apollo", "team_name": "Core"}] * 2
+        + [{"initiative_name": "Apollo", "team_name": "Missing"}],
+    )
+    persons = importer.import_rows(
+        "initiative_persons",
+        [
+            {"initiative_name": "Apollo", "email": "alice@x.com"},
+            {"initiative_name": "Apollo", "identification_id": "ID1"},
+        ],
+    )
+
+    apollo = session.query(Initiative).filter_by(name="Apollo").one()
+    session.refresh(apollo)
+    assert teams == {"staged": 3, "merged": 1}
+    assert persons == {"staged": 2, "merged": 1}
+    assert [t.name for t in apollo.teams] == ["Core"]
+    assert [p.name for p in apollo.persons] == ["Alice"]
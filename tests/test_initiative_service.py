@@ -2,6 +2,9 @@ import pytest
 from unittest.mock import MagicMock
 from eo_lib.services.initiative_service import InitiativeService
 from eo_lib.domain.entities import Initiative, Team, InitiativeType
+from eo_lib.infrastructure.repositories.initiative_type_cache import (
+    CachedInitiativeTypeRepository,
+)
 
 
 @pytest.fixture
@@ -79,6 +82,21 @@ def test_list_initiatives(service, mock_initiative_repo):
     assert service.get_all() == []
 
 
+def test_list_summaries_resolves_missing_type_names(
+    service, mock_initiative_repo, mock_type_repo
+):
+    mock_initiative_repo.project.return_value = [
+        {"id": 1, "initiative_type_id": 10, "initiative_type.name": None},
+        {"id": 2, "initiative_type_id": None, "initiative_type.name": None},
+    ]
+    mock_type_repo.get_all.return_value = [InitiativeType(id=10, name="Space")]
+
+    rows = service.list_summaries(limit=2)
+
+    assert [r["initiative_type.name"] for r in rows] == ["Space", None]
+    mock_type_repo.get_all.assert_called_once()
+
+
 def test_assign_team(service, mock_initiative_repo, mock_team_repo):
     init = Initiative(name="Mars", id=1)
     team = Team(name="A", id=2)
@@ -102,3 +120,33 @@ def test_get_teams(service, mock_initiative_repo):
     teams = service.get_teams(1)
     assert len(teams) == 1
     assert teams[0] == team
+
+
+def test_get_rollup_raises_for_unknown_initiative(service, mock_initiative_repo):
+    mock_initiative_repo.get_rollups.return_value = {}
+    with pytest.raises(ValueError):
+        service.get_rollup(9)
+    mock_initiative_repo.get_rollups.assert_called_once_with([9])
+
+
+def test_cached_type_lookups_skip_the_store(mock_initiative_repo, mock_team_repo):
+    type_repo = MagicMock()
+    type_repo.get_all.return_value = [InitiativeType(name="Space", id=10)]
+    type_repo.get_by_name.return_value = None
+    type_repo.add.side_effect = lambda t: setattr(t, "id", 11)
+    service = InitiativeService(
+        mock_initiative_repo, CachedInitiativeTypeRepository(type_repo), mock_team_repo
+    )
+
+    service.create_initiative_type("Earth")
+    created = [
+        service.create_initiative_with_details(f"I{i}", initiative_type_name=name)
+        for i, name in enumerate(["Space", "Earth", "Space"])
+    ]
+
+    assert [i.initiative_type_id for i in created] == [10, 11, 10]
+    type_repo.get_all.assert_called_once()
+    type_repo.get_by_name.assert_called_once_with("Earth")
+    service.initiative_type_repo.delete(10)
+    with pytest.raises(ValueError):
+        service.create_initiative_with_details("I3", initiative_type_name="Space")
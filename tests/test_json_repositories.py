@@ -0,0 +1,112 @@
+import io
+import json
+import pytest
+from eo_lib.infrastructure.repositories.json_repositories import _JsonRecordStream
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        [{"id": 1, "name": "A, [x]"}, {"id": 2, "name": "B"}],
+        {"1": {"id": 1, "name": "A, [x]"}, "2": {"id": 2, "name": "B"}},
+    ],
+)
+def test_record_stream_decodes_across_blocks(document):
+    text = json.dumps(document, indent=2)
+
+    records = list(_JsonRecordStream(io.StringIO(text), read_size=3))
+
+    assert records == [{"id": 1, "name": "A, [x]"}, {"id": 2, "name": "B"}]
+
+
+def test_record_stream_handles_empty_documents():
+    assert list(_JsonRecordStream(io.StringIO("[]"))) == []
+    assert list(_JsonRecordStream(io.StringIO(""))) == []
+
+
+def test_team_member_batches_rewrite_one_file(tmp_path, monkeypatch):
+    from eo_lib.config import Config
+    from eo_lib.infrastructure.repositories import JsonTeamRepository
+
+    monkeypatch.setattr(Config, "JSON_DATA_DIR", str(tmp_path))
+    repo = JsonTeamRepository()
+
+    ids = repo.add_members(1, [(10, "Lead", None, None), (11, None, None, None)])
+    assert repo.move_members(1, 2, [11]) == 1
+    assert repo.remove_members([ids[0], 99]) == 1
+
+    [member] = repo.get_members(2)
+    assert (member.id, member.person_id) == (ids[1], 11)
+    assert json.loads((tmp_path / "team_members.json").read_text())[0]["team_id"] == 2
+
+
+def test_person_upsert_rewrites_one_file(tmp_path, monkeypatch):
+    from eo_lib.config import Config
+    from eo_lib.infrastructure.repositories import JsonPersonRepository
+
+    monkeypatch.setattr(Config, "JSON_DATA_DIR", str(tmp_path))
+    stored = [
+        {"id": 1, "name": "Ann", "emails": ["a@x.com"], "identification_id": "A"},
+        {"id": 2, "name": "Bob", "emails": [], "identification_id": "B"},
+    ]
+    (tmp_path / "persons.json").write_text(json.dumps(stored))
+    repo = JsonPersonRepository()
+
+    result = repo.upsert_many(
+        [
+            {"identification_id": "A", "name": "Ann", "birthday": None, "emails": None},
+            {
+                "identification_id": "B",
+                "name": "Bobby",
+                "birthday": None,
+                "emails": ["a@x.com"],
+            },
+            {"identification_id": "C", "name": "Cy", "birthday": None, "emails": None},
+        ]
+    )
+
+    assert result == (1, 1, 1)
+    records = json.loads((tmp_path / "persons.json").read_text())
+    assert [(r["id"], r["name"], r["emails"]) for r in records] == [
+        (1, "Ann", []),
+        (2, "Bobby", ["a@x.com"]),
+        (3, "Cy", []),
+    ]
+
+
+def test_person_email_index_follows_file_rewrites(tmp_path, monkeypatch):
+    from eo_lib.config import Config
+    from eo_lib.infrastructure.repositories import JsonPersonRepository
+
+    monkeypatch.setattr(Config, "JSON_DATA_DIR", str(tmp_path))
+    stored = [{"id": 1, "name": "Ann", "emails": ["Ann@X.com"]}]
+    (tmp_path / "persons.json").write_text(json.dumps(stored))
+    repo = JsonPersonRepository()
+
+    assert repo.get_by_emails(["ann@x.com", "b@x.com"])["ann@x.com"].name == "Ann"
+    assert repo.set_emails_many({1: ["b@x.com"]}) == 1
+    assert list(repo.get_by_emails(["ann@x.com", "b@x.com"])) == ["b@x.com"]
+
+
+def test_initiative_rollups(tmp_path, monkeypatch):
+    from eo_lib.config import Config
+    from eo_lib.domain.entities import Initiative
+    from eo_lib.infrastructure.repositories import JsonInitiativeRepository
+
+    monkeypatch.setattr(Config, "JSON_DATA_DIR", str(tmp_path))
+    repo = JsonInitiativeRepository()
+    for name, status, parent_id in [
+        ("Program", "active", None),
+        ("A", "active", 1),
+        ("B", "done", 2),
+        ("C", "done", 1),
+    ]:
+        repo.add(Initiative(name=name, status=status, parent_id=parent_id))
+
+    rollups = repo.get_rollups([1, 2, 99])
+
+    assert repo.get_by_id(3).parent_id == 2
+    assert rollups[1].descendants == 3
+    assert rollups[1].by_status == {"active": 1, "done": 2}
+    assert rollups[2].by_status == {"done": 1}
+    assert 99 not in rollups
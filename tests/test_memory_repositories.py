@@ -0,0 +1,342 @@
+from datetime import datetime
+import sys
+import threading
+import pytest
+from eo_lib.domain import In, Range
+from eo_lib.domain.entities import (
+    Initiative,
+    InitiativeType,
+    OrganizationalUnit,
+    Person,
+    TeamMember,
+)
+from eo_lib.infrastructure.repositories import (
+    InMemoryInitiativeRepository,
+    InMemoryInitiativeTypeRepository,
+    InMemoryOrgUnitRepository,
+    InMemoryPersonRepository,
+    InMemoryTeamRepository,
+)
+
+
+@pytest.fixture
+def person_repo():
+    repo = InMemoryPersonRepository()
+    for name in ["Carol", "Alice", "Bob", "Alice", "Dave"]:
+        repo.add(Person(name=name))
+    return repo
+
+
+def _walk(repo, **kwargs):
+    pages, after_id = [], None
+    while True:
+        page = repo.list_page(after_id=after_id, **kwargs)
+        if not page:
+            return pages
+        pages.append([(p.name, p.id) for p in page])
+        after_id = page[-1].id
+
+
+def test_list_page_by_id(person_repo):
+    pages = _walk(person_repo, limit=2)
+    assert [[i for _, i in page] for page in pages] == [[1, 2], [3, 4], [5]]
+
+
+def test_list_page_by_column_breaks_ties_on_id(person_repo):
+    pages = _walk(person_repo, limit=2, order_by="name")
+    assert pages == [
+        [("Alice", 2), ("Alice", 4)],
+        [("Bob", 3), ("Carol", 1)],
+        [("Dave", 5)],
+    ]
+
+
+def test_list_page_sorts_nulls_last():
+    repo = InMemoryInitiativeRepository()
+    repo.add(Initiative(name="A", start_date=datetime(2024, 1, 1)))
+    repo.add(Initiative(name="B"))
+    repo.add(Initiative(name="C", start_date=datetime(2023, 1, 1)))
+    repo.add(Initiative(name="D"))
+
+    pages = _walk(repo, limit=3, order_by="start_date")
+    assert [name for page in pages for name, _ in page] == ["C", "A", "B", "D"]
+
+
+def test_list_page_continues_after_deleted_anchor(person_repo):
+    first = person_repo.list_page(limit=2, order_by="name")
+    last = first[-1]
+    person_repo.delete(last.id)
+
+    with pytest.raises(ValueError):
+        person_repo.list_page(after_id=last.id, order_by="name")
+    rest = person_repo.list_page(
+        after_id=last.id, order_by="name", after_value=last.name
+    )
+    assert [(p.name, p.id) for p in rest] == [("Bob", 3), ("Carol", 1), ("Dave", 5)]
+
+
+def test_list_page_after_null_value():
+    repo = InMemoryInitiativeRepository()
+    repo.add(Initiative(name="A", start_date=datetime(2024, 1, 1)))
+    repo.add(Initiative(name="B"))
+    repo.add(Initiative(name="C"))
+
+    page = repo.list_page(after_id=2, order_by="start_date", after_value=None)
+    assert [i.name for i in page] == ["C"]
+
+
+def test_list_page_rejects_unknown_column(person_repo):
+    with pytest.raises(ValueError):
+        person_repo.list_page(order_by="emails")
+
+
+def test_iter_all_iterates_over_snapshot(person_repo):
+    names = []
+    for person in person_repo.iter_all():
+        names.append(person.name)
+        person_repo.add(Person(name="Late"))
+
+    assert names == ["Carol", "Alice", "Bob", "Alice", "Dave"]
+
+
+def test_concurrent_writers_keep_every_id_and_readers_see_snapshots():
+    people, teams = InMemoryPersonRepository(), InMemoryTeamRepository()
+    scans = [[], []]
+
+    def write(team_id):
+        for i in range(300):
+            people.add(Person(name=f"{team_id}-{i}"))
+            teams.add_member(TeamMember(person_id=i, team_id=team_id))
+
+    def read(sizes):
+        for _ in range(50):
+            sizes.append(sum(1 for _ in people.iter_all()))
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=write, args=(t,)) for t in range(4)]
+        threads += [threading.Thread(target=read, args=(s,)) for s in scans]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert sorted(p.id for p in people.get_all()) == list(range(1, 1201))
+    member_ids = [m.id for t in range(4) for m in teams.get_members(t)]
+    assert sorted(member_ids) == list(range(1, 1201))
+    assert all(sizes == sorted(sizes) for sizes in scans)
+
+
+def test_load_profiles_are_validated(person_repo):
+    assert len(person_repo.get_all(load_profile="summary")) == 5
+    with pytest.raises(ValueError):
+        person_repo.get_by_id(1, load_profile="with_teams")
+
+
+def test_project_returns_fields_in_id_order(person_repo):
+    rows = person_repo.project(["id", "name"], after_id=2, limit=2)
+    assert rows == [{"id": 3, "name": "Bob"}, {"id": 4, "name": "Alice"}]
+
+
+def test_org_unit_hierarchy_walks():
+    repo = InMemoryOrgUnitRepository()
+    for name, parent_id in [("Root", None), ("Eng", 1), ("Ops", 1), ("Backend", 2)]:
+        repo.add(OrganizationalUnit(name, organization_id=1, parent_id=parent_id))
+
+    subtree = repo.get_subtree(1)
+    ancestry = repo.get_ancestry(4, max_depth=1)
+
+    assert [(n.entity.name, n.depth, n.path) for n in subtree] == [
+        ("Root", 0, [1]),
+        ("Eng", 1, [1, 2]),
+        ("Ops", 1, [1, 3]),
+        ("Backend", 2, [1, 2, 4]),
+    ]
+    assert [(n.entity.name, n.path) for n in ancestry] == [
+        ("Backend", [4]),
+        ("Eng", [4, 2]),
+    ]
+    with pytest.raises(ValueError):
+        repo.get_subtree(1, max_depth=-1)
+
+
+def test_org_unit_walks_stop_on_cycles():
+    repo = InMemoryOrgUnitRepository()
+    repo.add(OrganizationalUnit("A", organization_id=1, parent_id=2))
+    repo.add(OrganizationalUnit("B", organization_id=1, parent_id=1))
+
+    assert [n.path for n in repo.get_subtree(1)] == [[1], [1, 2]]
+    assert [n.path for n in repo.get_ancestry(1)] == [[1], [1, 2]]
+
+
+def test_org_unit_walks_follow_the_parent_index(monkeypatch):
+    repo = InMemoryOrgUnitRepository()
+    for name, parent_id in [("Root", None), ("Eng", 1), ("Ops", 1), ("Backend", 2)]:
+        repo.add(OrganizationalUnit(name, organization_id=1, parent_id=parent_id))
+
+    def scan(*args, **kwargs):
+        raise AssertionError("hierarchy walks must not scan the store")
+
+    monkeypatch.setattr(repo, "get_all", scan)
+    monkeypatch.setattr(repo, "_values", scan)
+
+    assert [n.entity.name for n in repo.get_subtree(2)] == ["Eng", "Backend"]
+    assert [n.path for n in repo.get_ancestry(4)] == [[4], [4, 2], [4, 2, 1]]
+    assert repo.is_within(4, 1) and not repo.is_within(4, 3)
+    assert repo.get_subtree(9) == [] and repo.get_ancestry(9) == []
+
+
+def test_org_unit_closure_index_tracks_moves_and_deletes():
+    repo = InMemoryOrgUnitRepository(closure=True)
+    for name, parent_id in [("Root", None), ("Eng", 1), ("Ops", 1), ("Backend", 2)]:
+        repo.add(OrganizationalUnit(name, organization_id=1, parent_id=parent_id))
+
+    assert repo.is_within(4, 1) and not repo.is_within(4, 3)
+
+    eng = repo.get_by_id(2)
+    eng.parent_id = 3
+    repo.update(eng)
+
+    assert repo.is_within(4, 3) and repo.is_within(4, 1)
+    repo.delete(2)
+    assert not repo.is_within(4, 1) and repo.is_within(4, 4)
+    assert repo.rebuild_closure() == 4
+
+
+def test_initiative_rollups():
+    repo = InMemoryInitiativeRepository()
+    for name, status, parent_id in [
+        ("Program", "active", None),
+        ("A", "active", 1),
+        ("B", "done", 2),
+        ("C", "done", 1),
+    ]:
+        repo.add(Initiative(name=name, status=status, parent_id=parent_id))
+    repo.get_by_id(3).persons.append(Person(name="Ann", id=7))
+
+    rollups = repo.get_rollups([1, 2, 99])
+
+    assert rollups[1].descendants == 3
+    assert rollups[1].by_status == {"active": 1, "done": 2}
+    assert rollups[1].person_ids == [7]
+    assert rollups[2].by_status == {"done": 1}
+    assert 99 not in rollups
+
+
+def test_team_members_share_roles_by_name():
+    repo = InMemoryTeamRepository()
+
+    first = repo.add_member(TeamMember(person_id=1, team_id=1, role="Dev"))
+    second = repo.add_member(TeamMember(person_id=2, team_id=1, role="Dev"))
+    repo.add_members(1, [(3, "Lead", None, None)])
+
+    assert first.role is second.role and first.role_id == second.role_id == 1
+    assert [m.role.name for m in repo.get_members(1)] == ["Dev", "Dev", "Lead"]
+    assert repo.get_members(1)[2].role_id == 2
+
+
+def test_person_upsert_merges_by_identification_id():
+    repo = InMemoryPersonRepository()
+    repo.add(Person(name="Ann", identification_id="A", emails=["a@x.com"]))
+    repo.add(Person(name="Bob", identification_id="B"))
+
+    result = repo.upsert_many(
+        [
+            {"identification_id": "A", "name": "Ann", "birthday": None, "emails": None},
+            {
+                "identification_id": "B",
+                "name": "Bob",
+                "birthday": None,
+                "emails": ["a@x.com", "b@x.com"],
+            },
+            {"identification_id": "C", "name": "Cy", "birthday": None, "emails": []},
+        ]
+    )
+
+    assert result == (1, 1, 1)
+    ann, bob, cy = repo.get_all()
+    assert ann.emails == [] and [e.email for e in bob.emails] == ["a@x.com", "b@x.com"]
+    assert (cy.id, cy.name) == (3, "Cy")
+
+
+def test_person_email_index_follows_writes():
+    repo = InMemoryPersonRepository()
+    ann = Person(name="Ann", emails=["Ann@X.com"])
+    bob = Person(name="Bob", emails=["b@x.com"])
+    repo.add(ann)
+    repo.add(bob)
+
+    assert repo.get_by_emails(["ann@x.com", "c@x.com"]) == {"ann@x.com": ann}
+    repo.set_emails_many({bob.id: ["b@x.com", "ann@x.com"], ann.id: []})
+    assert repo.get_by_emails(["ann@x.com"]) == {"ann@x.com": bob}
+    repo.delete(bob.id)
+    assert repo.get_by_emails(["ann@x.com", "b@x.com"]) == {}
+
+
+def test_membership_indexes_follow_moves_and_removals():
+    repo = InMemoryTeamRepository()
+    ids = repo.add_members(1, [(10, None, None, None), (11, None, None, None)])
+    repo.add_member(TeamMember(person_id=12, team_id=2))
+
+    assert repo.move_members(1, 2, [11]) == 1
+    assert repo.remove_members([ids[0]]) == 1
+
+    assert repo.get_members(1) == []
+    assert [m.person_id for m in repo.get_members(2)] == [11, 12]
+
+
+def test_secondary_indexes_follow_updates_and_deletes():
+    types = InMemoryInitiativeTypeRepository()
+    itype = InitiativeType(name="Project")
+    types.add(itype)
+    itype.name = "Program"
+    types.update(itype)
+
+    assert types.get_by_name("Project") is None
+    assert types.get_by_name("Program") is itype
+
+    units = InMemoryOrgUnitRepository()
+    root = OrganizationalUnit(name="Root", organization_id=1)
+    units.add(root)
+    for name in ["A", "B"]:
+        units.add(OrganizationalUnit(name=name, organization_id=1, parent_id=root.id))
+    units.delete(2)
+
+    assert [u.name for u in units.find_by("parent_id", root.id)] == ["B"]
+    assert len(units.find_by("organization_id", 1)) == 2
+    with pytest.raises(ValueError, match="no index 'status'"):
+        units.find_by("status", "active")
+
+
+def test_find_filters_sorts_and_slices_through_indexes():
+    repo = InMemoryInitiativeRepository()
+    for i, (status, start) in enumerate(
+        [("active", 3), ("done", 1), ("active", None), ("active", 2), ("done", 5)]
+    ):
+        repo.add(
+            Initiative(
+                name=f"I{i}",
+                status=status,
+                start_date=datetime(2024, 1, start) if start else None,
+                initiative_type_id=i % 2 + 1,
+            )
+        )
+
+    active = repo.find({"status": "active"}, order_by="start_date")
+    typed = repo.find(
+        {"initiative_type_id": In([1]), "start_date": Range(ge=datetime(2024, 1, 2))},
+        order_by=["-start_date"],
+    )
+
+    assert [i.name for i in active] == ["I3", "I0", "I2"]
+    assert [i.name for i in typed] == ["I4", "I0"]
+    assert [i.name for i in repo.find(order_by="-start_date", limit=2, offset=1)] == [
+        "I0",
+        "I3",
+    ]
+    assert repo.find({"id": In([2, 9])}) == [repo.get_by_id(2)]
+    with pytest.raises(ValueError, match="Cannot filter Initiative by 'nope'"):
+        repo.find({"nope": 1})
@@ -0,0 +1,134 @@
+import asyncio
+from datetime import datetime
+import pytest
+from eo_lib import (
+    AsyncInitiativeController,
+    AsyncTeamController,
+    InitiativeController,
+    PersonController,
+    TeamController,
+)
+from eo_lib.config import Config
+from eo_lib.domain.entities import (
+    Initiative,
+    InitiativeType,
+    Organization,
+    OrganizationalUnit,
+    Person,
+    Team,
+    TeamMember,
+)
+from eo_lib.infrastructure.repositories import MemoryStore
+
+
+def test_controllers_share_the_named_store(memory_store):
+    red = TeamController().create_team("Red", "")
+    InitiativeController().create_initiative_type("Project")
+    initiatives = InitiativeController()
+    launch = initiatives.create_initiative("Launch", initiative_type_name="Project")
+
+    initiatives.assign_team(launch["id"], red.id)
+
+    assert [t.name for t in TeamController().get_all()] == ["Red"]
+    assert InitiativeController().get_teams(launch["id"]) == [
+        {"id": red.id, "name": "Red"}
+    ]
+    assert memory_store.teams.get_by_id(red.id) is red
+
+
+def test_async_controllers_share_the_sync_store(memory_store):
+    red = TeamController().create_team("Red", "")
+
+    async def scenario():
+        teams = await AsyncTeamController().get_all()
+        launch = await AsyncInitiativeController().create_initiative("Launch")
+        await AsyncInitiativeController().assign_team(launch["id"], red.id)
+        return teams, await AsyncInitiativeController().get_teams(launch["id"])
+
+    teams, assigned = asyncio.run(scenario())
+    assert teams == [red]
+    assert assigned == [{"id": red.id, "name": "Red"}]
+
+
+def test_stores_are_isolated_by_name(memory_store, monkeypatch):
+    PersonController().create_person("Ann")
+    monkeypatch.setattr(Config, "MEMORY_STORE", "")
+    assert PersonController().get_all() == []
+
+    monkeypatch.setattr(Config, "MEMORY_STORE", "other")
+    try:
+        assert PersonController().get_all() == []
+    finally:
+        MemoryStore.drop("other")
+    assert [p.name for p in memory_store.persons.get_all()] == ["Ann"]
+
+
+def test_other_storage_builds_only_the_service_repositories(monkeypatch):
+    from eo_lib.factories import ServiceFactory
+
+    built = []
+    strategies = tuple(
+        lambda slot=slot: built.append(slot) or slot for slot in range(6)
+    )
+    monkeypatch.setattr(Config, "STORAGE_TYPE", "json")
+    monkeypatch.setattr(ServiceFactory, "_get_strategies", lambda: strategies)
+
+    ServiceFactory.create_person_service()
+    ServiceFactory.create_initiative_service()
+    ServiceFactory.create_async_organizational_unit_service()
+
+    assert built == [0, 2, 3, 1, 5]
+
+
+def _populated_store():
+    store = MemoryStore()
+    acme = store.organizations.add(Organization(name="Acme"))
+    ann = store.persons.add(
+        Person(name="Ann", emails=["a@x.com"], organizations=[acme])
+    )
+    red = store.teams.add(Team(name="Red", organization_id=acme.id))
+    store.teams.add_member(TeamMember(person_id=ann.id, team_id=red.id, role="Lead"))
+    launch = store.initiatives.add(
+        Initiative(name="Launch", start_date=datetime(2024, 1, 1))
+    )
+    launch.teams.append(red)
+    launch.persons.append(ann)
+    store.org_units.add(OrganizationalUnit(name="HQ", organization_id=acme.id))
+    return store
+
+
+def test_snapshot_restores_entities_links_and_counters(tmp_path):
+    path = str(tmp_path / "store.snap")
+    _populated_store().dump_snapshot(path)
+    store = MemoryStore()
+    store.initiative_types.add(InitiativeType(name="Stale"))
+
+    store.load_snapshot(path)
+
+    [ann] = store.persons.get_all()
+    [launch] = store.initiatives.find({"name": "Launch"})
+    [member] = store.teams.get_members(1)
+    assert [e.email for e in ann.emails] == ["a@x.com"]
+    assert store.persons.get_by_emails(["a@x.com"]) == {"a@x.com": ann}
+    assert [o.name for o in ann.organizations] == ["Acme"]
+    assert launch.start_date == datetime(2024, 1, 1)
+    assert launch.teams == [store.teams.get_by_id(1)] and launch.persons == [ann]
+    assert (member.person_id, member.role.name) == (ann.id, "Lead")
+    assert store.initiative_types.get_all() == []
+    assert store.persons.add(Person(name="Bob")).id == 2
+    added = store.teams.add_member(TeamMember(person_id=2, team_id=1, role="Lead"))
+    assert (added.id, added.role) == (2, member.role)
+
+
+def test_snapshot_rejects_damaged_files(tmp_path):
+    path = tmp_path / "store.snap"
+    _populated_store().dump_snapshot(str(path))
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError, match="checksum"):
+        MemoryStore().load_snapshot(str(path))
+    path.write_bytes(b"not a snapshot")
+    with pytest.raises(ValueError, match="Not an eo_lib"):
+        MemoryStore().load_snapshot(str(path))
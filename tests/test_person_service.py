@@ -79,6 +79,24 @@ def test_update_person(service, mock_repo):
     assert result.name == "New"
 
 
+def test_update_details_keeps_unchanged_email_objects(service, mock_repo):
+    original = Person(name="Ann", emails=["a@test.com", "b@test.com"], id=1)
+    kept = original.emails[0]
+    mock_repo.get_by_id.return_value = original
+
+    result = service.update_details(1, emails=["a@test.com", "c@test.com"])
+
+    assert result.emails[0] is kept
+    assert [e.email for e in result.emails] == ["a@test.com", "c@test.com"]
+
+
+def test_update_emails_many_dedupes_addresses(service, mock_repo):
+    mock_repo.set_emails_many.return_value = 1
+
+    assert service.update_emails_many({1: iter(["a@x.com", "a@x.com"])}) == 1
+    mock_repo.set_emails_many.assert_called_once_with({1: ["a@x.com"]})
+
+
 def test_delete_person(service, mock_repo):
     mock_repo.delete.return_value = None
     service.delete(1)
@@ -94,3 +112,58 @@ def test_list_persons(service, mock_repo):
     assert len(result) == 2
     assert result[0] == p1
     assert result[1] == p2
+
+
+def test_create_many(service, mock_repo):
+    mock_repo.add_many.side_effect = lambda rows, chunk_size: [
+        i for i, _ in enumerate(rows, start=1)
+    ]
+
+    ids = service.create_many(
+        [{"name": "A", "emails": ["a@a.com"]}, {"name": "B"}], chunk_size=50
+    )
+
+    assert ids == [1, 2]
+    assert mock_repo.add_many.call_args.kwargs["chunk_size"] == 50
+
+
+def test_create_many_requires_name(service, mock_repo):
+    mock_repo.add_many.side_effect = lambda rows, chunk_size: list(rows)
+
+    with pytest.raises(ValueError):
+        service.create_many([{"emails": ["a@a.com"]}])
+
+
+def test_upsert_many_sends_one_full_record_per_key(service, mock_repo):
+    service.upsert_many(
+        [
+            {"name": "A", "identification_id": "X1", "emails": ("a@a.com",)},
+            {"name": "B", "identification_id": "X2"},
+            {"name": "A2", "identification_id": "X1", "birthday": date(2000, 1, 2)},
+        ]
+    )
+
+    rows = mock_repo.upsert_many.call_args.args[0]
+    assert rows == [
+        {
+            "identification_id": "X1",
+            "name": "A2",
+            "birthday": date(2000, 1, 2),
+            "emails": None,
+        },
+        {"identification_id": "X2", "name": "B", "birthday": None, "emails": None},
+    ]
+
+
+def test_upsert_many_requires_natural_key(service, mock_repo):
+    with pytest.raises(ValueError):
+        service.upsert_many([{"name": "A"}])
+
+
+def test_get_by_email_normalizes_addresses(service, mock_repo):
+    person = Person(name="Ann", id=1)
+    mock_repo.get_by_emails.return_value = {"ann@x.com": person}
+
+    assert service.get_by_email("  Ann@X.com") is person
+    mock_repo.get_by_emails.assert_called_once_with(["ann@x.com"])
+    assert service.get_by_emails([]) == {}
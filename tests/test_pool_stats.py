@@ -0,0 +1,56 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+from eo_lib.infrastructure.database.pool import InstrumentedQueuePool, PoolStatistics
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_histogram_buckets():
+    stats = PoolStatistics()
+    stats.record_wait(0.0005)
+    stats.record_wait(0.02)
+    stats.record_wait(10)
+
+    snap = stats.snapshot()
+    assert snap["checkouts"] == 3
+    assert snap["wait_time_histogram"]["le_1ms"] == 1
+    assert snap["wait_time_histogram"]["le_25ms"] == 1
+    assert snap["wait_time_histogram"]["gt_5000ms"] == 1
+    assert snap["wait_time_max"] == 10
+
+
+def test_pool_records_checkouts(engine):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        assert engine.pool.stats()["checked_out"] == 1
+
+    stats = engine.pool.stats()
+    assert stats["checked_out"] == 0
+    assert stats["checkouts"] == 1
+
+
+def test_pool_records_timeouts(engine):
+    with engine.connect():
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    assert engine.pool.stats()["timeouts"] == 1
+
+
+def test_statistics_survive_recreate(engine):
+    with engine.connect():
+        pass
+    engine.dispose()
+
+    assert engine.pool.stats()["checkouts"] == 1
@@ -0,0 +1,563 @@
+import pytest
+from sqlalchemy import event, inspect
+from eo_lib import unit_of_work
+from eo_lib.domain.entities import (
+    Initiative,
+    InitiativeType,
+    Organization,
+    OrganizationalUnit,
+    Person,
+    Role,
+    Team,
+    TeamMember,
+)
+from eo_lib.domain import In, Range
+from eo_lib.infrastructure.repositories import (
+    InMemoryTeamRepository,
+    PostgresInitiativeRepository,
+    PostgresInitiativeTypeRepository,
+    PostgresOrganizationalUnitRepository,
+    PostgresOrganizationRepository,
+    PostgresPersonRepository,
+    PostgresTeamRepository,
+)
+from eo_lib.services import PersonService
+
+
+def test_person_add_many(client):
+    repo = PostgresPersonRepository()
+    rows = (
+        {"name": f"P{i}", "identification_id": f"ID{i}", "emails": [f"p{i}@x.com"]}
+        for i in range(25)
+    )
+
+    ids = repo.add_many(rows, chunk_size=10)
+
+    assert len(ids) == 25
+    person = repo.get_by_id(ids[7])
+    assert person.name == "P7"
+    assert [e.email for e in person.emails] == ["p7@x.com"]
+
+
+def test_person_list_page(client):
+    repo = PostgresPersonRepository()
+    repo.add_many({"name": name} for name in ["Carol", "Alice", "Bob", "Alice"])
+
+    first = repo.list_page(limit=2, order_by="name")
+    second = repo.list_page(after_id=first[-1].id, limit=2, order_by="name")
+
+    assert [(p.name, p.id) for p in first] == [("Alice", 2), ("Alice", 4)]
+    assert [(p.name, p.id) for p in second] == [("Bob", 3), ("Carol", 1)]
+    assert repo.list_page(after_id=second[-1].id, order_by="name") == []
+
+
+def test_person_list_page_after_deleted_anchor(client):
+    repo = PostgresPersonRepository()
+    repo.add_many({"name": name} for name in ["Carol", "Alice", "Bob", "Alice"])
+    first = repo.list_page(limit=2, order_by="name")
+    last = first[-1]
+    repo.delete(last.id)
+
+    with pytest.raises(ValueError):
+        repo.list_page(after_id=last.id, order_by="name")
+    second = repo.list_page(after_id=last.id, order_by="name", after_value=last.name)
+    assert [(p.name, p.id) for p in second] == [("Bob", 3), ("Carol", 1)]
+
+
+def test_person_iter_all_streams_with_emails(client):
+    repo = PostgresPersonRepository()
+    repo.add_many({"name": f"P{i}", "emails": [f"p{i}@x.com"]} for i in range(7))
+
+    persons = list(repo.iter_all(batch_size=3))
+
+    assert [p.name for p in persons] == [f"P{i}" for i in range(7)]
+    assert [e.email for e in persons[6].emails] == ["p6@x.com"]
+
+
+def test_summary_profile_skips_relationships(client):
+    repo = PostgresPersonRepository()
+    [person_id] = repo.add_many([{"name": "Alice", "emails": ["a@x.com"]}])
+    client.current_session().expunge_all()
+
+    person = repo.get_by_id(person_id, load_profile="summary")
+
+    assert person.name == "Alice"
+    assert "emails" in inspect(person).unloaded
+
+
+def test_default_read_after_summary_loads_relationships(client):
+    repo = PostgresPersonRepository()
+    service = PersonService(repo)
+    [person_id] = repo.add_many([{"name": "Alice", "emails": ["a@x.com"]}])
+    client.current_session().expunge_all()
+
+    summary = repo.get_by_id(person_id, load_profile="summary")
+    person = repo.get_by_id(person_id)
+
+    assert person is summary
+    assert "emails" not in inspect(person).unloaded
+    assert [e.email for e in person.emails] == ["a@x.com"]
+    service.update_details(person_id, emails=["a@x.com", "b@x.com"])
+    client.current_session().expunge_all()
+    assert [e.email for e in repo.get_by_id(person_id).emails] == [
+        "a@x.com",
+        "b@x.com",
+    ]
+
+
+def test_rereads_keep_unflushed_edits(client):
+    repo = PostgresPersonRepository()
+    [person_id] = repo.add_many([{"name": "Alice", "emails": ["a@x.com"]}])
+
+    with unit_of_work():
+        person = repo.get_by_id(person_id)
+        person.name = "Alicia"
+        assert repo.get_by_id(person_id).name == "Alicia"
+        assert [p.name for p in repo.find(where={"id": person_id})] == ["Alicia"]
+        person.name = "Ali"
+        assert repo.get_by_id(person_id, load_profile="summary").name == "Ali"
+
+    client.current_session().expunge_all()
+    assert repo.get_by_id(person_id).name == "Ali"
+
+
+def test_with_members_profile_loads_members(client):
+    person_repo = PostgresPersonRepository()
+    team_repo = PostgresTeamRepository()
+    person = Person(name="Alice", emails=["a@x.com"])
+    person_repo.add(person)
+    team = Team(name="Alpha")
+    team_repo.add(team)
+    team_repo.add_member(TeamMember(person_id=person.id, team_id=team.id, role="Dev"))
+    client.current_session().expunge_all()
+
+    [loaded] = team_repo.get_all(load_profile="with_members")
+
+    assert [m.person.name for m in loaded.members] == ["Alice"]
+    assert [m.role.name for m in loaded.members] == ["Dev"]
+    assert "emails" in inspect(loaded.members[0].person).unloaded
+
+
+def test_unknown_profile_is_rejected(client):
+    repo = PostgresPersonRepository()
+    with pytest.raises(ValueError):
+        repo.list_page(load_profile="with_members")
+
+
+def test_initiative_projection_is_one_query(client):
+    type_repo = PostgresInitiativeTypeRepository()
+    repo = PostgresInitiativeRepository()
+    itype = InitiativeType(name="Research")
+    type_repo.add(itype)
+    for i in range(5):
+        type_id = itype.id if i % 2 else None
+        repo.add(Initiative(name=f"I{i}", initiative_type_id=type_id))
+    statements = []
+    event.listen(
+        client._engine, "before_cursor_execute", lambda *args: statements.append(args)
+    )
+
+    rows = repo.project(["id", "name", "initiative_type.name"], after_id=1, limit=3)
+
+    assert len(statements) == 1
+    assert rows == [
+        {"id": 2, "name": "I1", "initiative_type.name": "Research"},
+        {"id": 3, "name": "I2", "initiative_type.name": None},
+        {"id": 4, "name": "I3", "initiative_type.name": "Research"},
+    ]
+
+
+def test_projection_rejects_collections(client):
+    with pytest.raises(ValueError):
+        PostgresInitiativeRepository().project(["teams.name"])
+
+
+def test_org_unit_subtree_and_ancestry(client):
+    org = Organization(name="Horizon")
+    PostgresOrganizationRepository().add(org)
+    repo = PostgresOrganizationalUnitRepository()
+    units = {}
+    tree = [
+        ("Root", None),
+        ("Eng", "Root"),
+        ("Ops", "Root"),
+        ("Backend", "Eng"),
+        ("DB", "Backend"),
+    ]
+    for name, parent in tree:
+        unit = OrganizationalUnit(
+            name=name,
+            organization_id=org.id,
+            parent_id=units[parent].id if parent else None,
+        )
+        repo.add(unit)
+        units[name] = unit
+    ids = {name: unit.id for name, unit in units.items()}
+
+    subtree = repo.get_subtree(ids["Root"])
+    shallow = repo.get_subtree(ids["Root"], max_depth=1)
+    ancestry = repo.get_ancestry(ids["DB"])
+
+    assert [(n.entity.name, n.depth) for n in subtree] == [
+        ("Root", 0),
+        ("Eng", 1),
+        ("Ops", 1),
+        ("Backend", 2),
+        ("DB", 3),
+    ]
+    assert subtree[-1].path == [ids["Root"], ids["Eng"], ids["Backend"], ids["DB"]]
+    assert [n.entity.name for n in shallow] == ["Root", "Eng", "Ops"]
+    assert [n.entity.name for n in ancestry] == ["DB", "Backend", "Eng", "Root"]
+    assert ancestry[-1].path == [ids["DB"], ids["Backend"], ids["Eng"], ids["Root"]]
+    assert repo.get_subtree(999) == []
+
+
+def _closure_pairs(client):
+    from eo_lib.domain.entities import OrganizationalUnitClosure
+
+    session = client.get_session()
+    rows = session.query(OrganizationalUnitClosure).all()
+    pairs = {(r.ancestor_id, r.descendant_id, r.depth) for r in rows}
+    session.commit()
+    return pairs
+
+
+def test_org_unit_closure_follows_creates_moves_and_deletes(client):
+    from eo_lib.services import OrganizationalUnitService
+
+    org = Organization(name="Horizon")
+    PostgresOrganizationRepository().add(org)
+    repo = PostgresOrganizationalUnitRepository(closure=True)
+    service = OrganizationalUnitService(repo)
+    root = service.create_unit("Root", org.id)
+    eng = service.create_unit("Eng", org.id, parent_id=root.id)
+    ops = service.create_unit("Ops", org.id, parent_id=root.id)
+    backend = service.create_unit("Backend", org.id, parent_id=eng.id)
+
+    assert repo.is_within(backend.id, root.id)
+    assert not repo.is_within(backend.id, ops.id)
+
+    service.update_unit_details(eng.id, parent_id=ops.id)
+
+    assert repo.is_within(backend.id, ops.id)
+    assert (root.id, backend.id, 3) in _closure_pairs(client)
+    with pytest.raises(ValueError):
+        service.update_unit_details(ops.id, parent_id=backend.id)
+
+    service.delete(eng.id)
+
+    assert not repo.is_within(backend.id, root.id)
+    expected = {
+        (root.id, root.id, 0),
+        (ops.id, ops.id, 0),
+        (root.id, ops.id, 1),
+        (backend.id, backend.id, 0),
+    }
+    assert _closure_pairs(client) == expected
+    assert repo.rebuild_closure() == 4
+
+
+def test_org_unit_closure_writes_share_the_unit_session(client):
+    from eo_lib import unit_of_work
+
+    org = Organization(name="Horizon")
+    PostgresOrganizationRepository().add(org)
+    repo = PostgresOrganizationalUnitRepository(closure=True)
+    root = repo.add(OrganizationalUnit("Root", org.id))
+    other = repo.add(OrganizationalUnit("Other", org.id))
+    child = repo.add(OrganizationalUnit("Child", org.id, parent_id=root.id))
+
+    assert child.parent.name == "Root"
+    assert [c.name for c in root.children] == ["Child"]
+
+    child.parent_id = other.id
+    moved = repo.update(child)
+
+    assert moved is child
+    assert moved.parent.name == "Other"
+    assert not client.current_session().dirty
+    with pytest.raises(RuntimeError):
+        with unit_of_work():
+            repo.add(OrganizationalUnit("Lost", org.id, parent_id=root.id))
+            raise RuntimeError("abort")
+    assert (root.id, child.id, 1) not in _closure_pairs(client)
+    assert (other.id, child.id, 1) in _closure_pairs(client)
+    assert len(_closure_pairs(client)) == 4
+
+
+def test_org_unit_closure_rebuild(client):
+    org = Organization(name="Horizon")
+    PostgresOrganizationRepository().add(org)
+    plain = PostgresOrganizationalUnitRepository(closure=False)
+    root = OrganizationalUnit("Root", org.id)
+    plain.add(root)
+    child = OrganizationalUnit("Child", org.id, parent_id=root.id)
+    plain.add(child)
+    plain.add(OrganizationalUnit("Leaf", org.id, parent_id=child.id))
+
+    assert _closure_pairs(client) == set()
+    assert plain.is_within(3, root.id)
+
+    repo = PostgresOrganizationalUnitRepository(closure=True)
+    assert repo.rebuild_closure() == 6
+    assert (1, 3, 2) in _closure_pairs(client)
+    assert repo.is_within(3, 1) and not repo.is_within(1, 3)
+
+
+def test_initiative_rollups_in_one_query(client):
+    teams = PostgresTeamRepository()
+    alpha, beta = Team(name="Alpha"), Team(name="Beta")
+    teams.add(alpha)
+    teams.add(beta)
+    repo = PostgresInitiativeRepository()
+    program = Initiative(name="Program")
+    repo.add(program)
+    a = Initiative(name="A", parent_id=program.id)
+    a.teams.append(alpha)
+    repo.add(a)
+    b = Initiative(name="B", status="done", parent_id=a.id)
+    b.teams.append(beta)
+    b.teams.append(alpha)
+    repo.add(b)
+    leaf = Initiative(name="Leaf")
+    repo.add(leaf)
+
+    statements = []
+    event.listen(
+        client._engine, "before_cursor_execute", lambda *args: statements.append(args)
+    )
+
+    rollups = repo.get_rollups([program.id, a.id, leaf.id, 999])
+
+    assert len(statements) == 1
+    assert rollups[program.id].descendants == 2
+    assert rollups[program.id].by_status == {"active": 1, "done": 1}
+    assert rollups[program.id].team_ids == [alpha.id, beta.id]
+    assert rollups[a.id].by_status == {"done": 1}
+    assert rollups[leaf.id].descendants == 0
+    assert 999 not in rollups
+
+
+def test_team_member_batches(client):
+    persons = PostgresPersonRepository()
+    ids = persons.add_many({"name": f"P{i}"} for i in range(4))
+    repo = PostgresTeamRepository()
+    red, blue = Team(name="Red"), Team(name="Blue")
+    repo.add(red)
+    repo.add(blue)
+
+    member_ids = repo.add_members(
+        red.id,
+        [(ids[0], "Lead", None, None), (ids[1], "Dev", None, None)]
+        + [(person_id, "Dev", None, None) for person_id in ids[2:]],
+    )
+    moved = repo.move_members(red.id, blue.id, ids[:2])
+    removed = repo.remove_members([member_ids[3], 999])
+
+    assert len(member_ids) == 4 and moved == 2 and removed == 1
+    assert {m.person_id for m in repo.get_members(red.id)} == {ids[2]}
+    blue_members = repo.get_members(blue.id)
+    assert {m.role.name for m in blue_members} == {"Lead", "Dev"}
+    session = client.get_session()
+    assert session.query(Role).count() == 2
+    session.commit()
+
+
+def test_add_members_is_atomic(client):
+    repo = PostgresTeamRepository()
+    team = Team(name="Red")
+    repo.add(team)
+    person_id = PostgresPersonRepository().add_many([{"name": "Ann"}])[0]
+
+    with pytest.raises(Exception):
+        repo.add_members(
+            team.id, [(person_id, "Lead", None, None), (None, None, None, None)]
+        )
+
+    assert repo.get_members(team.id) == []
+
+
+def test_known_roles_are_never_inserted_again(client):
+    ann, bob = PostgresPersonRepository().add_many([{"name": "Ann"}, {"name": "Bob"}])
+    repo = PostgresTeamRepository()
+    team = Team(name="Red")
+    repo.add(team)
+    repo.add_member(TeamMember(person_id=ann, team_id=team.id, role="Dev"))
+    statements = []
+    event.listen(
+        client._engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    member = repo.add_member(TeamMember(person_id=bob, team_id=team.id, role="Dev"))
+    repo.add_members(team.id, [(ann, "Dev", None, None), (bob, "Lead", None, None)])
+
+    assert member.role.name == "Dev"
+    assert sum("INSERT INTO roles" in s for s in statements) == 1
+    assert sum("FROM roles" in s for s in statements) == 2
+    session = client.get_session()
+    assert session.query(Role).count() == 2
+    session.commit()
+
+
+def test_rolled_back_roles_are_not_cached(client):
+    ann = PostgresPersonRepository().add_many([{"name": "Ann"}])[0]
+    repo = PostgresTeamRepository()
+    team = Team(name="Red")
+    repo.add(team)
+
+    with pytest.raises(RuntimeError):
+        with client.session_scope():
+            repo.add_member(TeamMember(person_id=ann, team_id=team.id, role="Dev"))
+            raise RuntimeError("abort")
+    member = repo.add_member(TeamMember(person_id=ann, team_id=team.id, role="Dev"))
+
+    assert member.role.name == "Dev"
+
+
+def _person(identification_id, name, emails=None, birthday=None):
+    return {
+        "identification_id": identification_id,
+        "name": name,
+        "birthday": birthday,
+        "emails": emails,
+    }
+
+
+def test_person_upsert_counts_and_moves_emails(client):
+    repo = PostgresPersonRepository()
+    repo.add_many(
+        [
+            {"name": "Ann", "identification_id": "A", "emails": ["a@x.com"]},
+            {"name": "Bob", "identification_id": "B", "emails": ["b@x.com"]},
+            {"name": "Cy", "identification_id": "C"},
+        ]
+    )
+
+    result = repo.upsert_many(
+        [
+            _person("A", "Ann"),
+            _person("B", "Bob", emails=["b@x.com", "a@x.com"]),
+            _person("C", "Cyrus"),
+            _person("D", "Dee", emails=["d@x.com"]),
+        ],
+        chunk_size=3,
+    )
+
+    assert result == (1, 2, 1)
+    persons = {p.identification_id: p for p in repo.get_all()}
+    assert persons["A"].emails == []
+    assert sorted(e.email for e in persons["B"].emails) == ["a@x.com", "b@x.com"]
+    assert persons["C"].name == "Cyrus"
+    assert [e.email for e in persons["D"].emails] == ["d@x.com"]
+    assert repo.upsert_many([_person("D", "Dee", emails=["d@x.com"])]) == (0, 0, 1)
+
+
+def test_update_details_writes_only_changed_emails(client):
+    repo = PostgresPersonRepository()
+    (ann,) = repo.add_many([{"name": "Ann", "emails": ["a@x.com", "old@x.com"]}])
+    statements = []
+    event.listen(
+        client._engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    PersonService(repo).update_details(ann, emails=["a@x.com", "new@x.com"])
+
+    assert sum(s.startswith("DELETE FROM person_emails") for s in statements) == 1
+    assert sum(s.startswith("INSERT INTO person_emails") for s in statements) == 1
+    emails = sorted(e.email for e in repo.get_by_id(ann).emails)
+    assert emails == ["a@x.com", "new@x.com"]
+
+
+def test_set_emails_many_moves_addresses(client):
+    repo = PostgresPersonRepository()
+    ann, bob = repo.add_many(
+        [{"name": "Ann", "emails": ["a@x.com"]}, {"name": "Bob", "emails": ["b@x.com"]}]
+    )
+
+    loaded = repo.get_by_id(ann)
+
+    assert repo.set_emails_many({ann: ["a@x.com"], bob: ["a@x.com", "b@x.com"]}) == 1
+    assert loaded.emails == []
+    assert sorted(e.email for e in repo.get_by_id(bob).emails) == ["a@x.com", "b@x.com"]
+    with pytest.raises(ValueError, match="Person 99 not found"):
+        repo.set_emails_many({ann: ["c@x.com"], 99: []})
+    assert repo.get_by_id(ann).emails == []
+
+
+def test_get_by_emails_is_one_case_insensitive_query(client):
+    repo = PostgresPersonRepository()
+    repo.add_many(
+        {"name": f"P{i}", "emails": [f"P{i}@X.com", f"p{i}.alt@x.com"]}
+        for i in range(50)
+    )
+    statements = []
+    event.listen(
+        client._engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    found = PersonService(repo).get_by_emails(
+        [f"p{i}@x.com" for i in range(60)] + [" P3.ALT@x.com "]
+    )
+
+    assert len(statements) == 1
+    assert len(found) == 51
+    assert found["p7@x.com"].name == "P7"
+    assert found["p3.alt@x.com"] is found["p3@x.com"]
+    assert len(found["p3@x.com"].emails) == 2
+
+
+@pytest.mark.parametrize(
+    "where, order_by, limit, offset",
+    [
+        ({"organization_id": 1}, "-name", None, 0),
+        ({"organization_id": In([1, None])}, ["organization_id", "-id"], 2, 1),
+        ({"short_name": None}, "id", None, 0),
+        ({"name": Range(gt="B", le="D")}, "-short_name", 5, 0),
+        ({"id": In([])}, "id", None, 0),
+    ],
+)
+def test_find_matches_the_in_memory_query(client, where, order_by, limit, offset):
+    sql = PostgresTeamRepository()
+    memory = InMemoryTeamRepository()
+    for name, short_name, organization_id in [
+        ("A", "a", 1),
+        ("B", None, 1),
+        ("C", "c", None),
+        ("D", "a", 2),
+        ("E", None, 1),
+    ]:
+        for repo in (sql, memory):
+            repo.add(
+                Team(name=name, short_name=short_name, organization_id=organization_id)
+            )
+
+    expected = memory.find(where, order_by, limit, offset)
+
+    assert [t.name for t in sql.find(where, order_by, limit, offset)] == [
+        t.name for t in expected
+    ]
+
+
+def test_team_upsert_by_name(client):
+    repo = PostgresTeamRepository()
+    repo.add(Team(name="Red", description="old"))
+    row = {"short_name": None, "organization_id": None}
+
+    result = repo.upsert_many(
+        [
+            {"name": "Red", "description": "new", **row},
+            {"name": "Blue", "description": None, **row},
+        ]
+    )
+
+    assert result == (1, 1, 0)
+    assert {t.name: t.description for t in repo.get_all()} == {
+        "Red": "new",
+        "Blue": None,
+    }
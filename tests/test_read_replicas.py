@@ -0,0 +1,108 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+from eo_lib import unit_of_work
+from eo_lib.config import Config
+from eo_lib.domain.base import Base
+from eo_lib.domain.entities import Person
+from eo_lib.infrastructure.database.postgres_client import PostgresClient
+from eo_lib.infrastructure.database.replicas import ReplicaRouter
+from eo_lib.infrastructure.repositories import PostgresPersonRepository
+from eo_lib.services import PersonService
+
+
+def _database(path, name):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO persons (id, name) VALUES (1, :n)"), {"n": name})
+    engine.dispose()
+    return f"sqlite:///{path}"
+
+
+@pytest.fixture
+def routed(tmp_path, monkeypatch):
+    primary = _database(tmp_path / "primary.db", "primary")
+    replicas = [_database(tmp_path / f"replica{i}.db", f"replica{i}") for i in (1, 2)]
+    monkeypatch.setattr(Config, "DATABASE_URL", primary)
+    monkeypatch.setattr(Config, "DATABASE_REPLICA_URLS", ",".join(replicas))
+    monkeypatch.setattr(Config, "STORAGE_TYPE", "db")
+    monkeypatch.setattr(PostgresClient, "_instance", None)
+    client = PostgresClient()
+    yield client
+    client._SessionLocal.remove()
+    client._ReadSessionLocal.remove()
+
+
+def _read_name(repo, client):
+    client.current_session().expunge_all()
+    return repo.get_by_id(1).name
+
+
+def test_reads_rotate_over_replicas(routed):
+    repo = PostgresPersonRepository()
+    names = [_read_name(repo, routed) for _ in range(4)]
+    assert names == ["replica1", "replica2", "replica1", "replica2"]
+
+
+def test_writes_and_unit_of_work_reads_use_primary(routed):
+    repo = PostgresPersonRepository()
+    with unit_of_work():
+        repo.add(Person(name="new"))
+        assert [p.name for p in repo.get_all()] == ["primary", "new"]
+
+
+def test_replica_objects_stay_out_of_the_writer_session(routed):
+    repo = PostgresPersonRepository()
+
+    person = repo.get_by_id(1)
+
+    assert person.name == "replica1"
+    assert person not in routed.get_session()
+    assert len(routed.get_session().identity_map) == 0
+
+
+def test_read_modify_write_reads_the_primary(routed):
+    repo = PostgresPersonRepository()
+    repo.get_by_id(1)
+
+    person = PersonService(repo).update_details(1, identification_id="X1")
+
+    assert person.name == "primary"
+    with routed._engine.connect() as conn:
+        row = conn.execute(text("SELECT name, identification_id FROM persons")).one()
+    assert tuple(row) == ("primary", "X1")
+
+
+def test_failed_replica_is_skipped(routed, tmp_path):
+    broken = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    healthy = routed._replicas.engines[0]
+    routed._replicas = ReplicaRouter([broken, healthy], retry_interval=60)
+    repo = PostgresPersonRepository()
+
+    assert _read_name(repo, routed) == "primary"
+    assert [s["healthy"] for s in routed.get_replica_status()] == [False, True]
+    assert _read_name(repo, routed) == "replica1"
+    assert _read_name(repo, routed) == "replica1"
+
+
+def test_failed_read_ends_the_replica_transaction(routed):
+    def bad_read():
+        routed.current_session().execute(text("SELECT 1"))
+        raise exc.DataError("SELECT", {}, ValueError("bad parameter"))
+
+    with pytest.raises(exc.DataError):
+        routed.run_read(bad_read)
+
+    assert not routed._ReadSessionLocal().in_transaction()
+    assert all(s["healthy"] for s in routed.get_replica_status())
+    assert _read_name(PostgresPersonRepository(), routed) == "replica2"
+
+
+def test_replica_is_probed_before_rejoining(routed):
+    router = routed._replicas
+    replica = router.engines[0]
+    router._retry_interval = 0
+    router.mark_down(replica)
+
+    assert router.choose() is replica
+    assert all(s["healthy"] for s in router.status())
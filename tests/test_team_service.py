@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 from datetime import date
 from eo_lib.services import TeamService
 from eo_lib.domain.entities import Team, TeamMember
+from eo_lib.domain.query import UNSET
 
 
 @pytest.fixture
@@ -90,3 +91,33 @@ def test_remove_member(service, mock_repo):
 def test_get_members(service, mock_repo):
     mock_repo.get_members.return_value = []
     assert service.get_members(1) == []
+
+
+def test_list_page(service, mock_repo):
+    page = [Team(name="A", id=3)]
+    mock_repo.list_page.return_value = page
+
+    assert service.list_page(after_id=2, limit=1, order_by="name") == page
+    mock_repo.list_page.assert_called_with(
+        after_id=2, limit=1, order_by="name", load_profile=None, after_value=UNSET
+    )
+
+
+def test_add_members_pads_tuples(service, mock_repo):
+    mock_repo.add_members.return_value = [1, 2]
+    start = date(2024, 1, 1)
+
+    ids = service.add_members(1, [(10,), (11, "Lead", start)])
+
+    assert ids == [1, 2]
+    mock_repo.add_members.assert_called_once_with(
+        1, [(10, None, None, None), (11, "Lead", start, None)]
+    )
+    with pytest.raises(ValueError):
+        service.add_members(1, [()])
+
+
+def test_move_members(service, mock_repo):
+    mock_repo.move_members.return_value = 2
+    assert service.move_members(1, 2, iter([10, 11])) == 2
+    mock_repo.move_members.assert_called_once_with(1, 2, [10, 11])
@@ -0,0 +1,151 @@
+import threading
+import pytest
+from sqlalchemy import delete, event
+from eo_lib import unit_of_work
+from eo_lib.config import Config
+from eo_lib.domain.entities import InitiativeType, Person, Team, TeamMember
+from eo_lib.infrastructure.repositories import (
+    PostgresPersonRepository,
+    PostgresTeamRepository,
+)
+
+
+def test_repositories_share_scope_session(client):
+    person_repo = PostgresPersonRepository()
+    team_repo = PostgresTeamRepository()
+
+    with unit_of_work() as session:
+        assert person_repo._session is session
+        assert team_repo._session is session
+
+    assert person_repo._session is not session
+
+
+def test_nested_scopes_reuse_session(client):
+    with unit_of_work() as outer:
+        with unit_of_work() as inner:
+            assert inner is outer
+
+
+def test_threads_resolve_separate_sessions(client):
+    repo = PostgresPersonRepository()
+    seen = []
+
+    def worker():
+        seen.append(repo._session)
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert seen[0] is not seen[1]
+
+
+def test_scope_persists_and_releases_identity_map(client):
+    repo = PostgresPersonRepository()
+
+    with unit_of_work() as session:
+        person = Person(name="Alice", emails=["alice@example.com"])
+        repo.add(person)
+        assert person in session
+
+    assert person not in session
+    assert [p.name for p in repo.get_all()] == ["Alice"]
+
+
+def test_scope_commits_once(client):
+    person_repo = PostgresPersonRepository()
+    team_repo = PostgresTeamRepository()
+    commits = []
+    event.listen(client._engine, "commit", lambda conn: commits.append(conn))
+
+    with unit_of_work():
+        team = Team(name="Alpha")
+        team_repo.add(team)
+        for i in range(5):
+            person = Person(name=f"P{i}", emails=[f"p{i}@example.com"])
+            person_repo.add(person)
+            team_repo.add_member(TeamMember(person_id=person.id, team_id=team.id))
+
+    assert len(commits) == 1
+    assert len(team_repo.get_members(team.id)) == 5
+
+
+def test_scope_rolls_back_whole_batch(client):
+    repo = PostgresPersonRepository()
+
+    with pytest.raises(ValueError):
+        with unit_of_work():
+            repo.add(Person(name="Alice"))
+            repo.add(Person(name="Bob"))
+            raise ValueError("boom")
+
+    assert repo.get_all() == []
+
+
+def test_swallowed_failure_prevents_commit(client):
+    repo = PostgresPersonRepository()
+
+    with pytest.raises(RuntimeError):
+        with unit_of_work():
+            repo.add(Person(name="Alice", identification_id="X1"))
+            try:
+                repo.add(Person(name="Bob", identification_id="X1"))
+            except Exception:
+                pass
+
+    assert repo.get_all() == []
+
+
+def test_memory_storage_yields_no_session(monkeypatch):
+    monkeypatch.setattr(Config, "STORAGE_TYPE", "memory")
+    with unit_of_work() as session:
+        assert session is None
+
+
+def test_initiative_types_are_cached_only_once_committed(client):
+    from eo_lib.infrastructure.repositories import PostgresInitiativeTypeRepository
+    from eo_lib.infrastructure.repositories.initiative_type_cache import (
+        CachedInitiativeTypeRepository,
+    )
+
+    repo = CachedInitiativeTypeRepository(PostgresInitiativeTypeRepository())
+    with pytest.raises(RuntimeError):
+        with unit_of_work():
+            repo.add(InitiativeType(name="Research"))
+            assert repo.get_by_name("Research") is not None
+            raise RuntimeError("abort")
+
+    assert repo.get_by_name("Research") is None
+    with unit_of_work():
+        repo.add(InitiativeType(name="Research"))
+    client.current_session().execute(delete(InitiativeType))
+    client.current_session().commit()
+    assert repo.get_by_name("Research") is not None
+
+
+def test_bulk_creation_reads_initiative_types_once(client):
+    from eo_lib.factories import ServiceFactory
+
+    ServiceFactory.create_initiative_service().create_initiative_type("Research")
+    service = ServiceFactory.create_initiative_service()
+    statements = []
+    event.listen(
+        client._engine,
+        "before_cursor_execute",
+        lambda conn, cursor, sql, *args: statements.append(sql),
+    )
+
+    with unit_of_work():
+        for i in range(5):
+            service.create_initiative_with_details(
+                f"I{i}", initiative_type_name="Research"
+            )
+
+    type_reads = [
+        sql for sql in statements if sql.startswith("SELECT initiative_types.")
+    ]
+    assert len(type_reads) == 1
+    assert len(service.get_all()) == 5